@@ -0,0 +1,115 @@
+"""Benchmark checkpoint store save/load/delete latency with many checkpoints on disk.
+
+Each checkpoint holds a realistic ``data_code`` record. The store is first
+filled with ``--checkpoints`` entries, then ``--operations`` save/load/delete
+calls are timed; lazy GC runs inside every call, so this tracks how the cost
+of an operation grows with the number of stored checkpoints.
+
+Usage:
+    python scripts/benchmark_checkpoint_store.py --store file --checkpoints 300 --series 200
+    python scripts/benchmark_checkpoint_store.py --store sqlite --checkpoints 300 --series 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from boj_api_client.core.checkpoint_store import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SqliteCheckpointStore,
+)
+from boj_api_client.timeseries.checkpoint_models import DataCodeCheckpointState
+from boj_api_client.timeseries.models import TimeSeries, TimeSeriesPoint, make_success_envelope
+from boj_api_client.timeseries.queries import DataCodeQuery
+
+
+def _record(series_count: int, points: int) -> dict[str, object]:
+    codes = [f"S{i:05d}" for i in range(series_count)]
+    by_code = {
+        code: TimeSeries(
+            series_code=code,
+            name=code,
+            unit="u",
+            frequency="MONTHLY",
+            category="c",
+            last_update="20260101",
+            points=tuple(
+                TimeSeriesPoint(survey_date=str(200001 + idx), value=float(idx)) for idx in range(points)
+            ),
+        )
+        for code in codes
+    }
+    return DataCodeCheckpointState(
+        query=DataCodeQuery(db="CO", code=codes),
+        config_snapshot={},
+        by_code=by_code,
+        last_envelope=make_success_envelope(),
+        chunk_index=0,
+        start_position=1,
+    ).to_record()
+
+
+def _build_store(kind: str, directory: Path) -> CheckpointStore:
+    if kind == "memory":
+        return MemoryCheckpointStore()
+    if kind == "file":
+        return FileCheckpointStore(base_dir=directory)
+    if kind == "sqlite":
+        return SqliteCheckpointStore(path=directory / "checkpoints.db")
+    raise SystemExit(f"unknown store: {kind}")
+
+
+def _time_ms(call: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    call()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--store", choices=("memory", "file", "sqlite"), default="file")
+    parser.add_argument("--checkpoints", type=int, default=300)
+    parser.add_argument("--series", type=int, default=200)
+    parser.add_argument("--points", type=int, default=120)
+    parser.add_argument("--operations", type=int, default=20)
+    args = parser.parse_args()
+
+    record = _record(args.series, args.points)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _build_store(args.store, Path(tmp))
+        started = time.perf_counter()
+        for _ in range(args.checkpoints):
+            store.save(record)
+        fill_seconds = time.perf_counter() - started
+
+        saved: list[str] = []
+        save_ms = [_time_ms(lambda: saved.append(store.save(record))) for _ in range(args.operations)]
+        load_ms = [_time_ms(lambda: store.load(checkpoint_id)) for checkpoint_id in saved]
+        delete_ms = [_time_ms(lambda: store.delete(checkpoint_id)) for checkpoint_id in saved]
+
+    print(
+        f"store={args.store} checkpoints={args.checkpoints} series={args.series} "
+        f"points={args.points} fill={fill_seconds:.2f}s"
+    )
+    for label, samples in (("save", save_ms), ("load", load_ms), ("delete", delete_ms)):
+        print(
+            f"  {label:<6} median={statistics.median(samples):8.2f}ms "
+            f"max={max(samples):8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
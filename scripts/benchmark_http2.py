@@ -0,0 +1,204 @@
+"""Benchmark AsyncTransport over HTTP/1.1 vs HTTP/2 against a local TLS server.
+
+Requires the ``http2`` extra (``pip install 'boj-api-client[http2]'``) and the
+``openssl`` command for a throwaway self-signed certificate.
+
+Usage:
+    python scripts/benchmark_http2.py --requests 200 --concurrency 32 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+
+from boj_api_client.config import BojClientConfig, ThrottlingConfig, TransportConfig
+from boj_api_client.core.async_transport import AsyncTransport
+from boj_api_client.core.transport_shared import build_http_client_options
+
+_BODY = json.dumps(
+    {
+        "STATUS": 200,
+        "MESSAGEID": "M181000I",
+        "MESSAGE": "OK",
+        "DATE": "2026-01-01T00:00:00+09:00",
+        "RESULTSET": [],
+    }
+).encode("utf-8")
+
+
+class _BenchServer:
+    def __init__(self, *, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        ssl_object = writer.get_extra_info("ssl_object")
+        protocol = ssl_object.selected_alpn_protocol() if ssl_object is not None else None
+        try:
+            if protocol == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_http11(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http11(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                return
+            await asyncio.sleep(self.latency_seconds)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                + f"content-length: {len(_BODY)}\r\n\r\n".encode("ascii")
+                + _BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        lock = asyncio.Lock()
+        pending: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency_seconds)
+            async with lock:
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(_BODY))),
+                    ],
+                )
+                conn.send_data(stream_id, _BODY, end_stream=True)
+                writer.write(conn.data_to_send())
+                await writer.drain()
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            async with lock:
+                events = conn.receive_data(data)
+                writer.write(conn.data_to_send())
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+
+
+def _make_certificate(directory: Path) -> tuple[Path, Path]:
+    cert = directory / "cert.pem"
+    key = directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key), "-out", str(cert), "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+async def _run_case(
+    *,
+    http2: bool,
+    port: int,
+    cert: Path,
+    server: _BenchServer,
+    requests: int,
+    concurrency: int,
+) -> tuple[float, int]:
+    config = BojClientConfig(
+        base_url=f"https://127.0.0.1:{port}/api/v1/",
+        throttling=ThrottlingConfig(min_wait_interval_seconds=0.0),
+        transport=TransportConfig(http2=http2, max_connections=concurrency),
+    )
+    config.validate()
+    # Same builders as AsyncTransport, plus trust for the throwaway certificate.
+    client = httpx.AsyncClient(
+        **build_http_client_options(config),
+        verify=ssl.create_default_context(cafile=str(cert)),
+    )
+    transport = AsyncTransport(config, client=client)
+    semaphore = asyncio.Semaphore(concurrency)
+    server.connections = 0
+
+    async def one() -> None:
+        async with semaphore:
+            await transport.request("/getMetadata", params={"db": "FM08"})
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one() for _ in range(requests)))
+    finally:
+        await client.aclose()
+    return time.perf_counter() - started, server.connections
+
+
+async def _main(args: argparse.Namespace) -> None:
+    server = _BenchServer(latency_seconds=args.latency_ms / 1000.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _make_certificate(Path(tmp))
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(cert, key)
+        ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0, ssl=ssl_context)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            for http2 in (False, True):
+                elapsed, connections = await _run_case(
+                    http2=http2,
+                    port=port,
+                    cert=cert,
+                    server=server,
+                    requests=args.requests,
+                    concurrency=args.concurrency,
+                )
+                label = "HTTP/2  " if http2 else "HTTP/1.1"
+                print(
+                    f"{label} requests={args.requests} concurrency={args.concurrency} "
+                    f"elapsed={elapsed:.3f}s rps={args.requests / elapsed:.1f} "
+                    f"connections={connections}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,21 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from types import TracebackType
 
-from .client_shared import resolve_checkpoint_store, validate_client_config
+from .client_shared import (
+    build_checkpoint_policy,
+    build_series_cache,
+    optional_call_options,
+    resolve_checkpoint_store,
+    validate_client_config,
+)
 from .config import BojClientConfig
+from .core.async_checkpoint_store import AsyncCheckpointStore
 from .core.checkpoint_store import CheckpointStore
 from .core.async_transport import AsyncTransport
 from .core.errors import BojClientClosedError
 from .timeseries.async_orchestrator import AsyncTimeSeriesService
 from .timeseries.async_strict import AsyncStrictTimeSeriesService
+from .timeseries.checkpoint_policy import CheckpointCallback
 from .timeseries.models import DataCodeResponse, DataLayerResponse, MetadataResponse
 from .timeseries.queries import DataCodeQuery, DataLayerQuery, MetadataQuery
 
@@ -28,33 +36,63 @@ class _GuardedAsyncTimeSeriesService:
         query: DataCodeQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataCodeResponse:
         self._owner._ensure_open()
-        return await self._delegate.get_data_code(query, checkpoint_id=checkpoint_id)
+        return await self._delegate.get_data_code(
+            query,
+            checkpoint_id=checkpoint_id,
+            **optional_call_options(deadline=deadline, on_checkpoint=on_checkpoint),
+        )
 
     async def get_data_layer(
         self,
         query: DataLayerQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataLayerResponse:
         self._owner._ensure_open()
-        return await self._delegate.get_data_layer(query, checkpoint_id=checkpoint_id)
+        return await self._delegate.get_data_layer(
+            query,
+            checkpoint_id=checkpoint_id,
+            **optional_call_options(deadline=deadline, on_checkpoint=on_checkpoint),
+        )
 
     async def get_metadata(self, query: MetadataQuery) -> MetadataResponse:
         self._owner._ensure_open()
         return await self._delegate.get_metadata(query)
 
-    def iter_data_code(self, query: DataCodeQuery) -> AsyncIterator[DataCodeResponse]:
+    def iter_data_code(
+        self,
+        query: DataCodeQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> AsyncIterator[DataCodeResponse]:
         self._owner._ensure_open()
-        return self._iter_data_code_guarded(query)
+        return self._iter_data_code_guarded(query, resume_from=resume_from)
 
-    def iter_data_layer(self, query: DataLayerQuery) -> AsyncIterator[DataLayerResponse]:
+    def iter_data_layer(
+        self,
+        query: DataLayerQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> AsyncIterator[DataLayerResponse]:
         self._owner._ensure_open()
-        return self._iter_data_layer_guarded(query)
+        return self._iter_data_layer_guarded(query, resume_from=resume_from)
 
-    async def _iter_data_code_guarded(self, query: DataCodeQuery) -> AsyncIterator[DataCodeResponse]:
-        iterator = self._delegate.iter_data_code(query).__aiter__()
+    async def _iter_data_code_guarded(
+        self,
+        query: DataCodeQuery,
+        *,
+        resume_from: str | None,
+    ) -> AsyncIterator[DataCodeResponse]:
+        iterator = self._delegate.iter_data_code(
+            query,
+            **optional_call_options(resume_from=resume_from),
+        ).__aiter__()
         try:
             while True:
                 self._owner._ensure_open()
@@ -70,8 +108,13 @@ class _GuardedAsyncTimeSeriesService:
     async def _iter_data_layer_guarded(
         self,
         query: DataLayerQuery,
+        *,
+        resume_from: str | None,
     ) -> AsyncIterator[DataLayerResponse]:
-        iterator = self._delegate.iter_data_layer(query).__aiter__()
+        iterator = self._delegate.iter_data_layer(
+            query,
+            **optional_call_options(resume_from=resume_from),
+        ).__aiter__()
         try:
             while True:
                 self._owner._ensure_open()
@@ -93,7 +136,7 @@ class AsyncBojClient:
         *,
         config: BojClientConfig | None = None,
         transport: AsyncTransport | None = None,
-        checkpoint_store: CheckpointStore | None = None,
+        checkpoint_store: CheckpointStore | AsyncCheckpointStore | None = None,
         strict_service: AsyncStrictTimeSeriesService | None = None,
         timeseries_service: AsyncTimeSeriesService | None = None,
     ) -> None:
@@ -111,6 +154,15 @@ class AsyncBojClient:
             enable_layer_auto_partition=self._config.timeseries.enable_layer_auto_partition,
             checkpoint_store=resolved_checkpoint_store,
             config_snapshot=self._config.to_checkpoint_snapshot(),
+            data_code_date_windows=self._config.timeseries.data_code_date_windows,
+            data_code_window_frequency=self._config.timeseries.data_code_window_frequency,
+            max_concurrent_requests=self._config.timeseries.max_concurrent_requests,
+            prefetch_depth=self._config.timeseries.prefetch_depth,
+            offload_parse_min_values=self._config.timeseries.offload_parse_min_values,
+            job_retry_budget=self._config.retry.job_retry_budget,
+            series_cache=build_series_cache(self._config),
+            checkpoint_policy=build_checkpoint_policy(self._config),
+            checkpoint_compression=self._config.checkpoint.compression,
         )
         self._closed = False
         self.timeseries = _GuardedAsyncTimeSeriesService(self, internal_timeseries)
@@ -5,11 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterator
 from types import TracebackType
 
-from .client_shared import resolve_checkpoint_store, validate_client_config
+from .client_shared import (
+    build_checkpoint_policy,
+    build_series_cache,
+    optional_call_options,
+    resolve_checkpoint_store,
+    validate_client_config,
+)
 from .config import BojClientConfig
 from .core.checkpoint_store import CheckpointStore
 from .core.errors import BojClientClosedError
 from .core.transport import SyncTransport
+from .timeseries.checkpoint_policy import CheckpointCallback
 from .timeseries.models import DataCodeResponse, DataLayerResponse, MetadataResponse
 from .timeseries.orchestrator import TimeSeriesService
 from .timeseries.queries import DataCodeQuery, DataLayerQuery, MetadataQuery
@@ -28,25 +35,44 @@ class _GuardedTimeSeriesService:
         query: DataCodeQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataCodeResponse:
         self._owner._ensure_open()
-        return self._delegate.get_data_code(query, checkpoint_id=checkpoint_id)
+        return self._delegate.get_data_code(
+            query,
+            checkpoint_id=checkpoint_id,
+            **optional_call_options(deadline=deadline, on_checkpoint=on_checkpoint),
+        )
 
     def get_data_layer(
         self,
         query: DataLayerQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataLayerResponse:
         self._owner._ensure_open()
-        return self._delegate.get_data_layer(query, checkpoint_id=checkpoint_id)
+        return self._delegate.get_data_layer(
+            query,
+            checkpoint_id=checkpoint_id,
+            **optional_call_options(deadline=deadline, on_checkpoint=on_checkpoint),
+        )
 
     def get_metadata(self, query: MetadataQuery) -> MetadataResponse:
         self._owner._ensure_open()
         return self._delegate.get_metadata(query)
 
-    def iter_data_code(self, query: DataCodeQuery) -> Iterator[DataCodeResponse]:
-        iterator = iter(self._delegate.iter_data_code(query))
+    def iter_data_code(
+        self,
+        query: DataCodeQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> Iterator[DataCodeResponse]:
+        iterator = iter(
+            self._delegate.iter_data_code(query, **optional_call_options(resume_from=resume_from))
+        )
         while True:
             self._owner._ensure_open()
             try:
@@ -56,8 +82,15 @@ class _GuardedTimeSeriesService:
             self._owner._ensure_open()
             yield page
 
-    def iter_data_layer(self, query: DataLayerQuery) -> Iterator[DataLayerResponse]:
-        iterator = iter(self._delegate.iter_data_layer(query))
+    def iter_data_layer(
+        self,
+        query: DataLayerQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> Iterator[DataLayerResponse]:
+        iterator = iter(
+            self._delegate.iter_data_layer(query, **optional_call_options(resume_from=resume_from))
+        )
         while True:
             self._owner._ensure_open()
             try:
@@ -94,6 +127,15 @@ class BojClient:
             enable_layer_auto_partition=self._config.timeseries.enable_layer_auto_partition,
             checkpoint_store=resolved_checkpoint_store,
             config_snapshot=self._config.to_checkpoint_snapshot(),
+            data_code_date_windows=self._config.timeseries.data_code_date_windows,
+            data_code_window_frequency=self._config.timeseries.data_code_window_frequency,
+            max_concurrent_requests=self._config.timeseries.max_concurrent_requests,
+            prefetch_depth=self._config.timeseries.prefetch_depth,
+            offload_parse_min_values=self._config.timeseries.offload_parse_min_values,
+            job_retry_budget=self._config.retry.job_retry_budget,
+            series_cache=build_series_cache(self._config),
+            checkpoint_policy=build_checkpoint_policy(self._config),
+            checkpoint_compression=self._config.checkpoint.compression,
         )
         self._closed = False
         self.timeseries = _GuardedTimeSeriesService(self, internal_timeseries)
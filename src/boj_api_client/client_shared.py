@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Any, TypeVar
+
 from .config import BojClientConfig
+from .core.async_checkpoint_store import AsyncCheckpointStore
 from .core.checkpoint_store import CheckpointStore, MemoryCheckpointStore
 from .core.errors import BojValidationError
+from .timeseries.checkpoint_policy import CheckpointPolicy
+from .timeseries.series_cache import DiskSeriesCache, MemorySeriesCache, TieredSeriesCache
+
+_StoreT = TypeVar("_StoreT", bound="CheckpointStore | AsyncCheckpointStore")
 
 
 def validate_client_config(config: BojClientConfig) -> None:
@@ -17,8 +24,8 @@ def validate_client_config(config: BojClientConfig) -> None:
 def resolve_checkpoint_store(
     *,
     config: BojClientConfig,
-    checkpoint_store: CheckpointStore | None,
-) -> CheckpointStore | None:
+    checkpoint_store: _StoreT | None,
+) -> _StoreT | MemoryCheckpointStore | None:
     if checkpoint_store is not None:
         return checkpoint_store
     if config.checkpoint.enabled:
@@ -26,7 +33,46 @@ def resolve_checkpoint_store(
     return None
 
 
+def build_checkpoint_policy(config: BojClientConfig) -> CheckpointPolicy | None:
+    checkpoint = config.checkpoint
+    policy = CheckpointPolicy(
+        every_pages=checkpoint.save_every_pages,
+        every_chunks=checkpoint.save_every_chunks,
+        every_seconds=checkpoint.save_every_seconds,
+    )
+    return policy if policy.enabled else None
+
+
+def optional_call_options(**options: Any) -> dict[str, Any]:
+    """Drop unset keyword options so injected services that predate them keep working."""
+
+    return {name: value for name, value in options.items() if value is not None}
+
+
+def build_series_cache(config: BojClientConfig) -> TieredSeriesCache | None:
+    cache = config.cache
+    memory = None
+    disk = None
+    if cache.series_memory_max_bytes is not None:
+        memory = MemorySeriesCache(
+            max_bytes=cache.series_memory_max_bytes,
+            ttl_seconds=cache.series_ttl_seconds,
+        )
+    if cache.series_disk_directory is not None:
+        disk = DiskSeriesCache(
+            directory=cache.series_disk_directory,
+            ttl_seconds=cache.series_ttl_seconds,
+            max_bytes=cache.series_disk_max_bytes,
+        )
+    if memory is None and disk is None:
+        return None
+    return TieredSeriesCache(memory=memory, disk=disk)
+
+
 __all__ = [
+    "build_checkpoint_policy",
+    "build_series_cache",
+    "optional_call_options",
     "validate_client_config",
     "resolve_checkpoint_store",
 ]
@@ -5,6 +5,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from .core.checkpoint_store import DEFAULT_CHECKPOINT_TTL_SECONDS
+from .timeseries.checkpoint_codec import CHECKPOINT_COMPRESSIONS, DEFAULT_CHECKPOINT_COMPRESSION
+from .timeseries.planner import DATE_WINDOW_FREQUENCIES
+
+
+def _validate_optional_non_negative_int(value: object, *, name: str) -> None:
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{name} must be None or int >= 0")
 
 
 @dataclass(slots=True, frozen=True)
@@ -15,6 +24,17 @@ class TransportConfig:
     timeout_read_seconds: float = 30.0
     timeout_write_seconds: float = 30.0
     timeout_pool_seconds: float = 5.0
+    offload_json_min_bytes: int | None = None
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 5.0
+    share_connection_pool: bool = False
+    circuit_breaker_failure_threshold: int | None = None
+    circuit_breaker_recovery_seconds: float = 30.0
+    hedge_percentile: float | None = None
+    hedge_min_samples: int = 20
+    hedge_endpoints: tuple[str, ...] = ("getDataCode",)
 
     def validate(self) -> None:
         for field_name in (
@@ -22,9 +42,65 @@ class TransportConfig:
             "timeout_read_seconds",
             "timeout_write_seconds",
             "timeout_pool_seconds",
+            "keepalive_expiry_seconds",
         ):
             if getattr(self, field_name) <= 0:
                 raise ValueError(f"transport.{field_name} must be > 0")
+        _validate_optional_non_negative_int(
+            self.offload_json_min_bytes,
+            name="transport.offload_json_min_bytes",
+        )
+        for field_name in ("http2", "share_connection_pool"):
+            if not isinstance(getattr(self, field_name), bool):
+                raise ValueError(f"transport.{field_name} must be bool")
+        for field_name in ("max_connections", "max_keepalive_connections"):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"transport.{field_name} must be int >= 1")
+        threshold = self.circuit_breaker_failure_threshold
+        if threshold is not None and (
+            isinstance(threshold, bool) or not isinstance(threshold, int) or threshold < 1
+        ):
+            raise ValueError("transport.circuit_breaker_failure_threshold must be None or int >= 1")
+        if self.circuit_breaker_recovery_seconds < 0:
+            raise ValueError("transport.circuit_breaker_recovery_seconds must be >= 0")
+        if self.hedge_percentile is not None and not 0 < self.hedge_percentile < 1:
+            raise ValueError("transport.hedge_percentile must be None or in (0, 1)")
+        if (
+            isinstance(self.hedge_min_samples, bool)
+            or not isinstance(self.hedge_min_samples, int)
+            or self.hedge_min_samples < 1
+        ):
+            raise ValueError("transport.hedge_min_samples must be int >= 1")
+        if not isinstance(self.hedge_endpoints, tuple) or not all(
+            isinstance(endpoint, str) and endpoint for endpoint in self.hedge_endpoints
+        ):
+            raise ValueError("transport.hedge_endpoints must be a tuple of non-empty str")
+
+
+RETRY_JITTER_MODES = ("proportional", "decorrelated")
+
+
+@dataclass(slots=True, frozen=True)
+class RetryRule:
+    """Retry override for matching API statuses or exception types."""
+
+    statuses: tuple[int, ...] = ()
+    exceptions: tuple[type[BaseException], ...] = ()
+    retry: bool = True
+    max_attempts: int | None = None
+
+    def validate(self, *, name: str) -> None:
+        if not self.statuses and not self.exceptions:
+            raise ValueError(f"{name} must match at least one status or exception")
+        if any(isinstance(s, bool) or not isinstance(s, int) for s in self.statuses):
+            raise ValueError(f"{name}.statuses must contain int values")
+        if any(
+            not isinstance(e, type) or not issubclass(e, BaseException) for e in self.exceptions
+        ):
+            raise ValueError(f"{name}.exceptions must contain exception types")
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError(f"{name}.max_attempts must be >= 1")
 
 
 @dataclass(slots=True, frozen=True)
@@ -34,6 +110,12 @@ class RetryConfig:
     max_attempts: int = 5
     max_backoff_seconds: float = 30.0
     total_retry_budget_seconds: float = 120.0
+    base_backoff_seconds: float = 1.0
+    jitter: str = "proportional"
+    retryable_statuses: tuple[int, ...] = (500, 503)
+    rules: tuple[RetryRule, ...] = ()
+    respect_retry_after: bool = True
+    job_retry_budget: int | None = None
 
     def validate(self) -> None:
         if self.max_attempts < 1:
@@ -42,6 +124,20 @@ class RetryConfig:
             raise ValueError("retry.max_backoff_seconds must be >= 0")
         if self.total_retry_budget_seconds < 0:
             raise ValueError("retry.total_retry_budget_seconds must be >= 0")
+        if self.base_backoff_seconds < 0:
+            raise ValueError("retry.base_backoff_seconds must be >= 0")
+        if self.jitter not in RETRY_JITTER_MODES:
+            raise ValueError(f"retry.jitter must be one of {RETRY_JITTER_MODES}")
+        if any(isinstance(s, bool) or not isinstance(s, int) for s in self.retryable_statuses):
+            raise ValueError("retry.retryable_statuses must contain int values")
+        for index, rule in enumerate(self.rules):
+            rule.validate(name=f"retry.rules[{index}]")
+        if not isinstance(self.respect_retry_after, bool):
+            raise ValueError("retry.respect_retry_after must be bool")
+        _validate_optional_non_negative_int(
+            self.job_retry_budget,
+            name="retry.job_retry_budget",
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -61,12 +157,67 @@ class CheckpointConfig:
 
     enabled: bool = True
     ttl_seconds: float = float(DEFAULT_CHECKPOINT_TTL_SECONDS)
+    save_every_pages: int | None = None
+    save_every_chunks: int | None = None
+    save_every_seconds: float | None = None
+    compression: str = DEFAULT_CHECKPOINT_COMPRESSION
 
     def validate(self) -> None:
         if not isinstance(self.enabled, bool):
             raise ValueError("checkpoint.enabled must be bool")
         if self.ttl_seconds <= 0:
             raise ValueError("checkpoint.ttl_seconds must be > 0")
+        for name in ("save_every_pages", "save_every_chunks"):
+            value = getattr(self, name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise ValueError(f"checkpoint.{name} must be None or int >= 1")
+        if self.save_every_seconds is not None and self.save_every_seconds <= 0:
+            raise ValueError("checkpoint.save_every_seconds must be None or > 0")
+        if self.compression not in CHECKPOINT_COMPRESSIONS:
+            raise ValueError(f"checkpoint.compression must be one of {', '.join(CHECKPOINT_COMPRESSIONS)}")
+
+
+@dataclass(slots=True, frozen=True)
+class CacheConfig:
+    """Response and parsed-series cache settings."""
+
+    enabled: bool = False
+    max_entries: int = 256
+    ttl_seconds: float = 300.0
+    stale_while_revalidate_seconds: float = 0.0
+    negative_ttl_seconds: float | None = None
+    series_memory_max_bytes: int | None = None
+    series_disk_directory: str | None = None
+    series_disk_max_bytes: int | None = None
+    series_ttl_seconds: float = 3600.0
+
+    def validate(self) -> None:
+        if not isinstance(self.enabled, bool):
+            raise ValueError("cache.enabled must be bool")
+        if (
+            isinstance(self.max_entries, bool)
+            or not isinstance(self.max_entries, int)
+            or self.max_entries < 1
+        ):
+            raise ValueError("cache.max_entries must be int >= 1")
+        if self.ttl_seconds < 0:
+            raise ValueError("cache.ttl_seconds must be >= 0")
+        if self.stale_while_revalidate_seconds < 0:
+            raise ValueError("cache.stale_while_revalidate_seconds must be >= 0")
+        if self.negative_ttl_seconds is not None and self.negative_ttl_seconds < 0:
+            raise ValueError("cache.negative_ttl_seconds must be None or >= 0")
+        for field_name in ("series_memory_max_bytes", "series_disk_max_bytes"):
+            max_bytes = getattr(self, field_name)
+            if max_bytes is not None and (
+                isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes < 1
+            ):
+                raise ValueError(f"cache.{field_name} must be None or int >= 1")
+        if self.series_disk_directory is not None and (
+            not isinstance(self.series_disk_directory, str) or not self.series_disk_directory
+        ):
+            raise ValueError("cache.series_disk_directory must be None or a non-empty str")
+        if self.series_ttl_seconds <= 0:
+            raise ValueError("cache.series_ttl_seconds must be > 0")
 
 
 @dataclass(slots=True, frozen=True)
@@ -74,10 +225,37 @@ class TimeSeriesConfig:
     """Timeseries feature settings."""
 
     enable_layer_auto_partition: bool = False
+    data_code_date_windows: int = 1
+    data_code_window_frequency: str | None = None
+    max_concurrent_requests: int = 4
+    prefetch_depth: int = 0
+    offload_parse_min_values: int | None = None
 
     def validate(self) -> None:
         if not isinstance(self.enable_layer_auto_partition, bool):
             raise ValueError("timeseries.enable_layer_auto_partition must be bool")
+        for field_name in ("data_code_date_windows", "max_concurrent_requests"):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"timeseries.{field_name} must be int >= 1")
+        if (
+            self.data_code_window_frequency is not None
+            and self.data_code_window_frequency not in DATE_WINDOW_FREQUENCIES
+        ):
+            raise ValueError(
+                "timeseries.data_code_window_frequency must be None or one of "
+                + ", ".join(sorted(DATE_WINDOW_FREQUENCIES))
+            )
+        if (
+            isinstance(self.prefetch_depth, bool)
+            or not isinstance(self.prefetch_depth, int)
+            or self.prefetch_depth < 0
+        ):
+            raise ValueError("timeseries.prefetch_depth must be int >= 0")
+        _validate_optional_non_negative_int(
+            self.offload_parse_min_values,
+            name="timeseries.offload_parse_min_values",
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -92,6 +270,7 @@ class BojClientConfig:
     throttling: ThrottlingConfig = field(default_factory=ThrottlingConfig)
     checkpoint: CheckpointConfig = field(default_factory=CheckpointConfig)
     timeseries: TimeSeriesConfig = field(default_factory=TimeSeriesConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
 
     def to_checkpoint_snapshot(self) -> dict[str, int | float | bool]:
         return {
@@ -112,6 +291,7 @@ class BojClientConfig:
         self.throttling.validate()
         self.checkpoint.validate()
         self.timeseries.validate()
+        self.cache.validate()
 
 
 __all__ = [
@@ -120,5 +300,6 @@ __all__ = [
     "ThrottlingConfig",
     "CheckpointConfig",
     "TimeSeriesConfig",
+    "CacheConfig",
     "BojClientConfig",
 ]
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import queue
+import threading
 from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
 from typing import Any, Protocol, TypeVar
 
-from .checkpoint_store import CheckpointStore
+from .checkpoint_store import (
+    DEFAULT_CHECKPOINT_TTL_SECONDS,
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SqliteCheckpointStore,
+)
 
 T = TypeVar("T")
 
@@ -36,6 +46,14 @@ class AsyncCheckpointStoreAdapter:
         self._store = store
         self._run_sync: Callable[..., Awaitable[T]] = run_sync or _default_run_sync
 
+    @property
+    def ttl_seconds(self) -> float | None:
+        return getattr(self._store, "ttl_seconds", None)
+
+    @property
+    def clock(self) -> Callable[[], float] | None:
+        return getattr(self._store, "clock", None)
+
     async def save(self, state: Mapping[str, Any]) -> str:
         return await self._run_sync(self._store.save, state)
 
@@ -45,6 +63,227 @@ class AsyncCheckpointStoreAdapter:
     async def delete(self, checkpoint_id: str) -> None:
         await self._run_sync(self._store.delete, checkpoint_id)
 
+    async def purge_expired(self) -> int:
+        return await self._run_sync(self._store.purge_expired)
+
+
+class AsyncMemoryCheckpointStore:
+    """Process-local async store that runs on the event loop without threads.
+
+    Operations only copy snapshot containers in memory, so they complete
+    inline instead of hopping to a worker thread.
+    """
+
+    shares_immutable_snapshots = True
+
+    def __init__(self, store: MemoryCheckpointStore | None = None) -> None:
+        self._store = store if store is not None else MemoryCheckpointStore()
+
+    @property
+    def ttl_seconds(self) -> float | None:
+        return getattr(self._store, "ttl_seconds", None)
+
+    @property
+    def clock(self) -> Callable[[], float] | None:
+        return getattr(self._store, "clock", None)
+
+    async def save(self, state: Mapping[str, Any]) -> str:
+        return self._store.save(state)
+
+    async def load(self, checkpoint_id: str) -> dict[str, Any]:
+        return self._store.load(checkpoint_id)
+
+    async def delete(self, checkpoint_id: str) -> None:
+        self._store.delete(checkpoint_id)
+
+    async def purge_expired(self) -> int:
+        return self._store.purge_expired()
+
+
+_BatchItem = tuple[Callable[..., Any], tuple[Any, ...], asyncio.AbstractEventLoop, "asyncio.Future[Any]"]
+
+
+class BatchingAsyncCheckpointStoreAdapter:
+    """Run a sync store on one background thread, draining queued calls in batches.
+
+    Calls that queue up while the thread is busy run back to back; when the
+    store offers ``batch(write=...)`` (as :class:`SqliteCheckpointStore`
+    does) they share one transaction, opened as a write transaction only when
+    the batch saves, deletes or purges. Results are delivered after it commits.
+    """
+
+    def __init__(self, store: CheckpointStore, *, max_batch_size: int = 64) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self._store = store
+        self._max_batch_size = max_batch_size
+        self._queue: queue.SimpleQueue[_BatchItem | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def ttl_seconds(self) -> float | None:
+        return getattr(self._store, "ttl_seconds", None)
+
+    @property
+    def clock(self) -> Callable[[], float] | None:
+        return getattr(self._store, "clock", None)
+
+    async def save(self, state: Mapping[str, Any]) -> str:
+        return await self._submit(self._store.save, state)
+
+    async def load(self, checkpoint_id: str) -> dict[str, Any]:
+        return await self._submit(self._store.load, checkpoint_id)
+
+    async def delete(self, checkpoint_id: str) -> None:
+        await self._submit(self._store.delete, checkpoint_id)
+
+    async def purge_expired(self) -> int:
+        return await self._submit(self._store.purge_expired)
+
+    def close(self) -> None:
+        """Stop the worker thread after it finishes the queued calls."""
+
+        with self._thread_lock:
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    async def aclose(self) -> None:
+        """Async :meth:`close`; waits for the worker thread off the event loop."""
+
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _submit(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        with self._thread_lock:
+            if self._closed:
+                raise RuntimeError("checkpoint store adapter is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="boj-checkpoint-store",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._queue.put((func, args, loop, future))
+        return await future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self._max_batch_size:
+                try:
+                    queued = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is None:
+                    stop = True
+                    break
+                batch.append(queued)
+            self._run_batch(batch)
+            if stop:
+                return
+
+    def _run_batch(self, batch: list[_BatchItem]) -> None:
+        outcomes: list[tuple[bool, Any]] = []
+        try:
+            with self._batch_scope(batch):
+                for func, args, _, _ in batch:
+                    try:
+                        outcomes.append((True, func(*args)))
+                    except Exception as exc:
+                        outcomes.append((False, exc))
+        except Exception as exc:
+            # The shared transaction failed to commit, so nothing in it stuck.
+            outcomes = [(False, exc)] * len(batch)
+        for (_, _, loop, future), (ok, value) in zip(batch, outcomes):
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future, ok, value)
+            except RuntimeError:
+                continue
+
+    def _batch_scope(self, batch: list[_BatchItem]) -> AbstractContextManager[object]:
+        scope = getattr(self._store, "batch", None)
+        if not callable(scope):
+            return nullcontext()
+        load = self._store.load
+        return scope(write=any(func != load for func, _, _, _ in batch))
+
+
+class AsyncFileCheckpointStore(BatchingAsyncCheckpointStoreAdapter):
+    """``FileCheckpointStore`` served by one dedicated I/O thread with batched calls."""
+
+    def __init__(
+        self,
+        *,
+        base_dir: str | Path,
+        ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        clock: Callable[[], float] | None = None,
+        lazy_purge: bool = True,
+        max_batch_size: int = 64,
+    ) -> None:
+        super().__init__(
+            FileCheckpointStore(
+                base_dir=base_dir,
+                ttl_seconds=ttl_seconds,
+                clock=clock,
+                lazy_purge=lazy_purge,
+            ),
+            max_batch_size=max_batch_size,
+        )
+
+
+class AsyncSqliteCheckpointStore(BatchingAsyncCheckpointStoreAdapter):
+    """``SqliteCheckpointStore`` served by one dedicated I/O thread.
+
+    Calls queued while the thread is busy share one write transaction.
+    :meth:`close` and :meth:`aclose` also close the database connection.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | Path,
+        ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        clock: Callable[[], float] | None = None,
+        compression_level: int = 6,
+        busy_timeout_seconds: float = 30.0,
+        lazy_purge: bool = True,
+        max_batch_size: int = 64,
+    ) -> None:
+        self._sqlite_store = SqliteCheckpointStore(
+            path=path,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+            compression_level=compression_level,
+            busy_timeout_seconds=busy_timeout_seconds,
+            lazy_purge=lazy_purge,
+        )
+        super().__init__(self._sqlite_store, max_batch_size=max_batch_size)
+
+    def close(self) -> None:
+        super().close()
+        self._sqlite_store.close()
+
+
+def _resolve_future(future: "asyncio.Future[Any]", ok: bool, value: Any) -> None:
+    if future.done():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
+
 
 async def _default_run_sync(func: Callable[..., T], *args: Any) -> T:
     return await asyncio.to_thread(func, *args)
@@ -53,4 +292,8 @@ async def _default_run_sync(func: Callable[..., T], *args: Any) -> T:
 __all__ = [
     "AsyncCheckpointStore",
     "AsyncCheckpointStoreAdapter",
+    "AsyncFileCheckpointStore",
+    "AsyncMemoryCheckpointStore",
+    "AsyncSqliteCheckpointStore",
+    "BatchingAsyncCheckpointStoreAdapter",
 ]
@@ -0,0 +1,88 @@
+"""Background expiry sweeper task for async checkpoint stores."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from types import TracebackType
+from typing import Protocol
+
+logger = logging.getLogger("boj_api_client")
+
+
+class SupportsAsyncPurgeExpired(Protocol):
+    async def purge_expired(self) -> int:
+        """Delete expired checkpoints and return how many were removed."""
+
+
+class AsyncCheckpointSweeper:
+    """Await ``store.purge_expired()`` every ``interval_seconds`` in an asyncio task.
+
+    Pair it with a sync store built with ``lazy_purge=False`` behind one of the
+    async adapters, so save/load/delete no longer pay for expiry cleanup.
+    """
+
+    def __init__(self, store: SupportsAsyncPurgeExpired, *, interval_seconds: float) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self._store = store
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> "AsyncCheckpointSweeper":
+        """Start the sweep task on the running event loop."""
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(),
+                name="boj-checkpoint-sweeper",
+            )
+        return self
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def sweep(self) -> int:
+        """Run one purge now; failures are logged and count as zero removals."""
+
+        try:
+            removed = await self._store.purge_expired()
+        except Exception:
+            logger.warning("checkpoint sweep failed", exc_info=True)
+            return 0
+        if removed:
+            logger.debug("checkpoint sweep removed=%s", removed)
+        return removed
+
+    async def __aenter__(self) -> "AsyncCheckpointSweeper":
+        return self.start()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self.sweep()
+
+
+__all__ = [
+    "AsyncCheckpointSweeper",
+    "SupportsAsyncPurgeExpired",
+]
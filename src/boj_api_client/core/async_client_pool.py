@@ -0,0 +1,149 @@
+"""Process-level pool of shared ``httpx.AsyncClient`` instances."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+from ..config import BojClientConfig
+from .client_pool import DEFAULT_IDLE_TIMEOUT_SECONDS
+from .transport_shared import build_http_client_options, http_client_pool_key
+
+logger = logging.getLogger("boj_api_client")
+
+
+@dataclass(slots=True)
+class _PoolEntry:
+    client: httpx.AsyncClient
+    refcount: int
+    idle_since: float | None = None
+
+
+class AsyncSharedClientPool:
+    """Reference-counted ``httpx.AsyncClient`` registry keyed by connection settings.
+
+    Connections belong to the event loop that opened them, so entries are also
+    keyed by the running loop; clients from separate ``asyncio.run`` calls are
+    never shared. A client whose last lease is released stays pooled for
+    ``idle_timeout_seconds``; entries of loops that have since closed are
+    dropped on the next acquire.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: Callable[[BojClientConfig], httpx.AsyncClient] | None = None,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if idle_timeout_seconds < 0:
+            raise ValueError("idle_timeout_seconds must be >= 0")
+        self._factory = factory or _default_factory
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[object, ...], _PoolEntry] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def acquire(self, config: BojClientConfig) -> httpx.AsyncClient:
+        """Lease a client for the running loop; must be called from a coroutine."""
+
+        loop = asyncio.get_running_loop()
+        key = (loop, *http_client_pool_key(config))
+        with self._lock:
+            expired = self._pop_expired_locked(loop)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _PoolEntry(client=self._factory(config), refcount=0)
+                self._entries[key] = entry
+                logger.debug("shared async http client created base_url=%s", key[1])
+            entry.refcount += 1
+            entry.idle_since = None
+            client = entry.client
+        for expired_key, expired_entry in expired:
+            task = loop.create_task(_close_entry(expired_key, expired_entry))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return client
+
+    async def release(self, client: httpx.AsyncClient) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            key = self._find_key(client)
+            if key is None:
+                return
+            entry = self._entries[key]
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            entry.idle_since = self._clock()
+            expired = self._pop_expired_locked(loop)
+        for expired_key, expired_entry in expired:
+            await _close_entry(expired_key, expired_entry)
+
+    async def aclose(self) -> None:
+        """Close clients owned by the running loop."""
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [key for key in self._entries if key[0] is loop]
+            entries = [self._entries.pop(key) for key in keys]
+        closing = [task for task in self._closing if task.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+        for entry in entries:
+            await entry.client.aclose()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _find_key(self, client: httpx.AsyncClient) -> tuple[object, ...] | None:
+        for key, entry in self._entries.items():
+            if entry.client is client:
+                return key
+        return None
+
+    def _pop_expired_locked(
+        self,
+        loop: asyncio.AbstractEventLoop,
+    ) -> list[tuple[tuple[object, ...], _PoolEntry]]:
+        now = self._clock()
+        expired: list[tuple[tuple[object, ...], _PoolEntry]] = []
+        for key, entry in list(self._entries.items()):
+            owner = key[0]
+            if owner is not loop and owner.is_closed():  # type: ignore[attr-defined]
+                # Nothing can await on a closed loop; its sockets are already gone.
+                del self._entries[key]
+            elif (
+                owner is loop
+                and entry.idle_since is not None
+                and now - entry.idle_since >= self._idle_timeout_seconds
+            ):
+                del self._entries[key]
+                expired.append((key, entry))
+        return expired
+
+
+async def _close_entry(key: tuple[object, ...], entry: _PoolEntry) -> None:
+    logger.debug("shared async http client closed base_url=%s", key[1])
+    await entry.client.aclose()
+
+
+def _default_factory(config: BojClientConfig) -> httpx.AsyncClient:
+    return httpx.AsyncClient(**build_http_client_options(config))  # type: ignore[arg-type]
+
+
+DEFAULT_ASYNC_CLIENT_POOL = AsyncSharedClientPool()
+
+
+__all__ = [
+    "DEFAULT_ASYNC_CLIENT_POOL",
+    "AsyncSharedClientPool",
+]
@@ -0,0 +1,39 @@
+"""Async bounded fan-out helpers for independent request units."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def agather_bounded(
+    tasks: Sequence[Callable[[], Awaitable[T]]],
+    *,
+    max_concurrency: int,
+) -> list[T | Exception]:
+    """Run task factories concurrently and return outcomes in input order.
+
+    Exceptions raised by a task are returned in its slot instead of being raised,
+    so callers can aggregate partial progress.
+    """
+
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(task: Callable[[], Awaitable[T]]) -> T | Exception:
+        async with semaphore:
+            try:
+                return await task()
+            except Exception as exc:
+                return exc
+
+    return list(await asyncio.gather(*(_run(task) for task in tasks)))
+
+
+__all__ = [
+    "agather_bounded",
+]
@@ -0,0 +1,35 @@
+"""CPU offload helpers that keep heavy work off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def arun_offloaded(
+    call: Callable[[], T],
+    *,
+    offload: bool,
+    executor: Executor | None = None,
+) -> T:
+    """Run ``call`` inline, or in a worker when ``offload`` is set.
+
+    Without an explicit ``executor`` the work goes to ``asyncio.to_thread``.
+    A process pool can be supplied when ``call`` is picklable (for example a
+    ``functools.partial`` over a module-level function and plain data).
+    """
+
+    if not offload:
+        return call()
+    if executor is None:
+        return await asyncio.to_thread(call)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+__all__ = [
+    "arun_offloaded",
+]
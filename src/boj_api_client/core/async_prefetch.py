@@ -0,0 +1,82 @@
+"""Async bounded prefetch pipeline for paged responses."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+_END = object()
+
+
+@dataclass(slots=True, frozen=True)
+class _Failure:
+    error: BaseException
+
+
+async def aprefetch_map(
+    source: AsyncIterator[P],
+    transform: Callable[[P], R],
+    *,
+    depth: int,
+) -> AsyncIterator[R]:
+    """Yield ``transform(item)`` for each source item, prefetching up to ``depth`` items.
+
+    The source is owned by the pipeline and closed when iteration stops.
+    With ``depth > 0`` it is drained by a background task into a bounded
+    queue and ``transform`` runs via ``asyncio.to_thread``, so the event loop
+    keeps the next request in flight while the current page is parsed.
+    ``depth == 0`` keeps the fully lazy, inline behaviour.
+    """
+
+    if depth < 0:
+        raise ValueError("depth must be >= 0")
+    if depth == 0:
+        try:
+            async for item in source:
+                yield transform(item)
+        finally:
+            await _aclose_source(source)
+        return
+
+    buffer: asyncio.Queue[object] = asyncio.Queue(maxsize=depth)
+
+    async def _produce() -> None:
+        try:
+            async for item in source:
+                await buffer.put(item)
+            await buffer.put(_END)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as exc:
+            await buffer.put(_Failure(exc))
+        finally:
+            await _aclose_source(source)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield await asyncio.to_thread(transform, item)  # type: ignore[arg-type]
+    finally:
+        producer.cancel()
+        await asyncio.wait([producer])
+
+
+async def _aclose_source(source: AsyncIterator[object]) -> None:
+    aclose = getattr(source, "aclose", None)
+    if callable(aclose):
+        await aclose()
+
+
+__all__ = [
+    "aprefetch_map",
+]
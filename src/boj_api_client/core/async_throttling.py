@@ -8,7 +8,11 @@ from collections.abc import Awaitable, Callable
 
 
 class AsyncMinIntervalThrottler:
-    """Ensures minimum interval between outbound requests (async)."""
+    """Ensures minimum interval between outbound requests (async).
+
+    The slot is reserved before suspending, so concurrent coroutines are
+    spaced out instead of all observing the same last request timestamp.
+    """
 
     def __init__(
         self,
@@ -24,13 +28,25 @@ class AsyncMinIntervalThrottler:
 
     async def wait(self) -> None:
         now = self._clock()
+        scheduled_at = now
         if self._last_request_at is not None:
-            elapsed = now - self._last_request_at
-            remaining = self._min_interval_seconds - elapsed
-            if remaining > 0:
-                await self._sleep(remaining)
-                now = self._clock()
+            scheduled_at = max(now, self._last_request_at + self._min_interval_seconds)
+        self._last_request_at = scheduled_at
+        remaining = scheduled_at - now
+        if remaining > 0:
+            await self._sleep(remaining)
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot only if one is free right now; never waits."""
+
+        now = self._clock()
+        if (
+            self._last_request_at is not None
+            and now < self._last_request_at + self._min_interval_seconds
+        ):
+            return False
         self._last_request_at = now
+        return True
 
     def reset(self) -> None:
         self._last_request_at = None
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 import random
 import time
 from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import Executor
+from functools import partial
 from typing import Protocol
 
 import httpx
 
 from ..config import BojClientConfig
+from .circuit_breaker import CIRCUIT_OPEN, CircuitBreaker
+from .async_client_pool import DEFAULT_ASYNC_CLIENT_POOL, AsyncSharedClientPool
+from .async_offload import arun_offloaded
 from .async_throttling import AsyncMinIntervalThrottler
 from .errors import (
     BojProtocolError,
@@ -20,20 +26,32 @@ from .errors import (
     BojUnavailableError,
     BojValidationError,
 )
-from .response_parsing import classify_payload_outcome, parse_json_payload
-from .retry import is_retryable_api_status
+from .latency import LatencyTracker
+from .response_parsing import (
+    classify_payload_outcome,
+    decode_json_payload,
+    parse_json_payload,
+    response_body_size,
+)
+from .response_cache import CacheLookup, ResponseCache
+from .retry import RETRY_AFTER_STATUSES, RetryPolicy, retry_after_for_response
+from .job_context import current_deadline
 from .transport_shared import (
-    build_default_headers,
-    build_default_timeout,
-    compute_backoff_seconds,
-    should_retry_attempt,
+    build_circuit_breaker,
+    build_http_client_options,
+    build_response_cache,
+    deadline_allows_retry,
+    deadline_exceeded_error,
+    deadline_request_options,
+    retry_after_exceeded_error,
+    with_request_headers,
 )
 
 logger = logging.getLogger("boj_api_client")
 
 
 class AsyncTransportClient(Protocol):
-    async def get(self, endpoint: str, params: Mapping[str, str]) -> object: ...
+    async def get(self, endpoint: str, params: Mapping[str, str], **options: object) -> object: ...
     async def aclose(self) -> None: ...
 
 
@@ -48,12 +66,26 @@ class AsyncTransport:
         sleeper: Callable[[float], Awaitable[None]] | None = None,
         clock: Callable[[], float] | None = None,
         rng: random.Random | None = None,
+        offload_executor: Executor | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        client_pool: AsyncSharedClientPool | None = None,
     ) -> None:
         self._config = config
+        self._offload_executor = offload_executor
         self._sleep = sleeper or _default_sleep
         self._clock = clock or time.monotonic
         self._rng = rng or random.Random()
+        self._retry_policy = retry_policy or RetryPolicy(config.retry)
+        self._circuit_breaker = circuit_breaker or build_circuit_breaker(config, clock=self._clock)
+        self._response_cache = response_cache or build_response_cache(config, clock=self._clock)
         self._closed = False
+        self._latency = LatencyTracker()
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._hedge_endpoints = frozenset(
+            endpoint.lstrip("/") for endpoint in config.transport.hedge_endpoints
+        )
 
         self._throttler = AsyncMinIntervalThrottler(
             config.throttling.min_wait_interval_seconds,
@@ -61,62 +93,121 @@ class AsyncTransport:
             sleeper=self._sleep,
         )
         self._owns_client = client is None
-        normalized_base_url = config.base_url.rstrip("/") + "/"
-        self._client = client or httpx.AsyncClient(
-            base_url=normalized_base_url,
-            headers=build_default_headers(config),
-            timeout=build_default_timeout(config),
-        )
+        self._client_pool: AsyncSharedClientPool | None = None
+        self._client: AsyncTransportClient | None
+        if client is None and (client_pool is not None or config.transport.share_connection_pool):
+            # Pooled clients are bound to the running loop, so lease on first request.
+            self._client_pool = DEFAULT_ASYNC_CLIENT_POOL if client_pool is None else client_pool
+            self._owns_client = False
+            self._client = None
+        else:
+            self._client = client or httpx.AsyncClient(**build_http_client_options(config))
 
     async def close(self) -> None:
         if self._closed:
             return
         self._closed = True
-        if self._owns_client and hasattr(self._client, "aclose"):
+        for task in self._refresh_tasks:
+            task.cancel()
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        if self._client_pool is not None:
+            if self._client is not None:
+                await self._client_pool.release(self._client)  # type: ignore[arg-type]
+        elif self._owns_client and hasattr(self._client, "aclose"):
             await self._client.aclose()
 
     async def request(self, endpoint: str, *, params: Mapping[str, str]) -> dict[str, object]:
         if self._closed:
             raise BojTransportError("transport is already closed")
 
+        normalized_endpoint = self._normalize_endpoint(endpoint)
+        cache_lookup = None
+        if self._response_cache is not None:
+            cache_lookup = self._response_cache.lookup(normalized_endpoint, params)
+            if cache_lookup.payload is not None:
+                logger.debug(
+                    "response cache hit endpoint=%s stale=%s",
+                    normalized_endpoint,
+                    cache_lookup.stale,
+                )
+                if cache_lookup.stale:
+                    self._schedule_refresh(normalized_endpoint, params, cache_lookup)
+                return cache_lookup.payload
+        return await self._fetch(normalized_endpoint, params, cache_lookup)
+
+    async def _fetch(
+        self,
+        normalized_endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup | None,
+    ) -> dict[str, object]:
         started_at = self._clock()
         attempt = 0
-        normalized_endpoint = self._normalize_endpoint(endpoint)
+        previous_delay = 0.0
+        deadline = current_deadline()
 
         while True:
             attempt += 1
             logger.debug("request start endpoint=%s attempt=%s", normalized_endpoint, attempt)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request(normalized_endpoint)
             await self._throttler.wait()
+            request_options = deadline_request_options(self._config, deadline)
+            if cache_lookup is not None:
+                request_options = with_request_headers(request_options, cache_lookup.request_headers)
 
             try:
-                response = await self._client.get(normalized_endpoint, params=params)
+                # httpx timeouts bound each phase separately; the job deadline
+                # bounds the whole attempt, including a slowly trickling body.
+                async with asyncio.timeout(
+                    None if deadline is None else deadline.remaining()
+                ) as attempt_timeout:
+                    response = await self._send(normalized_endpoint, params, request_options)
             except Exception as exc:
-                if should_retry_attempt(
-                    config=self._config,
-                    attempt=attempt,
-                    started_at=started_at,
-                    now=self._clock(),
+                out_of_time = attempt_timeout.expired() or (
+                    deadline is not None and deadline.expired()
+                )
+                circuit_open = self._record_circuit_outcome(
+                    normalized_endpoint,
+                    transient=True,
+                    cut_short=out_of_time,
+                )
+                if (
+                    not out_of_time
+                    and not circuit_open
+                    and self._retry_policy.should_retry_exception(
+                        exc,
+                        attempt=attempt,
+                        started_at=started_at,
+                        now=self._clock(),
+                    )
                 ):
-                    logger.warning(
-                        "request network error; retrying endpoint=%s attempt=%s error=%s",
-                        normalized_endpoint,
-                        attempt,
-                        exc.__class__.__name__,
+                    previous_delay = self._retry_policy.backoff_seconds(
+                        attempt=attempt,
+                        previous_delay=previous_delay,
+                        rng=self._rng,
                     )
-                    await self._sleep(
-                        compute_backoff_seconds(
-                            config=self._config,
-                            attempt=attempt,
-                            rng=self._rng,
+                    if deadline_allows_retry(deadline, previous_delay):
+                        logger.warning(
+                            "request network error; retrying endpoint=%s attempt=%s error=%s delay=%.3f",
+                            normalized_endpoint,
+                            attempt,
+                            exc.__class__.__name__,
+                            previous_delay,
                         )
-                    )
-                    continue
+                        await self._sleep(previous_delay)
+                        continue
+                    out_of_time = True
                 logger.error(
-                    "request network error; giving up endpoint=%s attempt=%s error=%s",
+                    "request network error; giving up endpoint=%s attempt=%s error=%s deadline=%s",
                     normalized_endpoint,
                     attempt,
                     exc.__class__.__name__,
+                    out_of_time,
                 )
+                if out_of_time:
+                    raise deadline_exceeded_error() from exc
                 raise BojTransportError(
                     "network/transport error",
                     cause="network",
@@ -129,24 +220,60 @@ class AsyncTransport:
                 attempt,
                 http_status,
             )
+            if deadline is not None and deadline.expired():
+                logger.error(
+                    "request overran job deadline endpoint=%s attempt=%s http_status=%s",
+                    normalized_endpoint,
+                    attempt,
+                    http_status,
+                )
+                raise deadline_exceeded_error()
+            if http_status == 304 and cache_lookup is not None and cache_lookup.entry is not None:
+                self._record_circuit_outcome(normalized_endpoint, transient=False)
+                logger.info(
+                    "request not modified endpoint=%s attempt=%s",
+                    normalized_endpoint,
+                    attempt,
+                )
+                return self._response_cache.mark_not_modified(  # type: ignore[union-attr]
+                    cache_lookup,
+                    headers=getattr(response, "headers", None),
+                )
             try:
-                payload = parse_json_payload(response, http_status=http_status)
+                payload = await self._decode_payload(response, http_status=http_status)
             except (
                 BojProtocolError,
                 BojValidationError,
                 BojServerError,
                 BojUnavailableError,
-            ):
-                logger.error(
-                    "response parse error endpoint=%s attempt=%s http_status=%s",
-                    normalized_endpoint,
-                    attempt,
-                    http_status,
+            ) as exc:
+                if http_status not in RETRY_AFTER_STATUSES:
+                    self._record_circuit_outcome(
+                        normalized_endpoint,
+                        transient=isinstance(exc, (BojServerError, BojUnavailableError)),
+                    )
+                    logger.error(
+                        "response parse error endpoint=%s attempt=%s http_status=%s",
+                        normalized_endpoint,
+                        attempt,
+                        http_status,
+                    )
+                    raise
+                # Throttling proxies and maintenance pages often answer 429 /
+                # 503 with an HTML or empty body; retry on the HTTP status.
+                mapped_error, status = exc, http_status
+            else:
+                mapped_error, status = classify_payload_outcome(
+                    payload,
+                    http_status=http_status,
                 )
-                raise
-            mapped_error, status = classify_payload_outcome(
-                payload,
-                http_status=http_status,
+                if status is None:
+                    # A body without STATUS is judged by the HTTP status.
+                    status = http_status
+            circuit_open = self._record_circuit_outcome(
+                normalized_endpoint,
+                transient=mapped_error is not None
+                and status in self._retry_policy.config.retryable_statuses,
             )
             if mapped_error is None:
                 logger.info(
@@ -154,31 +281,63 @@ class AsyncTransport:
                     normalized_endpoint,
                     attempt,
                 )
+                if cache_lookup is not None:
+                    self._response_cache.store(  # type: ignore[union-attr]
+                        cache_lookup,
+                        payload,
+                        headers=getattr(response, "headers", None),
+                    )
                 return payload
 
-            if (
-                is_retryable_api_status(status)
-                and should_retry_attempt(
-                    config=self._config,
-                    attempt=attempt,
+            if not circuit_open and self._retry_policy.should_retry_status(
+                status,
+                attempt=attempt,
+                started_at=started_at,
+                now=self._clock(),
+            ):
+                retry_after = retry_after_for_response(
+                    response,
+                    http_status=http_status,
+                    status=status,
+                )
+                if not self._retry_policy.retry_after_fits(
+                    retry_after,
                     started_at=started_at,
                     now=self._clock(),
+                    deadline_remaining=None if deadline is None else deadline.remaining(),
+                ):
+                    logger.error(
+                        "request unavailable; Retry-After exceeds retry budget endpoint=%s attempt=%s "
+                        "status=%s retry_after=%.3f",
+                        normalized_endpoint,
+                        attempt,
+                        status,
+                        retry_after,
+                    )
+                    raise retry_after_exceeded_error(retry_after, mapped_error) from mapped_error
+                previous_delay = self._retry_policy.backoff_seconds(
+                    attempt=attempt,
+                    previous_delay=previous_delay,
+                    rng=self._rng,
+                    retry_after=retry_after,
                 )
-            ):
-                logger.warning(
-                    "request transient failure; retrying endpoint=%s attempt=%s status=%s",
+                if deadline_allows_retry(deadline, previous_delay):
+                    logger.warning(
+                        "request transient failure; retrying endpoint=%s attempt=%s status=%s delay=%.3f",
+                        normalized_endpoint,
+                        attempt,
+                        status,
+                        previous_delay,
+                    )
+                    await self._sleep(previous_delay)
+                    continue
+                logger.error(
+                    "request transient failure; giving up at job deadline endpoint=%s attempt=%s status=%s",
                     normalized_endpoint,
                     attempt,
                     status,
                 )
-                await self._sleep(
-                    compute_backoff_seconds(
-                        config=self._config,
-                        attempt=attempt,
-                        rng=self._rng,
-                    )
-                )
-                continue
+                raise deadline_exceeded_error() from mapped_error
 
             logger.error(
                 "request failed endpoint=%s attempt=%s status=%s",
@@ -188,11 +347,143 @@ class AsyncTransport:
             )
             raise mapped_error
 
+    async def _send(
+        self,
+        endpoint: str,
+        params: Mapping[str, str],
+        options: Mapping[str, object],
+    ) -> object:
+        client = self._ensure_client()
+        percentile = self._config.transport.hedge_percentile
+        if percentile is None or endpoint not in self._hedge_endpoints:
+            return await client.get(endpoint, params=params, **options)
+
+        delay = None
+        if self._latency.sample_count(endpoint) >= self._config.transport.hedge_min_samples:
+            delay = self._latency.percentile(endpoint, percentile)
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        tasks = [asyncio.ensure_future(client.get(endpoint, params=params, **options))]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                # The hedge spends a throttle slot only if one is free right now.
+                if not done and self._throttler.try_acquire():
+                    logger.debug("request hedged endpoint=%s delay=%.3f", endpoint, delay)
+                    hedge = client.get(endpoint, params=params, **options)
+                    tasks.append(asyncio.ensure_future(hedge))
+            response = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+        self._latency.record(endpoint, loop.time() - sent_at)
+        return response
+
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup,
+    ) -> None:
+        cache = self._response_cache
+        if cache is None or not cache.try_begin_refresh(cache_lookup.key):
+            return
+        # A fresh context keeps the caller's job deadline and retry budget out
+        # of the refresh.
+        task = asyncio.get_running_loop().create_task(
+            self._refresh(endpoint, dict(params), cache_lookup),
+            context=contextvars.Context(),
+        )
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(
+        self,
+        endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup,
+    ) -> None:
+        try:
+            await self._fetch(endpoint, params, cache_lookup)
+        except Exception as exc:
+            logger.warning(
+                "background refresh failed endpoint=%s error=%s",
+                endpoint,
+                exc.__class__.__name__,
+            )
+        finally:
+            self._response_cache.finish_refresh(cache_lookup.key)  # type: ignore[union-attr]
+
+    def _ensure_client(self) -> AsyncTransportClient:
+        client = self._client
+        if client is None:
+            pool = DEFAULT_ASYNC_CLIENT_POOL if self._client_pool is None else self._client_pool
+            client = pool.acquire(self._config)
+            self._client = client
+        return client
+
+    async def _decode_payload(
+        self,
+        response: object,
+        *,
+        http_status: int | None,
+    ) -> dict[str, object]:
+        threshold = self._config.transport.offload_json_min_bytes
+        size = response_body_size(response)
+        if threshold is None or size is None or size < threshold:
+            return parse_json_payload(response, http_status=http_status)  # type: ignore[arg-type]
+        logger.debug("response decode offloaded bytes=%s", size)
+        return await arun_offloaded(
+            partial(decode_json_payload, bytes(response.content), http_status=http_status),  # type: ignore[attr-defined]
+            offload=True,
+            executor=self._offload_executor,
+        )
+
+    def _record_circuit_outcome(
+        self,
+        endpoint: str,
+        *,
+        transient: bool,
+        cut_short: bool = False,
+    ) -> bool:
+        """Record an attempt outcome; return True when the circuit is now open.
+
+        Attempts ``cut_short`` by the caller's job deadline say nothing about
+        endpoint health, so they are not counted as failures.
+        """
+
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return False
+        if cut_short:
+            breaker.release_probe(endpoint)
+            return False
+        if not transient:
+            breaker.record_success(endpoint)
+            return False
+        breaker.record_failure(endpoint)
+        return breaker.state(endpoint) == CIRCUIT_OPEN
+
     @staticmethod
     def _normalize_endpoint(endpoint: str) -> str:
         return endpoint.lstrip("/")
 
 
+async def _first_success(tasks: list[asyncio.Future[object]]) -> object:
+    """Return the first successful result; if all fail, raise the primary's error."""
+
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            if task in done and task.exception() is None:
+                return task.result()
+    raise tasks[0].exception()  # type: ignore[misc]
+
+
 async def _default_sleep(seconds: float) -> None:
     await asyncio.sleep(seconds)
 
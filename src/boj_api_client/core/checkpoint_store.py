@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
 import pickle
 import re
+import sqlite3
 import threading
 import time
 import uuid
+import zlib
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -20,9 +24,31 @@ from .errors import BojValidationError
 
 DEFAULT_CHECKPOINT_TTL_SECONDS = 24 * 60 * 60
 _CHECKPOINT_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_IMMUTABLE_SCALARS = (str, bytes, int, float, complex, bool, type(None))
 logger = logging.getLogger("boj_api_client")
 
 
+def snapshot_state(value: Any) -> Any:
+    """Copy mutable containers while sharing immutable leaves by reference.
+
+    Frozen dataclasses (such as ``TimeSeries``) are treated as immutable and
+    shared; values of unknown types fall back to ``deepcopy``.
+    """
+
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {key: snapshot_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [snapshot_state(item) for item in value]
+    if type(value) is tuple:
+        items = tuple(snapshot_state(item) for item in value)
+        return value if all(new is old for new, old in zip(items, value)) else items
+    if is_dataclass(value) and not isinstance(value, type) and value.__dataclass_params__.frozen:
+        return value
+    return deepcopy(value)
+
+
 def validate_checkpoint_id(checkpoint_id: str) -> str:
     """Validate checkpoint id format."""
 
@@ -51,29 +77,49 @@ class _StoredCheckpoint:
 
 
 class _CheckpointStoreBase(ABC):
-    """Common save/load/delete flow shared by concrete checkpoint stores."""
+    """Common save/load/delete flow shared by concrete checkpoint stores.
+
+    With ``lazy_purge=True`` (default) every operation also removes expired
+    checkpoints. With ``lazy_purge=False`` operations only touch their own
+    checkpoint and expiry is left to :meth:`purge_expired`, typically run by a
+    ``CheckpointSweeper``; expired checkpoints still never load.
+    """
+
+    # Stores that serialize on write already isolate callers from saved state.
+    _copies_state = True
 
     def __init__(
         self,
         *,
         ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
         clock: Callable[[], float] | None = None,
+        lazy_purge: bool = True,
     ) -> None:
         if ttl_seconds <= 0:
             raise ValueError("ttl_seconds must be > 0")
         self._ttl_seconds = ttl_seconds
         self._clock = clock or time.time
+        self._lazy_purge = lazy_purge
         self._lock = threading.RLock()
 
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        return self._clock
+
     def save(self, state: Mapping[str, Any]) -> str:
         now = self._clock()
         checkpoint_id = uuid.uuid4().hex
         stored = _StoredCheckpoint(
             expires_at=now + self._ttl_seconds,
-            state=deepcopy(dict(state)),
+            state=snapshot_state(dict(state)) if self._copies_state else dict(state),
         )
         with self._lock:
-            self._purge_expired_locked(now)
+            if self._lazy_purge:
+                self._purge_expired_locked(now)
             self._write_checkpoint_locked(checkpoint_id, stored)
         return checkpoint_id
 
@@ -83,22 +129,32 @@ class _CheckpointStoreBase(ABC):
         with self._lock:
             stored = self._read_checkpoint_locked(checkpoint_id)
             if stored is None:
-                self._purge_expired_locked(now)
+                if self._lazy_purge:
+                    self._purge_expired_locked(now)
                 raise BojValidationError("checkpoint_id not found")
             if stored.expires_at <= now:
                 self._delete_checkpoint_locked(checkpoint_id)
                 raise BojValidationError("checkpoint_id expired")
-            self._purge_expired_locked(now, skip_id=checkpoint_id)
-            return deepcopy(stored.state)
+            if self._lazy_purge:
+                self._purge_expired_locked(now, skip_id=checkpoint_id)
+            return snapshot_state(stored.state) if self._copies_state else stored.state
 
     def delete(self, checkpoint_id: str) -> None:
         validate_checkpoint_id(checkpoint_id)
         now = self._clock()
         with self._lock:
-            self._purge_expired_locked(now)
+            if self._lazy_purge:
+                self._purge_expired_locked(now)
             if not self._delete_checkpoint_locked(checkpoint_id):
                 raise BojValidationError("checkpoint_id not found")
 
+    def purge_expired(self) -> int:
+        """Delete every expired checkpoint and return how many were removed."""
+
+        now = self._clock()
+        with self._lock:
+            return self._purge_expired_locked(now)
+
     @abstractmethod
     def _write_checkpoint_locked(self, checkpoint_id: str, stored: _StoredCheckpoint) -> None: ...
 
@@ -109,19 +165,27 @@ class _CheckpointStoreBase(ABC):
     def _delete_checkpoint_locked(self, checkpoint_id: str) -> bool: ...
 
     @abstractmethod
-    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> None: ...
+    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> int: ...
 
 
 class MemoryCheckpointStore(_CheckpointStoreBase):
-    """Process-local checkpoint store."""
+    """Process-local checkpoint store.
+
+    States are kept as snapshots: containers are copied on save and load, but
+    frozen values such as ``TimeSeries`` are shared by reference, so the
+    checkpoint managers hand it series unencoded.
+    """
+
+    shares_immutable_snapshots = True
 
     def __init__(
         self,
         *,
         ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
         clock: Callable[[], float] | None = None,
+        lazy_purge: bool = True,
     ) -> None:
-        super().__init__(ttl_seconds=ttl_seconds, clock=clock)
+        super().__init__(ttl_seconds=ttl_seconds, clock=clock, lazy_purge=lazy_purge)
         self._items: dict[str, _StoredCheckpoint] = {}
 
     def _write_checkpoint_locked(self, checkpoint_id: str, stored: _StoredCheckpoint) -> None:
@@ -136,7 +200,7 @@ class MemoryCheckpointStore(_CheckpointStoreBase):
         del self._items[checkpoint_id]
         return True
 
-    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> None:
+    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> int:
         expired = [
             key
             for key, item in self._items.items()
@@ -144,10 +208,21 @@ class MemoryCheckpointStore(_CheckpointStoreBase):
         ]
         for key in expired:
             del self._items[key]
+        return len(expired)
 
 
 class FileCheckpointStore(_CheckpointStoreBase):
-    """Filesystem-backed checkpoint store with TTL and lazy GC."""
+    """Filesystem-backed checkpoint store with TTL and lazy GC.
+
+    Each checkpoint is one ``.pkl`` file whose modification time is set to
+    its expiry, so save and delete touch only their own file and lazy GC
+    reads directory metadata without unpickling checkpoints. The pickled
+    expiry stays authoritative for loads. Instances sharing a directory
+    never overwrite each other's state; use ``SqliteCheckpointStore`` for
+    many concurrent processes.
+    """
+
+    _copies_state = False
 
     def __init__(
         self,
@@ -155,8 +230,9 @@ class FileCheckpointStore(_CheckpointStoreBase):
         base_dir: str | Path,
         ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
         clock: Callable[[], float] | None = None,
+        lazy_purge: bool = True,
     ) -> None:
-        super().__init__(ttl_seconds=ttl_seconds, clock=clock)
+        super().__init__(ttl_seconds=ttl_seconds, clock=clock, lazy_purge=lazy_purge)
         self._base_dir = Path(base_dir).resolve()
         self._base_dir.mkdir(parents=True, exist_ok=True)
 
@@ -186,6 +262,9 @@ class FileCheckpointStore(_CheckpointStoreBase):
             pickle.dump(stored, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
             file_obj.flush()
             os.fsync(file_obj.fileno())
+        # Rounded up so coarse filesystem timestamps never expire a file early.
+        expires_at = math.ceil(stored.expires_at)
+        os.utime(tmp_path, (expires_at, expires_at))
         os.replace(tmp_path, path)
 
     def _read(self, path: Path) -> _StoredCheckpoint | None:
@@ -204,16 +283,25 @@ class FileCheckpointStore(_CheckpointStoreBase):
             return None
         return loaded
 
-    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> None:
-        for path in self._base_dir.glob("*.pkl"):
-            checkpoint_id = path.stem
-            if skip_id is not None and checkpoint_id == skip_id:
-                continue
-            stored = self._read(path)
-            if stored is None:
-                continue
-            if stored.expires_at <= now:
-                self._unlink(path)
+    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> int:
+        removed = 0
+        with os.scandir(self._base_dir) as entries:
+            for entry in entries:
+                checkpoint_id, _, suffix = entry.name.partition(".")
+                if (
+                    suffix != "pkl"
+                    or checkpoint_id == skip_id
+                    or _CHECKPOINT_ID_RE.fullmatch(checkpoint_id) is None
+                ):
+                    continue
+                try:
+                    expires_at = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if expires_at <= now:
+                    self._unlink(Path(entry.path))
+                    removed += 1
+        return removed
 
     def _unlink(self, path: Path) -> None:
         try:
@@ -222,11 +310,152 @@ class FileCheckpointStore(_CheckpointStoreBase):
             return
 
 
+class SqliteCheckpointStore(_CheckpointStoreBase):
+    """SQLite-backed checkpoint store shared safely by worker processes on one node.
+
+    The database runs in WAL mode so readers never block the writer, expiry
+    is an indexed column so lazy GC is a single ``DELETE``, and states are
+    stored as zlib-compressed pickles. Each process (and each fork) opens its
+    own connection; :meth:`batch` groups several operations in one
+    transaction.
+    """
+
+    _copies_state = False
+
+    def __init__(
+        self,
+        *,
+        path: str | Path,
+        ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        clock: Callable[[], float] | None = None,
+        compression_level: int = 6,
+        busy_timeout_seconds: float = 30.0,
+        lazy_purge: bool = True,
+    ) -> None:
+        super().__init__(ttl_seconds=ttl_seconds, clock=clock, lazy_purge=lazy_purge)
+        if not 0 <= compression_level <= 9:
+            raise ValueError("compression_level must be between 0 and 9")
+        if busy_timeout_seconds <= 0:
+            raise ValueError("busy_timeout_seconds must be > 0")
+        self._path = Path(path).resolve()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._compression_level = compression_level
+        self._busy_timeout_seconds = busy_timeout_seconds
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+        self._batch_depth = 0
+        with self._lock:
+            self._connect_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
+
+    @contextmanager
+    def batch(self, *, write: bool = True) -> Iterator[None]:
+        """Run the enclosed operations in one transaction.
+
+        ``write=False`` declares that the batch only loads. Without lazy purge
+        it then opens a deferred transaction so other writers are not locked
+        out; with lazy purge every load may delete rows, so the write lock is
+        still taken up front.
+        """
+
+        with self._lock:
+            connection = self._connect_locked()
+            if self._batch_depth == 0:
+                immediate = write or self._lazy_purge
+                connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            self._batch_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    connection.rollback()
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                connection.commit()
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if self._connection is not None and self._connection_pid == pid:
+            return self._connection
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "id TEXT PRIMARY KEY, expires_at REAL NOT NULL, state BLOB NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS checkpoints_expires_at ON checkpoints (expires_at)"
+        )
+        self._connection = connection
+        self._connection_pid = pid
+        return connection
+
+    def _write_checkpoint_locked(self, checkpoint_id: str, stored: _StoredCheckpoint) -> None:
+        blob = zlib.compress(
+            pickle.dumps(stored.state, protocol=pickle.HIGHEST_PROTOCOL),
+            self._compression_level,
+        )
+        self._connect_locked().execute(
+            "INSERT OR REPLACE INTO checkpoints (id, expires_at, state) VALUES (?, ?, ?)",
+            (checkpoint_id, stored.expires_at, blob),
+        )
+
+    def _read_checkpoint_locked(self, checkpoint_id: str) -> _StoredCheckpoint | None:
+        row = self._connect_locked().execute(
+            "SELECT expires_at, state FROM checkpoints WHERE id = ?",
+            (checkpoint_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        expires_at, blob = row
+        try:
+            state = pickle.loads(zlib.decompress(blob))
+        except (zlib.error, pickle.PickleError, EOFError, TypeError, ValueError):
+            logger.warning("corrupt checkpoint removed checkpoint_id=%s", checkpoint_id)
+            self._delete_checkpoint_locked(checkpoint_id)
+            return None
+        if not isinstance(state, dict):
+            logger.warning("invalid checkpoint payload removed checkpoint_id=%s", checkpoint_id)
+            self._delete_checkpoint_locked(checkpoint_id)
+            return None
+        return _StoredCheckpoint(expires_at=expires_at, state=state)
+
+    def _delete_checkpoint_locked(self, checkpoint_id: str) -> bool:
+        cursor = self._connect_locked().execute(
+            "DELETE FROM checkpoints WHERE id = ?",
+            (checkpoint_id,),
+        )
+        return cursor.rowcount > 0
+
+    def _purge_expired_locked(self, now: float, *, skip_id: str | None = None) -> int:
+        cursor = self._connect_locked().execute(
+            "DELETE FROM checkpoints WHERE expires_at <= ? AND id IS NOT ?",
+            (now, skip_id),
+        )
+        return cursor.rowcount
+
+
 __all__ = [
     "DEFAULT_CHECKPOINT_TTL_SECONDS",
     "validate_checkpoint_id",
     "CheckpointStore",
     "MemoryCheckpointStore",
     "FileCheckpointStore",
+    "SqliteCheckpointStore",
+    "snapshot_state",
 ]
 
@@ -0,0 +1,89 @@
+"""Background expiry sweeper for checkpoint stores."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from types import TracebackType
+from typing import Protocol
+
+logger = logging.getLogger("boj_api_client")
+
+
+class SupportsPurgeExpired(Protocol):
+    def purge_expired(self) -> int:
+        """Delete expired checkpoints and return how many were removed."""
+
+
+class CheckpointSweeper:
+    """Call ``store.purge_expired()`` every ``interval_seconds`` on a daemon thread.
+
+    Pair it with a store built with ``lazy_purge=False`` so that save/load/delete
+    no longer pay for expiry cleanup.
+    """
+
+    def __init__(self, store: SupportsPurgeExpired, *, interval_seconds: float) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self._store = store
+        self._interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> "CheckpointSweeper":
+        with self._thread_lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="boj-checkpoint-sweeper",
+                    daemon=True,
+                )
+                self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._stopped.set()
+            thread.join()
+
+    def sweep(self) -> int:
+        """Run one purge now; failures are logged and count as zero removals."""
+
+        try:
+            removed = self._store.purge_expired()
+        except Exception:
+            logger.warning("checkpoint sweep failed", exc_info=True)
+            return 0
+        if removed:
+            logger.debug("checkpoint sweep removed=%s", removed)
+        return removed
+
+    def __enter__(self) -> "CheckpointSweeper":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            self.sweep()
+
+
+__all__ = [
+    "CheckpointSweeper",
+    "SupportsPurgeExpired",
+]
@@ -0,0 +1,129 @@
+"""Per-endpoint circuit breaker shared by sync/async transports."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .errors import BojUnavailableError
+
+logger = logging.getLogger("boj_api_client")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class _EndpointCircuit:
+    state: str = CIRCUIT_CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probe_started_at: float | None = None
+
+
+class CircuitBreaker:
+    """Fail fast on endpoints that keep failing transiently.
+
+    After ``failure_threshold`` consecutive transient failures an endpoint opens
+    and requests raise ``BojUnavailableError(cause="circuit_open")`` without
+    touching the network. Once ``recovery_timeout_seconds`` has elapsed a single
+    half-open probe is let through; its outcome closes or re-opens the circuit.
+    The breaker holds no awaitable state, so one instance serves both transports.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        recovery_timeout_seconds: float,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if recovery_timeout_seconds < 0:
+            raise ValueError("recovery_timeout_seconds must be >= 0")
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout_seconds = recovery_timeout_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _EndpointCircuit] = {}
+
+    def state(self, endpoint: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CIRCUIT_CLOSED
+
+    def before_request(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.state == CIRCUIT_CLOSED:
+                return
+            now = self._clock()
+            if circuit.state == CIRCUIT_OPEN:
+                if now - circuit.opened_at < self._recovery_timeout_seconds:
+                    raise self._open_error(endpoint)
+                circuit.state = CIRCUIT_HALF_OPEN
+                circuit.probe_started_at = None
+            # A probe abandoned without an outcome (e.g. a cancelled task) expires
+            # after one recovery period so the circuit cannot stay wedged.
+            if (
+                circuit.probe_started_at is not None
+                and now - circuit.probe_started_at < self._recovery_timeout_seconds
+            ):
+                raise self._open_error(endpoint)
+            circuit.probe_started_at = now
+        logger.info("circuit half-open probe endpoint=%s", endpoint)
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return
+            if circuit.state != CIRCUIT_CLOSED:
+                logger.info("circuit closed endpoint=%s", endpoint)
+            del self._circuits[endpoint]
+
+    def release_probe(self, endpoint: str) -> None:
+        """Forget an attempt that ended without an outcome (e.g. the caller's deadline)."""
+
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state == CIRCUIT_HALF_OPEN:
+                circuit.probe_started_at = None
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _EndpointCircuit())
+            circuit.consecutive_failures += 1
+            if (
+                circuit.state == CIRCUIT_HALF_OPEN
+                or circuit.consecutive_failures >= self._failure_threshold
+            ):
+                if circuit.state != CIRCUIT_OPEN:
+                    logger.warning(
+                        "circuit opened endpoint=%s consecutive_failures=%s",
+                        endpoint,
+                        circuit.consecutive_failures,
+                    )
+                circuit.state = CIRCUIT_OPEN
+                circuit.opened_at = self._clock()
+                circuit.probe_started_at = None
+
+    @staticmethod
+    def _open_error(endpoint: str) -> BojUnavailableError:
+        return BojUnavailableError(
+            f"circuit open for endpoint {endpoint}",
+            cause="circuit_open",
+        )
+
+
+__all__ = [
+    "CIRCUIT_CLOSED",
+    "CIRCUIT_HALF_OPEN",
+    "CIRCUIT_OPEN",
+    "CircuitBreaker",
+]
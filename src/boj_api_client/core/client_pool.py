@@ -0,0 +1,129 @@
+"""Process-level pool of shared ``httpx.Client`` instances."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+from ..config import BojClientConfig
+from .transport_shared import build_http_client_options, http_client_pool_key
+
+logger = logging.getLogger("boj_api_client")
+DEFAULT_IDLE_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _PoolEntry:
+    client: httpx.Client
+    refcount: int
+    idle_since: float | None = None
+
+
+class SharedClientPool:
+    """Reference-counted ``httpx.Client`` registry keyed by connection settings.
+
+    Short-lived transports that acquire from the same pool reuse warm keep-alive
+    connections. A client whose last lease is released stays pooled for
+    ``idle_timeout_seconds`` so the next transport created in sequence picks it
+    up; idle clients past the timeout are closed on the next acquire/release,
+    and :meth:`close` closes everything.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: Callable[[BojClientConfig], httpx.Client] | None = None,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if idle_timeout_seconds < 0:
+            raise ValueError("idle_timeout_seconds must be >= 0")
+        self._factory = factory or _default_factory
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[object, ...], _PoolEntry] = {}
+
+    def acquire(self, config: BojClientConfig) -> httpx.Client:
+        key = http_client_pool_key(config)
+        with self._lock:
+            expired = self._pop_expired_locked()
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _PoolEntry(client=self._factory(config), refcount=0)
+                self._entries[key] = entry
+                logger.debug("shared http client created base_url=%s", key[0])
+            entry.refcount += 1
+            entry.idle_since = None
+            client = entry.client
+        _close_entries(expired)
+        return client
+
+    def release(self, client: httpx.Client) -> None:
+        with self._lock:
+            key = self._find_key(client)
+            if key is None:
+                return
+            entry = self._entries[key]
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            entry.idle_since = self._clock()
+            expired = self._pop_expired_locked()
+        _close_entries(expired)
+
+    def close(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.client.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _find_key(self, client: httpx.Client) -> tuple[object, ...] | None:
+        for key, entry in self._entries.items():
+            if entry.client is client:
+                return key
+        return None
+
+    def _pop_expired_locked(self) -> list[tuple[tuple[object, ...], _PoolEntry]]:
+        now = self._clock()
+        expired = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.idle_since is not None
+            and now - entry.idle_since >= self._idle_timeout_seconds
+        ]
+        for key, _ in expired:
+            del self._entries[key]
+        return expired
+
+
+def _close_entries(expired: list[tuple[tuple[object, ...], _PoolEntry]]) -> None:
+    for key, entry in expired:
+        logger.debug("shared http client closed base_url=%s", key[0])
+        entry.client.close()
+
+
+def _default_factory(config: BojClientConfig) -> httpx.Client:
+    return httpx.Client(**build_http_client_options(config))  # type: ignore[arg-type]
+
+
+DEFAULT_CLIENT_POOL = SharedClientPool()
+atexit.register(DEFAULT_CLIENT_POOL.close)
+
+
+__all__ = [
+    "DEFAULT_CLIENT_POOL",
+    "DEFAULT_IDLE_TIMEOUT_SECONDS",
+    "SharedClientPool",
+]
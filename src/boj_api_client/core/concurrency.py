@@ -0,0 +1,46 @@
+"""Bounded fan-out helpers for independent request units."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def gather_bounded(
+    tasks: Sequence[Callable[[], T]],
+    *,
+    max_concurrency: int,
+) -> list[T | Exception]:
+    """Run tasks on worker threads and return outcomes in input order.
+
+    Exceptions raised by a task are returned in its slot instead of being raised,
+    so callers can aggregate partial progress.
+    """
+
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    if max_concurrency == 1 or len(tasks) <= 1:
+        return [_capture(task) for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(tasks))) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _capture, task)
+            for task in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def _capture(task: Callable[[], T]) -> T | Exception:
+    try:
+        return task()
+    except Exception as exc:
+        return exc
+
+
+__all__ = [
+    "gather_bounded",
+]
@@ -0,0 +1,126 @@
+"""Job-scoped state shared by every request of one high-level call."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class RetryBudget:
+    """Thread-safe pool of retry tokens shared by all requests of one job."""
+
+    def __init__(self, tokens: int) -> None:
+        if tokens < 0:
+            raise ValueError("tokens must be >= 0")
+        self._remaining = tokens
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self._remaining
+
+    def try_consume(self) -> bool:
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
+_current_retry_budget: ContextVar[RetryBudget | None] = ContextVar(
+    "boj_api_client_retry_budget",
+    default=None,
+)
+
+
+def current_retry_budget() -> RetryBudget | None:
+    return _current_retry_budget.get()
+
+
+@contextmanager
+def retry_budget_scope(tokens: int | None) -> Iterator[RetryBudget | None]:
+    """Install a fresh job budget for the duration of the block.
+
+    An enclosing budget wins, so nested service calls (e.g. ``get_data_layer``
+    falling back to ``get_data_code``) draw from the outer job. ``None``
+    installs nothing. Worker threads and tasks started inside the block inherit
+    the budget through context copying.
+    """
+
+    enclosing = current_retry_budget()
+    if tokens is None or enclosing is not None:
+        yield enclosing
+        return
+    budget = RetryBudget(tokens)
+    token = _current_retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_retry_budget.reset(token)
+
+
+class JobDeadline:
+    """Absolute point in time by which every request of one job must finish."""
+
+    def __init__(self, seconds: float, *, clock: Callable[[], float] | None = None) -> None:
+        if seconds < 0:
+            raise ValueError("seconds must be >= 0")
+        self._clock = clock or time.monotonic
+        self._expires_at = self._clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+_current_deadline: ContextVar[JobDeadline | None] = ContextVar(
+    "boj_api_client_deadline",
+    default=None,
+)
+
+
+def current_deadline() -> JobDeadline | None:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(
+    seconds: float | None,
+    *,
+    clock: Callable[[], float] | None = None,
+) -> Iterator[JobDeadline | None]:
+    """Install a job deadline ``seconds`` from now for the duration of the block.
+
+    When an enclosing deadline is already installed, the earlier of the two
+    wins. ``None`` installs nothing.
+    """
+
+    enclosing = current_deadline()
+    if seconds is None:
+        yield enclosing
+        return
+    deadline = JobDeadline(seconds, clock=clock)
+    if enclosing is not None and enclosing.remaining() <= deadline.remaining():
+        yield enclosing
+        return
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+__all__ = [
+    "JobDeadline",
+    "RetryBudget",
+    "current_deadline",
+    "current_retry_budget",
+    "deadline_scope",
+    "retry_budget_scope",
+]
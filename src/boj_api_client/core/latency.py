@@ -0,0 +1,47 @@
+"""Rolling per-endpoint latency samples."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Keeps the most recent ``window`` latencies per endpoint."""
+
+    def __init__(self, *, window: int = 200) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self._window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                self._samples[endpoint] = samples
+            samples.append(max(0.0, seconds))
+
+    def sample_count(self, endpoint: str) -> int:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            return len(samples) if samples is not None else 0
+
+    def percentile(self, endpoint: str, fraction: float) -> float | None:
+        """Nearest-rank percentile (``fraction`` in (0, 1]); ``None`` without samples."""
+
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if not samples:
+                return None
+            ordered = sorted(samples)
+        rank = max(1, math.ceil(fraction * len(ordered)))
+        return ordered[rank - 1]
+
+
+__all__ = [
+    "LatencyTracker",
+]
@@ -0,0 +1,31 @@
+"""CPU offload helpers (sync counterpart: always runs inline)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def run_offloaded(
+    call: Callable[[], T],
+    *,
+    offload: bool,
+    executor: Executor | None = None,
+) -> T:
+    """Run ``call`` inline, or on ``executor`` when ``offload`` is set.
+
+    A blocking caller gains nothing from a thread hop, so without an explicit
+    executor the work always runs inline.
+    """
+
+    if not offload or executor is None:
+        return call()
+    return executor.submit(call).result()
+
+
+__all__ = [
+    "run_offloaded",
+]
@@ -0,0 +1,98 @@
+"""Bounded prefetch pipeline for paged responses."""
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+_POLL_INTERVAL_SECONDS = 0.1
+_END = object()
+
+
+@dataclass(slots=True, frozen=True)
+class _Failure:
+    error: BaseException
+
+
+def prefetch_map(
+    source: Iterator[P],
+    transform: Callable[[P], R],
+    *,
+    depth: int,
+) -> Iterator[R]:
+    """Yield ``transform(item)`` for each source item, prefetching up to ``depth`` items.
+
+    The source is owned by the pipeline and closed when iteration stops.
+    With ``depth > 0`` it is drained on a worker thread into a bounded
+    queue, so the next request is in flight while the caller transforms and
+    consumes the current one. ``depth == 0`` keeps the fully lazy behaviour.
+    """
+
+    if depth < 0:
+        raise ValueError("depth must be >= 0")
+    if depth == 0:
+        try:
+            for item in source:
+                yield transform(item)
+        finally:
+            _close_source(source)
+        return
+
+    buffer: queue.Queue[object] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in source:
+                if not _put(item):
+                    return
+            _put(_END)
+        except BaseException as exc:
+            _put(_Failure(exc))
+        finally:
+            _close_source(source)
+
+    worker = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(_produce,),
+        name="boj-prefetch",
+        daemon=True,
+    )
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield transform(item)  # type: ignore[arg-type]
+    finally:
+        stop.set()
+
+
+def _close_source(source: Iterator[object]) -> None:
+    close = getattr(source, "close", None)
+    if callable(close):
+        close()
+
+
+__all__ = [
+    "prefetch_map",
+]
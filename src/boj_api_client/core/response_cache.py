@@ -0,0 +1,332 @@
+"""In-process cache of successful API payloads with revalidation.
+
+Entries are fresh for ``ttl_seconds``. A stale entry is revalidated before it
+is downloaded again:
+
+- with ``ETag`` / ``Last-Modified`` validators, the transport sends a
+  conditional request and a ``304`` keeps the cached payload;
+- otherwise a ``getMetadata`` response observed after the entry was stored
+  confirms it when no cached series has a newer ``LAST_UPDATE`` (series
+  without one are compared against the day of the payload's ``DATE``).
+
+Within ``stale_while_revalidate_seconds`` after expiry, metadata entries and
+complete single-page ``getDataCode`` entries are served as-is while the
+transport refreshes them in the background;
+:meth:`ResponseCache.try_begin_refresh` dedupes concurrent refreshes of one
+key.
+
+"No data" payloads (``MESSAGEID`` ``M181030I``) use ``negative_ttl_seconds``
+instead of ``ttl_seconds`` and are never revalidated, so repeated empty
+lookups cost nothing until the short TTL runs out. ``ttl_seconds=0`` keeps
+only these negative entries.
+
+Metadata responses also evict entries whose series were updated since they
+were cached. Cached payloads are shared between callers and must be treated
+as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+
+METADATA_ENDPOINT = "getMetadata"
+NO_DATA_MESSAGE_ID = "M181030I"
+# Paged answers are excluded: a refreshed page can shift NEXTPOSITION under a
+# caller that is still walking the stale pages, so getDataCode qualifies only
+# when one page holds the whole answer.
+STALE_WHILE_REVALIDATE_ENDPOINTS = frozenset({METADATA_ENDPOINT, "getDataCode"})
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResponse:
+    payload: dict[str, object]
+    stored_at: float
+    db: str
+    etag: str | None = None
+    last_modified: str | None = None
+    payload_date: str | None = None
+    series_last_update: Mapping[str, str] | None = None
+    negative: bool = False
+    serves_stale: bool = False
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def is_current(self, code: str, observed_last_update: str) -> bool:
+        """Return whether ``observed_last_update`` from metadata is already cached."""
+
+        cached_update = (self.series_last_update or {}).get(code, "")
+        if cached_update:
+            return observed_last_update <= cached_update
+        as_of = _as_of_day(self.payload_date)
+        return as_of is not None and observed_last_update < as_of
+
+
+@dataclass(slots=True, frozen=True)
+class CacheLookup:
+    """Outcome of :meth:`ResponseCache.lookup` for one request."""
+
+    key: CacheKey
+    entry: CachedResponse | None
+    payload: dict[str, object] | None
+    request_headers: Mapping[str, str]
+    stale: bool = False
+
+
+class ResponseCache:
+    """Thread-safe LRU of successful payloads keyed by endpoint and params."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        ttl_seconds: float = 300.0,
+        stale_while_revalidate_seconds: float = 0.0,
+        negative_ttl_seconds: float | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be >= 0")
+        if stale_while_revalidate_seconds < 0:
+            raise ValueError("stale_while_revalidate_seconds must be >= 0")
+        if negative_ttl_seconds is not None and negative_ttl_seconds < 0:
+            raise ValueError("negative_ttl_seconds must be None or >= 0")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_while_revalidate_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._observed_last_update: dict[tuple[str, str], tuple[str, float]] = {}
+        self._refreshing: set[CacheKey] = set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._observed_last_update.clear()
+
+    def lookup(self, endpoint: str, params: Mapping[str, str]) -> CacheLookup:
+        key = response_cache_key(endpoint, params)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return CacheLookup(key=key, entry=None, payload=None, request_headers={})
+            self._entries.move_to_end(key)
+            if entry.negative:
+                if now - entry.stored_at < (self._negative_ttl_seconds or 0.0):
+                    return CacheLookup(key=key, entry=entry, payload=entry.payload, request_headers={})
+                del self._entries[key]
+                return CacheLookup(key=key, entry=None, payload=None, request_headers={})
+            if now - entry.stored_at < self._ttl_seconds:
+                return CacheLookup(key=key, entry=entry, payload=entry.payload, request_headers={})
+            if not entry.has_validators and self._confirmed_by_metadata(entry):
+                entry = replace(entry, stored_at=now)
+                self._entries[key] = entry
+                return CacheLookup(key=key, entry=entry, payload=entry.payload, request_headers={})
+        stale = (
+            entry.serves_stale
+            and now - entry.stored_at < self._ttl_seconds + self._stale_seconds
+        )
+        return CacheLookup(
+            key=key,
+            entry=entry,
+            payload=entry.payload if stale else None,
+            request_headers=conditional_request_headers(entry),
+            stale=stale,
+        )
+
+    @property
+    def _caches_positive(self) -> bool:
+        return self._ttl_seconds > 0 or self._stale_seconds > 0
+
+    def try_begin_refresh(self, key: CacheKey) -> bool:
+        """Claim the background refresh of ``key``; False if one is in flight."""
+
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key: CacheKey) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def store(
+        self,
+        lookup: CacheLookup,
+        payload: dict[str, object],
+        *,
+        headers: object = None,
+    ) -> None:
+        endpoint, params = lookup.key
+        now = self._clock()
+        db = str(dict(params).get("db", "")).upper()
+        is_metadata = endpoint == METADATA_ENDPOINT
+        negative = (
+            self._negative_ttl_seconds is not None
+            and payload.get("MESSAGEID") == NO_DATA_MESSAGE_ID
+        )
+        entry = CachedResponse(
+            payload=payload,
+            stored_at=now,
+            db=db,
+            etag=_header(headers, "ETag"),
+            last_modified=_header(headers, "Last-Modified"),
+            payload_date=_string_or_none(payload.get("DATE")),
+            series_last_update=None if is_metadata else _series_last_update(payload),
+            negative=negative,
+            serves_stale=_serves_stale(endpoint, params, payload),
+        )
+        with self._lock:
+            if negative or self._caches_positive:
+                self._entries[lookup.key] = entry
+                self._entries.move_to_end(lookup.key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            if is_metadata:
+                self._observe_metadata(db, payload, observed_at=now)
+
+    def mark_not_modified(self, lookup: CacheLookup, *, headers: object = None) -> dict[str, object]:
+        """Refresh a revalidated entry after ``304 Not Modified`` and return its payload."""
+
+        entry = lookup.entry
+        if entry is None:
+            raise ValueError("lookup has no cached entry to revalidate")
+        refreshed = replace(
+            entry,
+            stored_at=self._clock(),
+            etag=_header(headers, "ETag") or entry.etag,
+            last_modified=_header(headers, "Last-Modified") or entry.last_modified,
+        )
+        with self._lock:
+            self._entries[lookup.key] = refreshed
+        return refreshed.payload
+
+    def _confirmed_by_metadata(self, entry: CachedResponse) -> bool:
+        if not entry.series_last_update:
+            return False
+        for code in entry.series_last_update:
+            observed = self._observed_last_update.get((entry.db, code))
+            if observed is None:
+                return False
+            last_update, observed_at = observed
+            if observed_at <= entry.stored_at or not entry.is_current(code, last_update):
+                return False
+        return True
+
+    def _observe_metadata(self, db: str, payload: Mapping[str, object], *, observed_at: float) -> None:
+        updates = {
+            code: last_update
+            for code, last_update in _series_last_update(payload).items()
+            if last_update
+        }
+        for code, last_update in updates.items():
+            self._observed_last_update[(db, code)] = (last_update, observed_at)
+        outdated = [
+            key
+            for key, entry in self._entries.items()
+            if entry.db == db
+            and entry.series_last_update
+            and any(
+                code in updates and not entry.is_current(code, updates[code])
+                for code in entry.series_last_update
+            )
+        ]
+        for key in outdated:
+            del self._entries[key]
+
+
+def _serves_stale(
+    endpoint: str,
+    params: tuple[tuple[str, str], ...],
+    payload: Mapping[str, object],
+) -> bool:
+    if endpoint not in STALE_WHILE_REVALIDATE_ENDPOINTS:
+        return False
+    if endpoint == METADATA_ENDPOINT:
+        return True
+    next_position = payload.get("NEXTPOSITION")
+    is_last_page = next_position is None or (
+        isinstance(next_position, str) and not next_position.strip()
+    )
+    return is_last_page and "startPosition" not in dict(params)
+
+
+def response_cache_key(endpoint: str, params: Mapping[str, str]) -> CacheKey:
+    return endpoint.lstrip("/"), tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+
+def conditional_request_headers(entry: CachedResponse) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def _series_last_update(payload: Mapping[str, object]) -> dict[str, str]:
+    resultset = payload.get("RESULTSET")
+    if not isinstance(resultset, list):
+        return {}
+    updates: dict[str, str] = {}
+    for item in resultset:
+        if not isinstance(item, Mapping):
+            continue
+        code = item.get("SERIES_CODE")
+        if isinstance(code, str) and code:
+            updates[code] = _string_or_none(item.get("LAST_UPDATE")) or ""
+    return updates
+
+
+def _as_of_day(payload_date: str | None) -> str | None:
+    """Return ``YYYYMMDD`` from a payload ``DATE`` such as ``2026-02-19T9:00:06+09:00``."""
+
+    if payload_date is None or len(payload_date) < 10:
+        return None
+    day = payload_date[:10].replace("-", "")
+    return day if len(day) == 8 and day.isdigit() else None
+
+
+def _header(headers: object, name: str) -> str | None:
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value if isinstance(value, str) and value else None
+
+
+def _string_or_none(value: object) -> str | None:
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+__all__ = [
+    "CacheKey",
+    "CacheLookup",
+    "CachedResponse",
+    "METADATA_ENDPOINT",
+    "NO_DATA_MESSAGE_ID",
+    "ResponseCache",
+    "STALE_WHILE_REVALIDATE_ENDPOINTS",
+    "conditional_request_headers",
+    "response_cache_key",
+]
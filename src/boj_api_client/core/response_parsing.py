@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Mapping
 from typing import Protocol
 
@@ -31,7 +32,33 @@ def parse_json_payload(
         payload = response.json()
     except Exception as exc:
         raise _json_parse_error(http_status=http_status) from exc
+    return _ensure_json_object(payload, http_status=http_status)
 
+
+def decode_json_payload(
+    content: bytes,
+    *,
+    http_status: int | None,
+) -> dict[str, object]:
+    """Decode a raw response body; picklable counterpart of ``parse_json_payload``."""
+
+    try:
+        payload = json.loads(content)
+    except Exception as exc:
+        raise _json_parse_error(http_status=http_status) from exc
+    return _ensure_json_object(payload, http_status=http_status)
+
+
+def response_body_size(response: object) -> int | None:
+    """Return decoded body size in bytes when the response exposes ``content``."""
+
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return None
+
+
+def _ensure_json_object(payload: object, *, http_status: int | None) -> dict[str, object]:
     if not isinstance(payload, dict):
         raise BojProtocolError(
             "response JSON root must be an object",
@@ -83,5 +110,7 @@ def _json_parse_error(*, http_status: int | None) -> BojApiError:
 
 __all__ = [
     "parse_json_payload",
+    "decode_json_payload",
+    "response_body_size",
     "classify_payload_outcome",
 ]
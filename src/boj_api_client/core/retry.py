@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import random
-from typing import Callable
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
 
+from ..config import RetryConfig, RetryRule
+from .job_context import current_retry_budget
 
-def is_retryable_api_status(status: int | None) -> bool:
-    return status in {500, 503}
+
+RETRY_AFTER_STATUSES = frozenset({429, 503})
 
 
 def next_backoff_seconds(
@@ -15,13 +19,14 @@ def next_backoff_seconds(
     attempt_index: int,
     max_backoff_seconds: float,
     rng: random.Random | None = None,
+    base_seconds: float = 1.0,
 ) -> float:
     """Exponential backoff with small jitter.
 
     attempt_index: 0-based retry index.
     """
 
-    base = min(max_backoff_seconds, float(2**attempt_index))
+    base = min(max_backoff_seconds, base_seconds * float(2**attempt_index))
     if base <= 0:
         return 0.0
     source = rng or random
@@ -42,8 +47,221 @@ def can_retry(
     return (now - started_at) <= total_budget_seconds
 
 
+def decorrelated_backoff_seconds(
+    *,
+    previous_delay: float,
+    base_seconds: float,
+    max_backoff_seconds: float,
+    rng: random.Random | None = None,
+) -> float:
+    """Decorrelated jitter: ``min(cap, uniform(base, previous * 3))``.
+
+    Successive delays of concurrent callers drift apart instead of retrying in
+    lockstep, which avoids synchronized retry storms after a shared outage.
+    """
+
+    if max_backoff_seconds <= 0:
+        return 0.0
+    source = rng or random
+    upper = max(base_seconds, previous_delay * 3.0)
+    return min(max_backoff_seconds, source.uniform(base_seconds, upper))
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+
+    if value is None:
+        return None
+    text = value.strip()
+    if text.isdigit():
+        return float(text)
+    try:
+        retry_at = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - current)
+
+
+def response_retry_after_seconds(response: object) -> float | None:
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After")
+    return parse_retry_after(value if isinstance(value, str) else None)
+
+
+def retry_after_for_response(
+    response: object,
+    *,
+    http_status: int | None,
+    status: int | None,
+) -> float | None:
+    """``Retry-After`` of a throttled (429) or unavailable (503) answer.
+
+    Either the HTTP status or the API ``STATUS`` may carry the signal; the
+    header is read from the response itself, so non-JSON bodies count too.
+    """
+
+    if http_status in RETRY_AFTER_STATUSES or status in RETRY_AFTER_STATUSES:
+        return response_retry_after_seconds(response)
+    return None
+
+
+class RetryPolicy:
+    """Decides whether a failed attempt is retried and how long to wait.
+
+    Rules from ``RetryConfig.rules`` are matched first (first match wins);
+    otherwise API statuses in ``retryable_statuses`` and every transport
+    exception are retryable. When a job budget is installed via
+    ``job_context.retry_budget_scope`` each granted retry consumes a token.
+    """
+
+    def __init__(self, config: RetryConfig) -> None:
+        self._config = config
+
+    @property
+    def config(self) -> RetryConfig:
+        return self._config
+
+    def should_retry_status(
+        self,
+        status: int | None,
+        *,
+        attempt: int,
+        started_at: float,
+        now: float,
+    ) -> bool:
+        rule = self._match_status(status)
+        if rule is None:
+            if not is_retryable_status(status, self._config.retryable_statuses):
+                return False
+            return self._grant(attempt=attempt, started_at=started_at, now=now, max_attempts=None)
+        if not rule.retry:
+            return False
+        return self._grant(
+            attempt=attempt,
+            started_at=started_at,
+            now=now,
+            max_attempts=rule.max_attempts,
+        )
+
+    def should_retry_exception(
+        self,
+        exc: BaseException,
+        *,
+        attempt: int,
+        started_at: float,
+        now: float,
+    ) -> bool:
+        rule = self._match_exception(exc)
+        if rule is not None and not rule.retry:
+            return False
+        return self._grant(
+            attempt=attempt,
+            started_at=started_at,
+            now=now,
+            max_attempts=rule.max_attempts if rule is not None else None,
+        )
+
+    def backoff_seconds(
+        self,
+        *,
+        attempt: int,
+        previous_delay: float,
+        rng: random.Random | None = None,
+        retry_after: float | None = None,
+    ) -> float:
+        """Delay before the next attempt.
+
+        ``retry_after`` raises the computed backoff and is honoured in full;
+        callers check :meth:`retry_after_fits` first so a wait that cannot
+        fit the remaining budget fails fast instead of retrying early.
+        """
+
+        config = self._config
+        if config.jitter == "decorrelated":
+            delay = decorrelated_backoff_seconds(
+                previous_delay=previous_delay,
+                base_seconds=config.base_backoff_seconds,
+                max_backoff_seconds=config.max_backoff_seconds,
+                rng=rng,
+            )
+        else:
+            delay = next_backoff_seconds(
+                attempt_index=attempt - 1,
+                max_backoff_seconds=config.max_backoff_seconds,
+                rng=rng,
+                base_seconds=config.base_backoff_seconds,
+            )
+        if retry_after is not None and config.respect_retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    def retry_after_fits(
+        self,
+        retry_after: float | None,
+        *,
+        started_at: float,
+        now: float,
+        deadline_remaining: float | None = None,
+    ) -> bool:
+        """Whether waiting ``retry_after`` still leaves room for another attempt."""
+
+        if retry_after is None or not self._config.respect_retry_after:
+            return True
+        if now - started_at + retry_after > self._config.total_retry_budget_seconds:
+            return False
+        return deadline_remaining is None or retry_after < deadline_remaining
+
+    def _grant(
+        self,
+        *,
+        attempt: int,
+        started_at: float,
+        now: float,
+        max_attempts: int | None,
+    ) -> bool:
+        if not can_retry(
+            attempt=attempt,
+            max_attempts=max_attempts or self._config.max_attempts,
+            started_at=started_at,
+            now=now,
+            total_budget_seconds=self._config.total_retry_budget_seconds,
+        ):
+            return False
+        budget = current_retry_budget()
+        return budget is None or budget.try_consume()
+
+    def _match_status(self, status: int | None) -> RetryRule | None:
+        if status is None:
+            return None
+        for rule in self._config.rules:
+            if status in rule.statuses:
+                return rule
+        return None
+
+    def _match_exception(self, exc: BaseException) -> RetryRule | None:
+        for rule in self._config.rules:
+            if rule.exceptions and isinstance(exc, rule.exceptions):
+                return rule
+        return None
+
+
+def is_retryable_status(status: int | None, retryable_statuses: tuple[int, ...]) -> bool:
+    return status is not None and status in retryable_statuses
+
+
 __all__ = [
-    "is_retryable_api_status",
+    "RETRY_AFTER_STATUSES",
+    "RetryPolicy",
+    "is_retryable_status",
     "next_backoff_seconds",
+    "decorrelated_backoff_seconds",
+    "parse_retry_after",
+    "response_retry_after_seconds",
+    "retry_after_for_response",
     "can_retry",
 ]
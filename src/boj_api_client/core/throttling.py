@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Callable
 
 
 class MinIntervalThrottler:
-    """Ensures minimum interval between outbound requests."""
+    """Ensures minimum interval between outbound requests.
+
+    Slots are reserved under a lock so concurrent callers are spaced out
+    instead of all observing the same last request timestamp.
+    """
 
     def __init__(
         self,
@@ -20,19 +25,22 @@ class MinIntervalThrottler:
         self._clock = clock or time.monotonic
         self._sleep = sleeper or time.sleep
         self._last_request_at: float | None = None
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
-        now = self._clock()
-        if self._last_request_at is not None:
-            elapsed = now - self._last_request_at
-            remaining = self._min_interval_seconds - elapsed
-            if remaining > 0:
-                self._sleep(remaining)
-                now = self._clock()
-        self._last_request_at = now
+        with self._lock:
+            now = self._clock()
+            scheduled_at = now
+            if self._last_request_at is not None:
+                scheduled_at = max(now, self._last_request_at + self._min_interval_seconds)
+            self._last_request_at = scheduled_at
+        remaining = scheduled_at - now
+        if remaining > 0:
+            self._sleep(remaining)
 
     def reset(self) -> None:
-        self._last_request_at = None
+        with self._lock:
+            self._last_request_at = None
 
 
 __all__ = [
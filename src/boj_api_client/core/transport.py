@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 import time
 from collections.abc import Callable, Mapping
 from typing import Protocol
@@ -11,6 +12,8 @@ from typing import Protocol
 import httpx
 
 from ..config import BojClientConfig
+from .circuit_breaker import CIRCUIT_OPEN, CircuitBreaker
+from .client_pool import DEFAULT_CLIENT_POOL, SharedClientPool
 from .errors import (
     BojProtocolError,
     BojServerError,
@@ -19,20 +22,26 @@ from .errors import (
     BojValidationError,
 )
 from .response_parsing import classify_payload_outcome, parse_json_payload
-from .retry import is_retryable_api_status
+from .response_cache import CacheLookup, ResponseCache
+from .retry import RETRY_AFTER_STATUSES, RetryPolicy, retry_after_for_response
 from .throttling import MinIntervalThrottler
+from .job_context import current_deadline
 from .transport_shared import (
-    build_default_headers,
-    build_default_timeout,
-    compute_backoff_seconds,
-    should_retry_attempt,
+    build_circuit_breaker,
+    build_http_client_options,
+    build_response_cache,
+    deadline_allows_retry,
+    deadline_exceeded_error,
+    deadline_request_options,
+    retry_after_exceeded_error,
+    with_request_headers,
 )
 
 logger = logging.getLogger("boj_api_client")
 
 
 class SyncTransportClient(Protocol):
-    def get(self, endpoint: str, params: Mapping[str, str]) -> object: ...
+    def get(self, endpoint: str, params: Mapping[str, str], **options: object) -> object: ...
     def close(self) -> None: ...
 
 
@@ -47,11 +56,18 @@ class SyncTransport:
         sleeper: Callable[[float], None] | None = None,
         clock: Callable[[], float] | None = None,
         rng: random.Random | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        client_pool: SharedClientPool | None = None,
     ) -> None:
         self._config = config
         self._sleep = sleeper or time.sleep
         self._clock = clock or time.monotonic
         self._rng = rng or random.Random()
+        self._retry_policy = retry_policy or RetryPolicy(config.retry)
+        self._circuit_breaker = circuit_breaker or build_circuit_breaker(config, clock=self._clock)
+        self._response_cache = response_cache or build_response_cache(config, clock=self._clock)
         self._closed = False
 
         self._throttler = MinIntervalThrottler(
@@ -60,62 +76,106 @@ class SyncTransport:
             sleeper=self._sleep,
         )
         self._owns_client = client is None
-        normalized_base_url = config.base_url.rstrip("/") + "/"
-        self._client = client or httpx.Client(
-            base_url=normalized_base_url,
-            headers=build_default_headers(config),
-            timeout=build_default_timeout(config),
-        )
+        self._client_pool: SharedClientPool | None = None
+        if client is None and (client_pool is not None or config.transport.share_connection_pool):
+            self._client_pool = DEFAULT_CLIENT_POOL if client_pool is None else client_pool
+            self._owns_client = False
+            client = self._client_pool.acquire(config)
+        self._client = client or httpx.Client(**build_http_client_options(config))
 
     def close(self) -> None:
         if self._closed:
             return
         self._closed = True
-        if self._owns_client and hasattr(self._client, "close"):
+        if self._client_pool is not None:
+            self._client_pool.release(self._client)  # type: ignore[arg-type]
+        elif self._owns_client and hasattr(self._client, "close"):
             self._client.close()
 
     def request(self, endpoint: str, *, params: Mapping[str, str]) -> dict[str, object]:
         if self._closed:
             raise BojTransportError("transport is already closed")
 
+        normalized_endpoint = self._normalize_endpoint(endpoint)
+        cache_lookup = None
+        if self._response_cache is not None:
+            cache_lookup = self._response_cache.lookup(normalized_endpoint, params)
+            if cache_lookup.payload is not None:
+                logger.debug(
+                    "response cache hit endpoint=%s stale=%s",
+                    normalized_endpoint,
+                    cache_lookup.stale,
+                )
+                if cache_lookup.stale:
+                    self._schedule_refresh(normalized_endpoint, params, cache_lookup)
+                return cache_lookup.payload
+        return self._fetch(normalized_endpoint, params, cache_lookup)
+
+    def _fetch(
+        self,
+        normalized_endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup | None,
+    ) -> dict[str, object]:
         started_at = self._clock()
         attempt = 0
-        normalized_endpoint = self._normalize_endpoint(endpoint)
+        previous_delay = 0.0
+        deadline = current_deadline()
 
         while True:
             attempt += 1
             logger.debug("request start endpoint=%s attempt=%s", normalized_endpoint, attempt)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request(normalized_endpoint)
             self._throttler.wait()
+            request_options = deadline_request_options(self._config, deadline)
+            if cache_lookup is not None:
+                request_options = with_request_headers(request_options, cache_lookup.request_headers)
 
             try:
-                response = self._client.get(normalized_endpoint, params=params)
+                response = self._client.get(normalized_endpoint, params=params, **request_options)
             except Exception as exc:
-                if should_retry_attempt(
-                    config=self._config,
-                    attempt=attempt,
-                    started_at=started_at,
-                    now=self._clock(),
+                out_of_time = deadline is not None and deadline.expired()
+                circuit_open = self._record_circuit_outcome(
+                    normalized_endpoint,
+                    transient=True,
+                    cut_short=out_of_time,
+                )
+                if (
+                    not out_of_time
+                    and not circuit_open
+                    and self._retry_policy.should_retry_exception(
+                        exc,
+                        attempt=attempt,
+                        started_at=started_at,
+                        now=self._clock(),
+                    )
                 ):
-                    logger.warning(
-                        "request network error; retrying endpoint=%s attempt=%s error=%s",
-                        normalized_endpoint,
-                        attempt,
-                        exc.__class__.__name__,
+                    previous_delay = self._retry_policy.backoff_seconds(
+                        attempt=attempt,
+                        previous_delay=previous_delay,
+                        rng=self._rng,
                     )
-                    self._sleep(
-                        compute_backoff_seconds(
-                            config=self._config,
-                            attempt=attempt,
-                            rng=self._rng,
+                    if deadline_allows_retry(deadline, previous_delay):
+                        logger.warning(
+                            "request network error; retrying endpoint=%s attempt=%s error=%s delay=%.3f",
+                            normalized_endpoint,
+                            attempt,
+                            exc.__class__.__name__,
+                            previous_delay,
                         )
-                    )
-                    continue
+                        self._sleep(previous_delay)
+                        continue
+                    out_of_time = True
                 logger.error(
-                    "request network error; giving up endpoint=%s attempt=%s error=%s",
+                    "request network error; giving up endpoint=%s attempt=%s error=%s deadline=%s",
                     normalized_endpoint,
                     attempt,
                     exc.__class__.__name__,
+                    out_of_time,
                 )
+                if out_of_time:
+                    raise deadline_exceeded_error() from exc
                 raise BojTransportError(
                     "network/transport error",
                     cause="network",
@@ -128,6 +188,27 @@ class SyncTransport:
                 attempt,
                 http_status,
             )
+            if deadline is not None and deadline.expired():
+                # httpx timeouts bound each phase separately, so a slowly
+                # trickling body can finish after the job deadline.
+                logger.error(
+                    "request overran job deadline endpoint=%s attempt=%s http_status=%s",
+                    normalized_endpoint,
+                    attempt,
+                    http_status,
+                )
+                raise deadline_exceeded_error()
+            if http_status == 304 and cache_lookup is not None and cache_lookup.entry is not None:
+                self._record_circuit_outcome(normalized_endpoint, transient=False)
+                logger.info(
+                    "request not modified endpoint=%s attempt=%s",
+                    normalized_endpoint,
+                    attempt,
+                )
+                return self._response_cache.mark_not_modified(  # type: ignore[union-attr]
+                    cache_lookup,
+                    headers=getattr(response, "headers", None),
+                )
             try:
                 payload = parse_json_payload(response, http_status=http_status)
             except (
@@ -135,17 +216,34 @@ class SyncTransport:
                 BojValidationError,
                 BojServerError,
                 BojUnavailableError,
-            ):
-                logger.error(
-                    "response parse error endpoint=%s attempt=%s http_status=%s",
-                    normalized_endpoint,
-                    attempt,
-                    http_status,
+            ) as exc:
+                if http_status not in RETRY_AFTER_STATUSES:
+                    self._record_circuit_outcome(
+                        normalized_endpoint,
+                        transient=isinstance(exc, (BojServerError, BojUnavailableError)),
+                    )
+                    logger.error(
+                        "response parse error endpoint=%s attempt=%s http_status=%s",
+                        normalized_endpoint,
+                        attempt,
+                        http_status,
+                    )
+                    raise
+                # Throttling proxies and maintenance pages often answer 429 /
+                # 503 with an HTML or empty body; retry on the HTTP status.
+                mapped_error, status = exc, http_status
+            else:
+                mapped_error, status = classify_payload_outcome(
+                    payload,
+                    http_status=http_status,
                 )
-                raise
-            mapped_error, status = classify_payload_outcome(
-                payload,
-                http_status=http_status,
+                if status is None:
+                    # A body without STATUS is judged by the HTTP status.
+                    status = http_status
+            circuit_open = self._record_circuit_outcome(
+                normalized_endpoint,
+                transient=mapped_error is not None
+                and status in self._retry_policy.config.retryable_statuses,
             )
             if mapped_error is None:
                 logger.info(
@@ -153,31 +251,63 @@ class SyncTransport:
                     normalized_endpoint,
                     attempt,
                 )
+                if cache_lookup is not None:
+                    self._response_cache.store(  # type: ignore[union-attr]
+                        cache_lookup,
+                        payload,
+                        headers=getattr(response, "headers", None),
+                    )
                 return payload
 
-            if (
-                is_retryable_api_status(status)
-                and should_retry_attempt(
-                    config=self._config,
-                    attempt=attempt,
+            if not circuit_open and self._retry_policy.should_retry_status(
+                status,
+                attempt=attempt,
+                started_at=started_at,
+                now=self._clock(),
+            ):
+                retry_after = retry_after_for_response(
+                    response,
+                    http_status=http_status,
+                    status=status,
+                )
+                if not self._retry_policy.retry_after_fits(
+                    retry_after,
                     started_at=started_at,
                     now=self._clock(),
+                    deadline_remaining=None if deadline is None else deadline.remaining(),
+                ):
+                    logger.error(
+                        "request unavailable; Retry-After exceeds retry budget endpoint=%s attempt=%s "
+                        "status=%s retry_after=%.3f",
+                        normalized_endpoint,
+                        attempt,
+                        status,
+                        retry_after,
+                    )
+                    raise retry_after_exceeded_error(retry_after, mapped_error) from mapped_error
+                previous_delay = self._retry_policy.backoff_seconds(
+                    attempt=attempt,
+                    previous_delay=previous_delay,
+                    rng=self._rng,
+                    retry_after=retry_after,
                 )
-            ):
-                logger.warning(
-                    "request transient failure; retrying endpoint=%s attempt=%s status=%s",
+                if deadline_allows_retry(deadline, previous_delay):
+                    logger.warning(
+                        "request transient failure; retrying endpoint=%s attempt=%s status=%s delay=%.3f",
+                        normalized_endpoint,
+                        attempt,
+                        status,
+                        previous_delay,
+                    )
+                    self._sleep(previous_delay)
+                    continue
+                logger.error(
+                    "request transient failure; giving up at job deadline endpoint=%s attempt=%s status=%s",
                     normalized_endpoint,
                     attempt,
                     status,
                 )
-                self._sleep(
-                    compute_backoff_seconds(
-                        config=self._config,
-                        attempt=attempt,
-                        rng=self._rng,
-                    )
-                )
-                continue
+                raise deadline_exceeded_error() from mapped_error
 
             logger.error(
                 "request failed endpoint=%s attempt=%s status=%s",
@@ -187,6 +317,67 @@ class SyncTransport:
             )
             raise mapped_error
 
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup,
+    ) -> None:
+        cache = self._response_cache
+        if cache is None or not cache.try_begin_refresh(cache_lookup.key):
+            return
+        # New threads start with an empty context, so the refresh does not
+        # inherit the caller's job deadline or retry budget.
+        threading.Thread(
+            target=self._refresh,
+            args=(endpoint, dict(params), cache_lookup),
+            name=f"boj-cache-refresh-{endpoint}",
+            daemon=True,
+        ).start()
+
+    def _refresh(
+        self,
+        endpoint: str,
+        params: Mapping[str, str],
+        cache_lookup: CacheLookup,
+    ) -> None:
+        try:
+            if not self._closed:
+                self._fetch(endpoint, params, cache_lookup)
+        except Exception as exc:
+            logger.warning(
+                "background refresh failed endpoint=%s error=%s",
+                endpoint,
+                exc.__class__.__name__,
+            )
+        finally:
+            self._response_cache.finish_refresh(cache_lookup.key)  # type: ignore[union-attr]
+
+    def _record_circuit_outcome(
+        self,
+        endpoint: str,
+        *,
+        transient: bool,
+        cut_short: bool = False,
+    ) -> bool:
+        """Record an attempt outcome; return True when the circuit is now open.
+
+        Attempts ``cut_short`` by the caller's job deadline say nothing about
+        endpoint health, so they are not counted as failures.
+        """
+
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return False
+        if cut_short:
+            breaker.release_probe(endpoint)
+            return False
+        if not transient:
+            breaker.record_success(endpoint)
+            return False
+        breaker.record_failure(endpoint)
+        return breaker.state(endpoint) == CIRCUIT_OPEN
+
     @staticmethod
     def _normalize_endpoint(endpoint: str) -> str:
         return endpoint.lstrip("/")
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import random
-from collections.abc import Mapping
+import importlib.util
+from collections.abc import Callable, Mapping
 
 import httpx
 
 from ..config import BojClientConfig
-from .retry import can_retry, next_backoff_seconds
+from .circuit_breaker import CircuitBreaker
+from .errors import BojApiError, BojTransportError, BojUnavailableError
+from .job_context import JobDeadline
+from .response_cache import ResponseCache
 
 
 def build_default_headers(config: BojClientConfig) -> Mapping[str, str]:
@@ -27,38 +30,154 @@ def build_default_timeout(config: BojClientConfig) -> httpx.Timeout:
     )
 
 
-def should_retry_attempt(
-    *,
+def deadline_request_options(
     config: BojClientConfig,
-    attempt: int,
-    started_at: float,
-    now: float,
-) -> bool:
-    return can_retry(
-        attempt=attempt,
-        max_attempts=config.retry.max_attempts,
-        started_at=started_at,
-        now=now,
-        total_budget_seconds=config.retry.total_retry_budget_seconds,
+    deadline: JobDeadline | None,
+) -> dict[str, object]:
+    """Return per-request options that keep one attempt inside the job deadline."""
+
+    if deadline is None:
+        return {}
+    remaining = deadline.remaining()
+    if remaining <= 0.0:
+        raise deadline_exceeded_error()
+    transport = config.transport
+    return {
+        "timeout": httpx.Timeout(
+            connect=min(transport.timeout_connect_seconds, remaining),
+            read=min(transport.timeout_read_seconds, remaining),
+            write=min(transport.timeout_write_seconds, remaining),
+            pool=min(transport.timeout_pool_seconds, remaining),
+        )
+    }
+
+
+def deadline_exceeded_error() -> BojTransportError:
+    return BojTransportError("job deadline exceeded", cause="deadline")
+
+
+def retry_after_exceeded_error(retry_after: float, mapped_error: BojApiError) -> BojUnavailableError:
+    return BojUnavailableError(
+        f"server asked to retry after {retry_after:.0f}s, beyond the remaining retry budget",
+        status=mapped_error.status,
+        message_id=mapped_error.message_id,
+        http_status=mapped_error.http_status,
+        cause="retry_after",
     )
 
 
-def compute_backoff_seconds(
-    *,
+def deadline_allows_retry(deadline: JobDeadline | None, delay_seconds: float) -> bool:
+    return deadline is None or deadline.remaining() > delay_seconds
+
+
+def build_default_limits(config: BojClientConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.transport.max_connections,
+        max_keepalive_connections=config.transport.max_keepalive_connections,
+        keepalive_expiry=config.transport.keepalive_expiry_seconds,
+    )
+
+
+def resolve_http2(config: BojClientConfig) -> bool:
+    if not config.transport.http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        raise ImportError(
+            "transport.http2 requires the optional 'h2' package; "
+            "install with: pip install 'boj-api-client[http2]'"
+        )
+    return True
+
+
+def build_http_client_options(config: BojClientConfig) -> dict[str, object]:
+    return {
+        "base_url": config.base_url.rstrip("/") + "/",
+        "headers": build_default_headers(config),
+        "timeout": build_default_timeout(config),
+        "limits": build_default_limits(config),
+        "http2": resolve_http2(config),
+    }
+
+
+def http_client_pool_key(config: BojClientConfig) -> tuple[object, ...]:
+    """Return the settings that must match for two clients to share connections."""
+
+    transport = config.transport
+    return (
+        config.base_url.rstrip("/") + "/",
+        config.user_agent,
+        transport.timeout_connect_seconds,
+        transport.timeout_read_seconds,
+        transport.timeout_write_seconds,
+        transport.timeout_pool_seconds,
+        transport.http2,
+        transport.max_connections,
+        transport.max_keepalive_connections,
+        transport.keepalive_expiry_seconds,
+    )
+
+
+def build_circuit_breaker(
     config: BojClientConfig,
-    attempt: int,
-    rng: random.Random,
-) -> float:
-    return next_backoff_seconds(
-        attempt_index=attempt - 1,
-        max_backoff_seconds=config.retry.max_backoff_seconds,
-        rng=rng,
+    *,
+    clock: Callable[[], float],
+) -> CircuitBreaker | None:
+    threshold = config.transport.circuit_breaker_failure_threshold
+    if threshold is None:
+        return None
+    return CircuitBreaker(
+        failure_threshold=threshold,
+        recovery_timeout_seconds=config.transport.circuit_breaker_recovery_seconds,
+        clock=clock,
     )
 
 
+def build_response_cache(
+    config: BojClientConfig,
+    *,
+    clock: Callable[[], float],
+) -> ResponseCache | None:
+    cache = config.cache
+    if cache.enabled:
+        return ResponseCache(
+            max_entries=cache.max_entries,
+            ttl_seconds=cache.ttl_seconds,
+            stale_while_revalidate_seconds=cache.stale_while_revalidate_seconds,
+            negative_ttl_seconds=cache.negative_ttl_seconds,
+            clock=clock,
+        )
+    if cache.negative_ttl_seconds is not None:
+        # Negative caching works on its own: keep only "no data" entries.
+        return ResponseCache(
+            max_entries=cache.max_entries,
+            ttl_seconds=0.0,
+            negative_ttl_seconds=cache.negative_ttl_seconds,
+            clock=clock,
+        )
+    return None
+
+
+def with_request_headers(
+    options: Mapping[str, object],
+    headers: Mapping[str, str],
+) -> Mapping[str, object]:
+    if not headers:
+        return options
+    return {**options, "headers": dict(headers)}
+
+
 __all__ = [
     "build_default_headers",
     "build_default_timeout",
-    "should_retry_attempt",
-    "compute_backoff_seconds",
+    "deadline_request_options",
+    "deadline_allows_retry",
+    "deadline_exceeded_error",
+    "retry_after_exceeded_error",
+    "build_default_limits",
+    "resolve_http2",
+    "build_http_client_options",
+    "http_client_pool_key",
+    "build_circuit_breaker",
+    "build_response_cache",
+    "with_request_headers",
 ]
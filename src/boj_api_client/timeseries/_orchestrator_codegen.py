@@ -23,10 +23,27 @@ def generate_sync_orchestrator_source(async_source: str) -> str:
         "from collections.abc import AsyncIterator, Mapping",
         "from collections.abc import Iterator, Mapping",
     )
+    source = source.replace(
+        "from ..core.async_concurrency import agather_bounded",
+        "from ..core.concurrency import gather_bounded",
+    )
+    source = source.replace(
+        "from ..core.async_offload import arun_offloaded",
+        "from ..core.offload import run_offloaded",
+    )
     source = source.replace(
         "from ..core.async_pagination import aiterate_pages",
         "from ..core.pagination import iterate_pages",
     )
+    source = source.replace(
+        "from ..core.async_prefetch import aprefetch_map",
+        "from ..core.prefetch import prefetch_map",
+    )
+    source = source.replace(
+        "from ..core.async_checkpoint_store import AsyncCheckpointStore\n",
+        "",
+    )
+    source = source.replace(" | AsyncCheckpointStore", "")
     source = source.replace(
         "from .async_checkpoint_manager import AsyncCheckpointManager",
         "from .checkpoint_manager import CheckpointManager",
@@ -41,6 +58,9 @@ def generate_sync_orchestrator_source(async_source: str) -> str:
     source = _replace_word(source, "AsyncCheckpointManager", "CheckpointManager")
     source = _replace_word(source, "AsyncIterator", "Iterator")
     source = _replace_word(source, "aiterate_pages", "iterate_pages")
+    source = _replace_word(source, "agather_bounded", "gather_bounded")
+    source = _replace_word(source, "aprefetch_map", "prefetch_map")
+    source = _replace_word(source, "arun_offloaded", "run_offloaded")
 
     source = re.sub(r"\basync def\b", "def", source)
     source = re.sub(r"\basync for\b", "for", source)
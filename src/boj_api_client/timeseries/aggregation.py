@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 
 from ..core.errors import BojApiError, BojValidationError
 from ..core.models import ApiEnvelope
-from .models import DataCodeResponse, DataLayerResponse, TimeSeries
+from .models import DataCodeResponse, DataLayerResponse, TimeSeries, TimeSeriesPoint
 
 
 def cause_from_error(exc: Exception) -> str:
@@ -39,6 +39,63 @@ def merge_series_map(by_code: dict[str, TimeSeries], series_items: Iterable[Time
         by_code[series.series_code] = merge_series(existing, series) if existing else series
 
 
+def merge_sorted_points(
+    left: Sequence[TimeSeriesPoint],
+    right: Sequence[TimeSeriesPoint],
+) -> tuple[TimeSeriesPoint, ...]:
+    """Linear merge of two date-ordered point sequences; ``right`` wins on ties."""
+
+    if not left:
+        return tuple(right)
+    if not right:
+        return tuple(left)
+    if left[-1].survey_date < right[0].survey_date:
+        return (*left, *right)
+
+    merged: list[TimeSeriesPoint] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        left_date = left[i].survey_date
+        right_date = right[j].survey_date
+        if left_date < right_date:
+            merged.append(left[i])
+            i += 1
+        elif right_date < left_date:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(right[j])
+            i += 1
+            j += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return tuple(merged)
+
+
+def merge_window_series_maps(
+    window_maps: Iterable[Mapping[str, TimeSeries]],
+) -> dict[str, TimeSeries]:
+    """Merge per-window series maps (ordered by window) with a linear point merge."""
+
+    merged: dict[str, TimeSeries] = {}
+    for window_map in window_maps:
+        for code, series in window_map.items():
+            existing = merged.get(code)
+            if existing is None:
+                merged[code] = series
+                continue
+            merged[code] = TimeSeries(
+                series_code=existing.series_code,
+                name=series.name or existing.name,
+                unit=series.unit or existing.unit,
+                frequency=series.frequency or existing.frequency,
+                category=series.category or existing.category,
+                last_update=series.last_update or existing.last_update,
+                points=merge_sorted_points(existing.points, series.points),
+            )
+    return merged
+
+
 def sort_series_by_code(series_items: Iterable[TimeSeries]) -> tuple[TimeSeries, ...]:
     return tuple(sorted(series_items, key=lambda s: s.series_code))
 
@@ -83,6 +140,8 @@ __all__ = [
     "cause_from_error",
     "merge_series",
     "merge_series_map",
+    "merge_sorted_points",
+    "merge_window_series_maps",
     "sort_series_by_code",
     "build_data_code_response",
     "build_data_layer_response_from_map",
@@ -4,22 +4,37 @@ from __future__ import annotations
 
 import inspect
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import TypeGuard
 
-from ..core.async_checkpoint_store import AsyncCheckpointStore, AsyncCheckpointStoreAdapter
-from ..core.checkpoint_store import CheckpointStore
+from ..core.async_checkpoint_store import (
+    AsyncCheckpointStore,
+    AsyncCheckpointStoreAdapter,
+    AsyncMemoryCheckpointStore,
+)
+from ..core.checkpoint_store import CheckpointStore, MemoryCheckpointStore
 from ..core.errors import BojValidationError
+from .checkpoint_codec import DEFAULT_CHECKPOINT_COMPRESSION, resolve_checkpoint_compression
 from .checkpoint_models import (
+    CheckpointChain,
     DataCodeCheckpointState,
     DataLayerAutoPartitionCheckpointState,
     DataLayerCheckpointState,
     DataLayerDirectCheckpointState,
 )
 from .checkpoint_shared import (
+    SeriesCheckpointState,
+    advance_chain,
+    chain_started_at,
+    chained_record,
+    checkpoint_chain_clock,
+    checkpoint_chain_max_age,
+    checkpoint_parent_ids,
+    compact_checkpoint_records,
     decode_validated_data_code_state,
     decode_validated_data_layer_state,
     normalize_config_snapshot,
+    shares_immutable_snapshots,
 )
 from .queries import DataCodeQuery, DataLayerQuery
 
@@ -57,9 +72,14 @@ class AsyncCheckpointManager:
         *,
         store: CheckpointStore | AsyncCheckpointStore | None,
         config_snapshot: Mapping[str, int | float | bool] | None = None,
+        compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
     ) -> None:
+        self._series_by_reference = shares_immutable_snapshots(store)
+        self._chain_max_age = checkpoint_chain_max_age(store)
+        self._chain_clock = checkpoint_chain_clock(store)
         self._store = self._normalize_store(store)
         self._config_snapshot = normalize_config_snapshot(config_snapshot)
+        self._compression = resolve_checkpoint_compression(compression)
 
     @property
     def config_snapshot(self) -> dict[str, int | float | bool]:
@@ -69,11 +89,21 @@ class AsyncCheckpointManager:
     def enabled(self) -> bool:
         return self._store is not None
 
-    async def save_data_code(self, state: DataCodeCheckpointState) -> str:
-        return await self._require_store().save(state.to_record())
+    async def save_data_code(
+        self,
+        state: DataCodeCheckpointState,
+        *,
+        chain: CheckpointChain | None = None,
+    ) -> str:
+        return await self._save_series_state(state, chain)
 
-    async def save_data_layer_direct(self, state: DataLayerDirectCheckpointState) -> str:
-        return await self._require_store().save(state.to_record())
+    async def save_data_layer_direct(
+        self,
+        state: DataLayerDirectCheckpointState,
+        *,
+        chain: CheckpointChain | None = None,
+    ) -> str:
+        return await self._save_series_state(state, chain)
 
     async def save_data_layer_auto_partition(
         self,
@@ -86,32 +116,76 @@ class AsyncCheckpointManager:
         *,
         checkpoint_id: str,
         normalized: DataCodeQuery,
+        chain: CheckpointChain | None = None,
     ) -> DataCodeCheckpointState:
-        return decode_validated_data_code_state(
-            record=await self._load_record(checkpoint_id),
+        record, record_ids = await self._load_chain(checkpoint_id)
+        state = decode_validated_data_code_state(
+            record=record,
             normalized=normalized,
             expected_snapshot=self._config_snapshot,
         )
+        if chain is not None:
+            chain.record_ids = record_ids
+            chain.persisted = dict(state.by_code)
+            chain.started_at = chain_started_at(record)
+        return state
 
     async def load_data_layer(
         self,
         *,
         checkpoint_id: str,
         normalized: DataLayerQuery,
+        chain: CheckpointChain | None = None,
     ) -> DataLayerCheckpointState:
-        return decode_validated_data_layer_state(
-            record=await self._load_record(checkpoint_id),
+        record, record_ids = await self._load_chain(checkpoint_id)
+        state = decode_validated_data_layer_state(
+            record=record,
             normalized=normalized,
             expected_snapshot=self._config_snapshot,
         )
+        if chain is not None and isinstance(state, DataLayerDirectCheckpointState):
+            chain.record_ids = record_ids
+            chain.persisted = dict(state.by_code)
+            chain.started_at = chain_started_at(record)
+        return state
 
     async def cleanup(self, checkpoint_id: str) -> None:
+        """Delete ``checkpoint_id`` together with the chain records it builds on."""
+
         if self._store is None:
             return
         try:
-            await self._store.delete(checkpoint_id)
+            parents = checkpoint_parent_ids(await self._load_record(checkpoint_id))
         except BojValidationError:
-            logger.debug("checkpoint cleanup skipped checkpoint_id=%s", checkpoint_id)
+            parents = ()
+        await self.discard((*parents, checkpoint_id))
+
+    async def discard(self, checkpoint_ids: Iterable[str]) -> None:
+        if self._store is None:
+            return
+        for checkpoint_id in checkpoint_ids:
+            try:
+                await self._store.delete(checkpoint_id)
+            except BojValidationError:
+                logger.debug("checkpoint cleanup skipped checkpoint_id=%s", checkpoint_id)
+
+    async def _save_series_state(
+        self,
+        state: SeriesCheckpointState,
+        chain: CheckpointChain | None,
+    ) -> str:
+        record = chained_record(
+            state,
+            chain,
+            series_by_reference=self._series_by_reference,
+            compression=self._compression,
+            now=self._chain_clock(),
+            max_age_seconds=self._chain_max_age,
+        )
+        checkpoint_id = await self._require_store().save(record)
+        if chain is not None:
+            advance_chain(chain, checkpoint_id=checkpoint_id, record=record, by_code=state.by_code)
+        return checkpoint_id
 
     def _require_store(self) -> AsyncCheckpointStore:
         if self._store is None:
@@ -124,6 +198,13 @@ class AsyncCheckpointManager:
             raise BojValidationError("checkpoint payload is invalid")
         return record
 
+    async def _load_chain(self, checkpoint_id: str) -> tuple[dict[str, object], tuple[str, ...]]:
+        head = await self._load_record(checkpoint_id)
+        parents = checkpoint_parent_ids(head)
+        records = [await self._load_record(parent_id) for parent_id in parents]
+        records.append(head)
+        return compact_checkpoint_records(records), (*parents, checkpoint_id)
+
     @staticmethod
     def _normalize_store(
         store: CheckpointStore | AsyncCheckpointStore | None,
@@ -132,6 +213,8 @@ class AsyncCheckpointManager:
             return None
         if _is_async_checkpoint_store(store):
             return store
+        if isinstance(store, MemoryCheckpointStore):
+            return AsyncMemoryCheckpointStore(store)
         if _is_sync_checkpoint_store(store):
             return AsyncCheckpointStoreAdapter(store)
         raise BojValidationError("checkpoint store is invalid")
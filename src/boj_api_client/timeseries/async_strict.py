@@ -6,11 +6,7 @@ from collections.abc import Sequence
 
 from ..core.async_transport import AsyncTransport
 from .queries import DataCodeQuery, DataLayerQuery, MetadataQuery
-from .strict_shared import (
-    build_strict_data_code_params,
-    build_strict_data_layer_params,
-    build_strict_metadata_params,
-)
+from .strict_shared import PreparedRequestCache, build_strict_metadata_params
 
 
 class AsyncStrictTimeSeriesService:
@@ -18,6 +14,7 @@ class AsyncStrictTimeSeriesService:
 
     def __init__(self, transport: AsyncTransport) -> None:
         self._transport = transport
+        self._prepared = PreparedRequestCache()
 
     async def execute_data_code(
         self,
@@ -26,11 +23,8 @@ class AsyncStrictTimeSeriesService:
         code_subset: Sequence[str],
         start_position: int = 1,
     ) -> dict[str, object]:
-        params = build_strict_data_code_params(
-            query,
-            code_subset=code_subset,
-            start_position=start_position,
-        )
+        prepared = self._prepared.data_code(query, code_subset=code_subset)
+        params = prepared.params(start_position=start_position)
         return await self._transport.request("/getDataCode", params=params)
 
     async def execute_data_layer(
@@ -39,10 +33,7 @@ class AsyncStrictTimeSeriesService:
         *,
         start_position: int = 1,
     ) -> dict[str, object]:
-        params = build_strict_data_layer_params(
-            query,
-            start_position=start_position,
-        )
+        params = self._prepared.data_layer(query).params(start_position=start_position)
         return await self._transport.request("/getDataLayer", params=params)
 
     async def execute_metadata(self, query: MetadataQuery) -> dict[str, object]:
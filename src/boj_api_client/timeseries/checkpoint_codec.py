@@ -1,18 +1,141 @@
-"""Codec helpers for checkpoint record payloads."""
+"""Codec helpers for checkpoint record payloads.
+
+``by_code`` is stored as one versioned binary blob::
+
+    b"BJK1" | u8 compression | compressed(u32 count | (u32 length | series)*)
+
+where each series uses the columnar :mod:`.series_codec` layout (survey dates,
+float64 values, a null bitmap and a bitmap marking integer values).
+Compression is stdlib ``zlib`` unless ``zstd`` or ``lz4`` is chosen
+explicitly; the byte after the magic records which one, so loads never
+depend on the writer's setting.
+Records written before the binary codec hold a dict of ``asdict`` series and
+are still accepted.
+"""
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import importlib
+import struct
+import zlib
+from collections.abc import Callable
+from functools import lru_cache
+from types import ModuleType
 
 from ..core.errors import BojValidationError
 from ..core.models import ApiEnvelope
 from .models import TimeSeries, TimeSeriesPoint
 from .queries import DataCodeQuery, DataLayerQuery
 from .checkpoint_validation import as_int_or_none, as_str, as_str_or_none
+from .series_codec import decode_series, encode_series
+
+SERIES_MAP_MAGIC = b"BJK1"
+CHECKPOINT_COMPRESSIONS = ("zlib", "zstd", "lz4")
+DEFAULT_CHECKPOINT_COMPRESSION = "zlib"
+_COMPRESSION_ZLIB = 1
+_COMPRESSION_LZ4 = 2
+_COMPRESSION_ZSTD = 3
+_COMPRESSION_IDS = {"zlib": _COMPRESSION_ZLIB, "lz4": _COMPRESSION_LZ4, "zstd": _COMPRESSION_ZSTD}
+# compression id -> (extra name, module, distribution)
+_COMPRESSION_MODULES = {
+    _COMPRESSION_LZ4: ("lz4", "lz4.frame", "lz4"),
+    _COMPRESSION_ZSTD: ("zstd", "zstandard", "zstandard"),
+}
+_U32 = struct.Struct("<I")
+
+
+def resolve_checkpoint_compression(compression: str) -> str:
+    """Validate ``compression`` and fail fast when its optional package is missing."""
+
+    if compression not in _COMPRESSION_IDS:
+        raise ValueError(f"checkpoint compression must be one of {', '.join(CHECKPOINT_COMPRESSIONS)}")
+    compression_id = _COMPRESSION_IDS[compression]
+    if compression_id in _COMPRESSION_MODULES:
+        extra, module_name, package = _COMPRESSION_MODULES[compression_id]
+        if _optional_module(module_name) is None:
+            raise ImportError(
+                f"checkpoint compression '{compression}' requires the optional '{package}' package; "
+                f"install with: pip install 'boj-api-client[{extra}]'"
+            )
+    return compression
+
+
+def serialize_series_map(
+    by_code: dict[str, TimeSeries],
+    *,
+    compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
+) -> bytes:
+    parts = [_U32.pack(len(by_code))]
+    for series in by_code.values():
+        encoded = encode_series(series)
+        parts.append(_U32.pack(len(encoded)))
+        parts.append(encoded)
+    compression_id, compress = _compressor(resolve_checkpoint_compression(compression))
+    return SERIES_MAP_MAGIC + bytes((compression_id,)) + compress(b"".join(parts))
+
+
+def decode_series_map_blob(data: bytes | bytearray | memoryview) -> dict[str, TimeSeries]:
+    view = memoryview(data)
+    if bytes(view[:4]) != SERIES_MAP_MAGIC or len(view) < 5:
+        raise BojValidationError("checkpoint by_code is invalid")
+    body = memoryview(_decompress(view[4], view[5:]))
+    parsed: dict[str, TimeSeries] = {}
+    try:
+        (count,) = _U32.unpack_from(body, 0)
+        offset = _U32.size
+        for _ in range(count):
+            (length,) = _U32.unpack_from(body, offset)
+            offset += _U32.size
+            if offset + length > len(body):
+                raise ValueError("truncated series")
+            series = decode_series(body[offset : offset + length])
+            offset += length
+            parsed[series.series_code] = series
+    except (struct.error, ValueError, KeyError, TypeError) as exc:
+        raise BojValidationError("checkpoint by_code is invalid") from exc
+    if offset != len(body):
+        raise BojValidationError("checkpoint by_code is invalid")
+    return parsed
+
+
+def _compressor(compression: str) -> tuple[int, Callable[[bytes], bytes]]:
+    compression_id = _COMPRESSION_IDS[compression]
+    if compression_id == _COMPRESSION_ZSTD:
+        return compression_id, _optional_module("zstandard").ZstdCompressor(level=3).compress
+    if compression_id == _COMPRESSION_LZ4:
+        return compression_id, _optional_module("lz4.frame").compress
+    return compression_id, lambda data: zlib.compress(data, 6)
+
+
+def _decompress(compression: int, data: memoryview) -> bytes:
+    if compression == _COMPRESSION_ZLIB:
+        decompress: Callable[[bytes], bytes] = zlib.decompress
+    elif compression in _COMPRESSION_MODULES:
+        extra, module_name, package = _COMPRESSION_MODULES[compression]
+        module = _optional_module(module_name)
+        if module is None:
+            raise BojValidationError(
+                f"checkpoint by_code is compressed with '{extra}' but the optional '{package}' "
+                f"package is not installed; install with: pip install 'boj-api-client[{extra}]'"
+            )
+        if compression == _COMPRESSION_ZSTD:
+            decompress = module.ZstdDecompressor().decompress
+        else:
+            decompress = module.decompress
+    else:
+        raise BojValidationError("checkpoint by_code is invalid")
+    try:
+        return decompress(bytes(data))
+    except Exception as exc:
+        raise BojValidationError("checkpoint by_code is invalid") from exc
 
 
-def serialize_series_map(by_code: dict[str, TimeSeries]) -> dict[str, dict[str, object]]:
-    return {code: asdict(series) for code, series in by_code.items()}
+@lru_cache(maxsize=None)
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 
 def parse_points(value: object) -> tuple[TimeSeriesPoint, ...]:
@@ -52,6 +175,8 @@ def parse_series(value: object) -> TimeSeries:
 
 
 def parse_series_map(value: object) -> dict[str, TimeSeries]:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return decode_series_map_blob(value)
     if not isinstance(value, dict):
         raise BojValidationError("checkpoint by_code is invalid")
     parsed: dict[str, TimeSeries] = {}
@@ -112,9 +237,14 @@ def parse_data_layer_query(value: object) -> DataLayerQuery:
 
 
 __all__ = [
+    "CHECKPOINT_COMPRESSIONS",
+    "DEFAULT_CHECKPOINT_COMPRESSION",
+    "SERIES_MAP_MAGIC",
+    "decode_series_map_blob",
     "parse_data_code_query",
     "parse_data_layer_query",
     "parse_envelope",
     "parse_series_map",
+    "resolve_checkpoint_compression",
     "serialize_series_map",
 ]
@@ -8,6 +8,7 @@ from dataclasses import asdict, dataclass, field
 from ..core.errors import BojValidationError
 from ..core.models import ApiEnvelope
 from .checkpoint_codec import (
+    DEFAULT_CHECKPOINT_COMPRESSION,
     parse_data_code_query,
     parse_data_layer_query,
     parse_envelope,
@@ -19,6 +20,11 @@ from .queries import DataCodeQuery, DataLayerQuery
 from .models import TimeSeries
 
 
+def _series_map_value(by_code: dict[str, TimeSeries], by_reference: bool, compression: str) -> object:
+    # Snapshot stores keep the frozen series as-is instead of encoding them.
+    return dict(by_code) if by_reference else serialize_series_map(by_code, compression=compression)
+
+
 @dataclass(slots=True, frozen=True)
 class DataCodeCheckpointState:
     query: DataCodeQuery
@@ -34,12 +40,17 @@ class DataCodeCheckpointState:
         if self.start_position < 1:
             raise ValueError("start_position must be >= 1")
 
-    def to_record(self) -> dict[str, object]:
+    def to_record(
+        self,
+        *,
+        series_by_reference: bool = False,
+        compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
+    ) -> dict[str, object]:
         return {
             "kind": "data_code",
             "query": asdict(self.query),
             "config_snapshot": dict(self.config_snapshot),
-            "by_code": serialize_series_map(self.by_code),
+            "by_code": _series_map_value(self.by_code, series_by_reference, compression),
             "last_envelope": asdict(self.last_envelope),
             "chunk_index": self.chunk_index,
             "start_position": self.start_position,
@@ -72,13 +83,18 @@ class DataLayerDirectCheckpointState:
         if self.start_position < 1:
             raise ValueError("start_position must be >= 1")
 
-    def to_record(self) -> dict[str, object]:
+    def to_record(
+        self,
+        *,
+        series_by_reference: bool = False,
+        compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
+    ) -> dict[str, object]:
         return {
             "kind": "data_layer",
             "path": "direct",
             "query": asdict(self.query),
             "config_snapshot": dict(self.config_snapshot),
-            "by_code": serialize_series_map(self.by_code),
+            "by_code": _series_map_value(self.by_code, series_by_reference, compression),
             "last_envelope": asdict(self.last_envelope),
             "start_position": self.start_position,
             "next_position": self.next_position,
@@ -148,7 +164,34 @@ class DataLayerAutoPartitionCheckpointState:
 DataLayerCheckpointState = DataLayerDirectCheckpointState | DataLayerAutoPartitionCheckpointState
 
 
+@dataclass(slots=True)
+class CheckpointChain:
+    """Delta checkpoint chain written by one run.
+
+    ``record_ids`` lists the stored records oldest first; each later record
+    holds only the series that changed since the previous save. ``persisted``
+    is the ``by_code`` map as of the last save, compared by identity.
+    ``retired_ids`` are records left behind when the chain was restarted with
+    a full snapshot. ``started_at`` is the store-clock time of the full
+    snapshot at the root, or ``None`` when unknown (e.g. records from older releases).
+    """
+
+    record_ids: tuple[str, ...] = ()
+    persisted: dict[str, TimeSeries] = field(default_factory=dict)
+    retired_ids: tuple[str, ...] = ()
+    started_at: float | None = None
+
+    @property
+    def head_id(self) -> str | None:
+        return self.record_ids[-1] if self.record_ids else None
+
+    @property
+    def stored_ids(self) -> tuple[str, ...]:
+        return (*self.retired_ids, *self.record_ids)
+
+
 __all__ = [
+    "CheckpointChain",
     "DataCodeCheckpointState",
     "DataLayerDirectCheckpointState",
     "DataLayerAutoPartitionCheckpointState",
@@ -0,0 +1,78 @@
+"""Periodic progress checkpoint policy.
+
+Without a policy, checkpoints are only written when a run fails. A policy
+also saves the resume cursor while the run is in flight, so a worker that is
+killed outright can be resumed from its last progress checkpoint.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+CheckpointCallback = Callable[[str], None]
+
+
+@dataclass(slots=True, frozen=True)
+class CheckpointPolicy:
+    """Save progress after every N pages, N completed chunks or N seconds."""
+
+    every_pages: int | None = None
+    every_chunks: int | None = None
+    every_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("every_pages", "every_chunks"):
+            value = getattr(self, name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise ValueError(f"{name} must be None or int >= 1")
+        if self.every_seconds is not None and self.every_seconds <= 0:
+            raise ValueError("every_seconds must be None or > 0")
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.every_pages is not None
+            or self.every_chunks is not None
+            or self.every_seconds is not None
+        )
+
+    def start(self, clock: Callable[[], float] | None = None) -> "CheckpointCadence":
+        return CheckpointCadence(self, clock=clock or time.monotonic)
+
+
+class CheckpointCadence:
+    """Progress counters of one run; :meth:`advance` reports when a save is due."""
+
+    def __init__(self, policy: CheckpointPolicy, *, clock: Callable[[], float]) -> None:
+        self._policy = policy
+        self._clock = clock
+        self._pages = 0
+        self._chunks = 0
+        self._since = clock()
+
+    def advance(self, *, pages: int = 0, chunks: int = 0) -> bool:
+        self._pages += pages
+        self._chunks += chunks
+        policy = self._policy
+        return (
+            (policy.every_pages is not None and self._pages >= policy.every_pages)
+            or (policy.every_chunks is not None and self._chunks >= policy.every_chunks)
+            or (
+                policy.every_seconds is not None
+                and self._clock() - self._since >= policy.every_seconds
+            )
+        )
+
+    def mark_saved(self) -> None:
+        self._pages = 0
+        self._chunks = 0
+        self._since = self._clock()
+
+
+__all__ = [
+    "CheckpointCadence",
+    "CheckpointCallback",
+    "CheckpointPolicy",
+]
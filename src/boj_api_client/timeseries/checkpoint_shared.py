@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from dataclasses import asdict
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, replace
 
 from ..core.errors import BojValidationError
+from .checkpoint_codec import DEFAULT_CHECKPOINT_COMPRESSION, parse_series_map
 from .checkpoint_models import (
+    CheckpointChain,
     DataCodeCheckpointState,
     DataLayerAutoPartitionCheckpointState,
     DataLayerCheckpointState,
     DataLayerDirectCheckpointState,
 )
+from .models import TimeSeries
 from .queries import DataCodeQuery, DataLayerQuery
 
 QueryType = DataCodeQuery | DataLayerQuery
+SeriesCheckpointState = DataCodeCheckpointState | DataLayerDirectCheckpointState
+
+# Longer chains are restarted with a full snapshot so loads stay bounded.
+MAX_CHECKPOINT_CHAIN_LENGTH = 64
+# Every record expires on its own TTL, so a chain is also restarted once its
+# root is older than this fraction of the store TTL; the head then never
+# depends on a parent that expires before it.
+CHECKPOINT_CHAIN_MAX_AGE_RATIO = 0.5
 
 
 def normalize_config_snapshot(
@@ -23,6 +35,26 @@ def normalize_config_snapshot(
     return dict(config_snapshot) if config_snapshot is not None else {}
 
 
+def shares_immutable_snapshots(store: object) -> bool:
+    """Return whether ``store`` keeps frozen series by reference (no encoding needed)."""
+
+    return bool(getattr(store, "shares_immutable_snapshots", False))
+
+
+def checkpoint_chain_max_age(store: object) -> float | None:
+    """Return how old a chain root may get before restarting, or ``None`` without a known TTL."""
+
+    ttl_seconds = getattr(store, "ttl_seconds", None)
+    if not isinstance(ttl_seconds, (int, float)) or isinstance(ttl_seconds, bool):
+        return None
+    return ttl_seconds * CHECKPOINT_CHAIN_MAX_AGE_RATIO
+
+
+def checkpoint_chain_clock(store: object) -> Callable[[], float]:
+    clock = getattr(store, "clock", None)
+    return clock if callable(clock) else time.time
+
+
 def validate_query_match(
     *,
     saved_query: QueryType,
@@ -41,6 +73,107 @@ def validate_config_snapshot_match(
         raise BojValidationError("checkpoint config mismatch")
 
 
+def chained_record(
+    state: SeriesCheckpointState,
+    chain: CheckpointChain | None,
+    *,
+    series_by_reference: bool = False,
+    compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
+    now: float | None = None,
+    max_age_seconds: float | None = None,
+) -> dict[str, object]:
+    """Return the record to save: a delta on top of ``chain`` or a full snapshot.
+
+    With ``max_age_seconds`` a chain whose root is older than that (or of
+    unknown age) is restarted so no parent expires before its head. Records
+    carry the root's save time as ``chain_started_at`` so resumed runs know
+    the age of the chain they extend.
+    """
+
+    if (
+        chain is None
+        or not chain.record_ids
+        or len(chain.record_ids) >= MAX_CHECKPOINT_CHAIN_LENGTH
+        or _chain_too_old(chain, now=now, max_age_seconds=max_age_seconds)
+    ):
+        record = state.to_record(series_by_reference=series_by_reference, compression=compression)
+        started_at = now
+    else:
+        changed = {
+            code: series
+            for code, series in state.by_code.items()
+            if chain.persisted.get(code) is not series
+        }
+        record = replace(state, by_code=changed).to_record(
+            series_by_reference=series_by_reference,
+            compression=compression,
+        )
+        record["parents"] = list(chain.record_ids)
+        started_at = chain.started_at
+    if started_at is not None:
+        record["chain_started_at"] = started_at
+    return record
+
+
+def advance_chain(
+    chain: CheckpointChain,
+    *,
+    checkpoint_id: str,
+    record: Mapping[str, object],
+    by_code: Mapping[str, object],
+) -> None:
+    if "parents" in record:
+        chain.record_ids = (*chain.record_ids, checkpoint_id)
+    else:
+        chain.retired_ids = (*chain.retired_ids, *chain.record_ids)
+        chain.record_ids = (checkpoint_id,)
+        chain.started_at = chain_started_at(record)
+    chain.persisted = dict(by_code)
+
+
+def chain_started_at(record: Mapping[str, object]) -> float | None:
+    """Return the root save time a loaded record carries, or ``None`` for older records."""
+
+    started_at = record.get("chain_started_at")
+    if not isinstance(started_at, (int, float)) or isinstance(started_at, bool):
+        return None
+    return float(started_at)
+
+
+def _chain_too_old(
+    chain: CheckpointChain,
+    *,
+    now: float | None,
+    max_age_seconds: float | None,
+) -> bool:
+    if now is None or max_age_seconds is None:
+        return False
+    return chain.started_at is None or now - chain.started_at >= max_age_seconds
+
+
+def checkpoint_parent_ids(record: Mapping[str, object]) -> tuple[str, ...]:
+    parents = record.get("parents", ())
+    if not isinstance(parents, (list, tuple)) or not all(isinstance(item, str) for item in parents):
+        raise BojValidationError("checkpoint parents is invalid")
+    return tuple(parents)
+
+
+def compact_checkpoint_records(records: list[dict[str, object]]) -> dict[str, object]:
+    """Fold a chain (oldest first) into one full record; later series win."""
+
+    head = records[-1]
+    if len(records) == 1:
+        return head
+    by_code: dict[str, TimeSeries] = {}
+    for record in records:
+        if record.get("kind") != head.get("kind") or record.get("path") != head.get("path"):
+            raise BojValidationError("checkpoint chain is inconsistent")
+        by_code.update(parse_series_map(record.get("by_code")))
+    compacted = {key: value for key, value in head.items() if key != "parents"}
+    compacted["by_code"] = by_code
+    return compacted
+
+
 def decode_data_layer_record(record: dict[str, object]) -> DataLayerCheckpointState:
     if record.get("kind") != "data_layer":
         raise BojValidationError("checkpoint kind mismatch")
@@ -83,8 +216,19 @@ def decode_validated_data_layer_state(
 
 
 __all__ = [
+    "CHECKPOINT_CHAIN_MAX_AGE_RATIO",
+    "MAX_CHECKPOINT_CHAIN_LENGTH",
     "QueryType",
+    "SeriesCheckpointState",
+    "advance_chain",
+    "chain_started_at",
+    "chained_record",
+    "checkpoint_chain_clock",
+    "checkpoint_chain_max_age",
+    "checkpoint_parent_ids",
+    "compact_checkpoint_records",
     "normalize_config_snapshot",
+    "shares_immutable_snapshots",
     "validate_query_match",
     "validate_config_snapshot_match",
     "decode_data_layer_record",
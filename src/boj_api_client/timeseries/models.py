@@ -55,6 +55,8 @@ class MetadataEntry:
 class DataCodeResponse:
     envelope: ApiEnvelope
     series: tuple[TimeSeries, ...] | list[TimeSeries]
+    # Set on ``iter_data_code`` pages: pass to ``resume_from=`` to continue after this page.
+    resume_cursor: str | None = None
 
     def __post_init__(self) -> None:
         if isinstance(self.series, tuple):
@@ -67,6 +69,8 @@ class DataLayerResponse:
     envelope: ApiEnvelope
     series: tuple[TimeSeries, ...] | list[TimeSeries]
     next_position: int | None
+    # Set on ``iter_data_layer`` pages: pass to ``resume_from=`` to continue after this page.
+    resume_cursor: str | None = None
 
     def __post_init__(self) -> None:
         if isinstance(self.series, tuple):
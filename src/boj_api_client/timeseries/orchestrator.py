@@ -5,33 +5,62 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator, Mapping
-
+from collections.abc import Iterator, Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import replace
+from functools import partial
+from typing import TypeVar
+
+from ..core.concurrency import gather_bounded
+from ..core.offload import run_offloaded
 from ..core.pagination import iterate_pages
+from ..core.prefetch import prefetch_map
 from ..core.checkpoint_store import CheckpointStore
 from ..core.errors import BojPartialResultError, BojValidationError
+from ..core.job_context import deadline_scope, retry_budget_scope
+from ..core.pagination import parse_next_position
 from .aggregation import (
     build_data_code_response,
     build_data_layer_response_from_map,
     build_data_layer_response_from_series,
     cause_from_error,
     merge_series_map,
+    merge_window_series_maps,
 )
 from .checkpoint_manager import CheckpointManager
+from .checkpoint_codec import DEFAULT_CHECKPOINT_COMPRESSION
 from .checkpoint_models import (
+    CheckpointChain,
     DataCodeCheckpointState,
     DataLayerAutoPartitionCheckpointState,
     DataLayerDirectCheckpointState,
 )
+from .checkpoint_policy import CheckpointCadence, CheckpointCallback, CheckpointPolicy
 from .strict import StrictTimeSeriesService
-from .planner import chunk_codes, next_position_or_raise, plan_data_code_chunks, should_use_auto_partition
+from .planner import (
+    DATE_WINDOW_FREQUENCIES,
+    DateWindowPlan,
+    chunk_codes,
+    next_position_or_raise,
+    plan_data_code_chunks,
+    plan_date_windows,
+    should_use_auto_partition,
+)
 from .selectors import select_metadata_series_codes
+from .series_cache import TieredSeriesCache, series_cache_key
 from .models import DataCodeResponse, DataLayerResponse, MetadataResponse, TimeSeries, make_success_envelope
-from .parser import parse_data_code_response, parse_data_layer_response, parse_metadata_response
+from .parser import (
+    estimate_payload_weight,
+    parse_data_code_response,
+    parse_data_layer_response,
+    parse_metadata_response,
+)
 from .queries import DataCodeQuery, DataLayerQuery, MetadataQuery
+from .resume_cursor import ResumeCursor, decode_resume_cursor, encode_resume_cursor, query_digest
 from .validators import normalize_data_code_query, normalize_data_layer_query, normalize_metadata_query
 
 logger = logging.getLogger("boj_api_client")
+_ParsedT = TypeVar("_ParsedT")
 
 
 class TimeSeriesService:
@@ -44,53 +73,341 @@ class TimeSeriesService:
         enable_layer_auto_partition: bool = False,
         checkpoint_store: CheckpointStore | None = None,
         config_snapshot: Mapping[str, int | float | bool] | None = None,
+        data_code_date_windows: int = 1,
+        data_code_window_frequency: str | None = None,
+        max_concurrent_requests: int = 4,
+        prefetch_depth: int = 0,
+        offload_parse_min_values: int | None = None,
+        offload_executor: Executor | None = None,
+        job_retry_budget: int | None = None,
+        series_cache: TieredSeriesCache | None = None,
+        checkpoint_policy: CheckpointPolicy | None = None,
+        checkpoint_compression: str = DEFAULT_CHECKPOINT_COMPRESSION,
     ) -> None:
+        if data_code_date_windows < 1:
+            raise ValueError("data_code_date_windows must be >= 1")
+        if data_code_window_frequency is not None and data_code_window_frequency not in DATE_WINDOW_FREQUENCIES:
+            raise ValueError("data_code_window_frequency is not a splittable frequency")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be >= 1")
+        if prefetch_depth < 0:
+            raise ValueError("prefetch_depth must be >= 0")
+        if offload_parse_min_values is not None and offload_parse_min_values < 0:
+            raise ValueError("offload_parse_min_values must be >= 0")
+        if job_retry_budget is not None and job_retry_budget < 0:
+            raise ValueError("job_retry_budget must be >= 0")
         self._strict = strict_service
         self._enable_layer_auto_partition = enable_layer_auto_partition
+        self._data_code_date_windows = data_code_date_windows
+        self._data_code_window_frequency = data_code_window_frequency
+        self._max_concurrent_requests = max_concurrent_requests
+        self._prefetch_depth = prefetch_depth
+        self._offload_parse_min_values = offload_parse_min_values
+        self._offload_executor = offload_executor
+        self._job_retry_budget = job_retry_budget
+        self._series_cache = series_cache
+        self._checkpoint_policy = checkpoint_policy
         self._checkpoint_manager = CheckpointManager(
             store=checkpoint_store,
             config_snapshot=config_snapshot,
+            compression=checkpoint_compression,
         )
 
-    def iter_data_code(self, query: DataCodeQuery) -> Iterator[DataCodeResponse]:
+    def iter_data_code(
+        self,
+        query: DataCodeQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> Iterator[DataCodeResponse]:
+        """Yield pages in order; each carries ``resume_cursor`` for ``resume_from=``."""
+
         normalized = normalize_data_code_query(query)
-        for chunk_plan in plan_data_code_chunks(codes=normalized.code, chunk_size=250):
-            page_iter = iterate_pages(
-                lambda start_pos, _chunk=chunk_plan.codes: self._strict.execute_data_code(
-                    normalized,
-                    code_subset=_chunk,
-                    start_position=start_pos,
-                ),
-                start_position=chunk_plan.start_position,
-            )
-            try:
-                for payload in page_iter:
-                    yield parse_data_code_response(payload)
-            finally:
-                page_iter.close()
+        resume = (
+            None
+            if resume_from is None
+            else decode_resume_cursor(resume_from, kind="data_code", normalized=normalized)
+        )
+        page_iter = prefetch_map(
+            self._iter_data_code_payloads(normalized, resume=resume),
+            _parse_data_code_page,
+            depth=self._prefetch_depth,
+        )
+        try:
+            for page in page_iter:
+                yield page
+        finally:
+            page_iter.close()
+
+    def iter_data_layer(
+        self,
+        query: DataLayerQuery,
+        *,
+        resume_from: str | None = None,
+    ) -> Iterator[DataLayerResponse]:
+        """Yield pages in order; each carries ``resume_cursor`` for ``resume_from=``."""
 
-    def iter_data_layer(self, query: DataLayerQuery) -> Iterator[DataLayerResponse]:
         normalized = normalize_data_layer_query(query)
-        page_iter = iterate_pages(
-            lambda start_pos, _normalized=normalized: self._strict.execute_data_layer(
-                _normalized,
-                start_position=start_pos,
+        start_position = 1
+        if resume_from is not None:
+            start_position = decode_resume_cursor(
+                resume_from,
+                kind="data_layer",
+                normalized=normalized,
+            ).start_position
+        digest = query_digest(normalized)
+        page_iter = prefetch_map(
+            _with_resume_cursors(
+                iterate_pages(
+                    lambda start_pos, _normalized=normalized: self._strict.execute_data_layer(
+                        _normalized,
+                        start_position=start_pos,
+                    ),
+                    start_position=start_position,
+                ),
+                kind="data_layer",
+                digest=digest,
+                chunk_index=0,
+                last_chunk=True,
             ),
-            start_position=1,
+            _parse_data_layer_page,
+            depth=self._prefetch_depth,
         )
         try:
-            for payload in page_iter:
-                yield parse_data_layer_response(payload)
+            for page in page_iter:
+                yield page
         finally:
             page_iter.close()
 
+    def _iter_data_code_payloads(
+        self,
+        normalized: DataCodeQuery,
+        *,
+        resume: ResumeCursor | None = None,
+    ) -> Iterator[tuple[dict[str, object], str | None]]:
+        chunk_count = len(chunk_codes(normalized.code, chunk_size=250))
+        if resume is not None and resume.chunk_index >= chunk_count:
+            raise BojValidationError("resume cursor is out of range")
+        digest = query_digest(normalized)
+        for chunk_plan in plan_data_code_chunks(
+            codes=normalized.code,
+            chunk_size=250,
+            resume_chunk_index=0 if resume is None else resume.chunk_index,
+            resume_start_position=1 if resume is None else resume.start_position,
+        ):
+            page_iter = _with_resume_cursors(
+                iterate_pages(
+                    lambda start_pos, _chunk=chunk_plan.codes: self._strict.execute_data_code(
+                        normalized,
+                        code_subset=_chunk,
+                        start_position=start_pos,
+                    ),
+                    start_position=chunk_plan.start_position,
+                ),
+                kind="data_code",
+                digest=digest,
+                chunk_index=chunk_plan.chunk_index,
+                last_chunk=chunk_plan.chunk_index == chunk_count - 1,
+            )
+            try:
+                for item in page_iter:
+                    yield item
+            finally:
+                page_iter.close()
+
     def get_data_code(
         self,
         query: DataCodeQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataCodeResponse:
         normalized = normalize_data_code_query(query)
+        _validate_deadline(deadline)
+        with retry_budget_scope(self._job_retry_budget), deadline_scope(deadline):
+            if checkpoint_id is None:
+                cached = self._read_series_cache(normalized)
+                # Progress checkpoints of a missing-only fetch could not be
+                # resumed with the caller's query, so a partial hit fetches
+                # everything when the caller wants them.
+                if cached and (on_checkpoint is None or len(cached) == len(normalized.code)):
+                    return self._get_data_code_with_cached(normalized, cached)
+                return self._get_data_code_uncached(normalized, on_checkpoint=on_checkpoint)
+            response = self._get_data_code_sequential(
+                normalized,
+                checkpoint_id=checkpoint_id,
+                on_checkpoint=on_checkpoint,
+            )
+            self._write_series_cache(normalized, response.series)
+            return response
+
+    def _get_data_code_uncached(
+        self,
+        normalized: DataCodeQuery,
+        *,
+        on_checkpoint: CheckpointCallback | None = None,
+    ) -> DataCodeResponse:
+        windows = plan_date_windows(
+            start_date=normalized.start_date,
+            end_date=normalized.end_date,
+            window_count=self._data_code_date_windows,
+            frequency=self._data_code_window_frequency,
+        )
+        if len(windows) > 1:
+            response = self._get_data_code_windowed(normalized, windows)
+        else:
+            response = self._get_data_code_sequential(normalized, on_checkpoint=on_checkpoint)
+        self._write_series_cache(normalized, response.series)
+        return response
+
+    def _get_data_code_with_cached(
+        self,
+        normalized: DataCodeQuery,
+        cached: dict[str, TimeSeries],
+    ) -> DataCodeResponse:
+        missing = [code for code in normalized.code if code not in cached]
+        if not missing:
+            logger.info("data_code served from series cache series=%s", len(cached))
+            return build_data_code_response(
+                ordered_codes=normalized.code,
+                by_code=cached,
+                envelope=make_success_envelope(),
+            )
+        logger.info(
+            "data_code partial series cache hit cached=%s missing=%s",
+            len(cached),
+            len(missing),
+        )
+        try:
+            fetched = self._get_data_code_uncached(replace(normalized, code=tuple(missing)))
+        except Exception as exc:
+            if isinstance(exc, BojValidationError):
+                raise
+            # A checkpoint of the missing-only query cannot be resumed with the
+            # caller's query, so drop it; a plain retry re-reads the cache.
+            fetched_series: Sequence[TimeSeries] = ()
+            envelope = make_success_envelope()
+            if isinstance(exc, BojPartialResultError):
+                fetched_series = exc.partial_result.series
+                envelope = exc.partial_result.envelope
+                if exc.checkpoint_id is not None:
+                    self._checkpoint_manager.cleanup(exc.checkpoint_id)
+            logger.warning(
+                "data_code partial failure served_from_cache=%s cause=%s",
+                len(cached),
+                cause_from_error(exc),
+            )
+            raise BojPartialResultError(
+                "data_code retrieval failed after partial progress",
+                partial_result=build_data_code_response(
+                    ordered_codes=normalized.code,
+                    by_code={**cached, **{s.series_code: s for s in fetched_series}},
+                    envelope=envelope,
+                ),
+                cause=cause_from_error(exc),
+                status=getattr(exc, "status", None),
+                message_id=getattr(exc, "message_id", None),
+                http_status=getattr(exc, "http_status", None),
+            ) from exc
+        return build_data_code_response(
+            ordered_codes=normalized.code,
+            by_code={**cached, **{s.series_code: s for s in fetched.series}},
+            envelope=fetched.envelope,
+        )
+
+    def _read_series_cache(self, normalized: DataCodeQuery) -> dict[str, TimeSeries]:
+        cache = self._series_cache
+        if cache is None:
+            return {}
+        keys = [series_cache_key(normalized, code) for code in normalized.code]
+        hits = run_offloaded(partial(cache.get_many, keys), offload=cache.uses_disk)
+        return {key[2]: series for key, series in hits.items()}
+
+    def _write_series_cache(
+        self,
+        normalized: DataCodeQuery,
+        series: Sequence[TimeSeries],
+    ) -> None:
+        cache = self._series_cache
+        if cache is None or not series:
+            return
+        items = [(series_cache_key(normalized, item.series_code), item) for item in series]
+        run_offloaded(partial(cache.put_many, items), offload=cache.uses_disk)
+
+    def _get_data_code_windowed(
+        self,
+        normalized: DataCodeQuery,
+        windows: Sequence[DateWindowPlan],
+    ) -> DataCodeResponse:
+        logger.info(
+            "data_code windowed start db=%s total_codes=%s windows=%s",
+            normalized.db,
+            len(normalized.code),
+            len(windows),
+        )
+        window_queries = [
+            replace(normalized, start_date=window.start_date, end_date=window.end_date)
+            for window in windows
+        ]
+        outcomes = gather_bounded(
+            [
+                lambda _query=window_query: self._get_data_code_sequential(
+                    _query,
+                    allow_checkpoint=False,
+                )
+                for window_query in window_queries
+            ],
+            max_concurrency=self._max_concurrent_requests,
+        )
+
+        window_maps: list[dict[str, TimeSeries]] = []
+        last_envelope = make_success_envelope()
+        first_error: Exception | None = None
+        for outcome in outcomes:
+            if isinstance(outcome, BojValidationError):
+                raise outcome
+            if isinstance(outcome, BojPartialResultError):
+                window_maps.append({s.series_code: s for s in outcome.partial_result.series})
+                first_error = first_error or outcome
+                continue
+            if isinstance(outcome, Exception):
+                first_error = first_error or outcome
+                continue
+            window_maps.append({s.series_code: s for s in outcome.series})
+            last_envelope = outcome.envelope
+
+        response = build_data_code_response(
+            ordered_codes=normalized.code,
+            by_code=merge_window_series_maps(window_maps),
+            envelope=last_envelope,
+        )
+        if first_error is None:
+            logger.info("data_code windowed completed series=%s", len(response.series))
+            return response
+        if not response.series:
+            raise first_error
+        logger.warning(
+            "data_code windowed partial failure partial_series=%s cause=%s",
+            len(response.series),
+            cause_from_error(first_error),
+        )
+        raise BojPartialResultError(
+            "data_code windowed retrieval failed after partial progress",
+            partial_result=response,
+            cause=cause_from_error(first_error),
+            status=getattr(first_error, "status", None),
+            message_id=getattr(first_error, "message_id", None),
+            http_status=getattr(first_error, "http_status", None),
+        ) from first_error
+
+    def _get_data_code_sequential(
+        self,
+        normalized: DataCodeQuery,
+        *,
+        checkpoint_id: str | None = None,
+        allow_checkpoint: bool = True,
+        on_checkpoint: CheckpointCallback | None = None,
+    ) -> DataCodeResponse:
         code_chunks = chunk_codes(normalized.code, chunk_size=250)
         logger.info(
             "data_code start db=%s total_codes=%s chunks=%s",
@@ -103,11 +420,14 @@ class TimeSeriesService:
         last_envelope = make_success_envelope()
         resume_chunk_index = 0
         resume_start_position = 1
+        chain = CheckpointChain()
+        cadence = self._start_checkpoint_cadence() if allow_checkpoint else None
 
         if checkpoint_id is not None:
             state = self._checkpoint_manager.load_data_code(
                 checkpoint_id=checkpoint_id,
                 normalized=normalized,
+                chain=chain,
             )
             by_code = dict(state.by_code)
             last_envelope = state.last_envelope
@@ -136,7 +456,7 @@ class TimeSeriesService:
                         code_subset=chunk_plan.codes,
                         start_position=current_position,
                     )
-                    parsed = parse_data_code_response(payload)
+                    parsed = self._parse_payload(parse_data_code_response, payload)
                     last_envelope = parsed.envelope
                     merge_series_map(by_code, parsed.series)
                     next_position = next_position_or_raise(
@@ -147,6 +467,20 @@ class TimeSeriesService:
                     if next_position is None:
                         break
                     current_position = next_position
+                    if cadence is not None and cadence.advance(pages=1):
+                        self._save_progress_checkpoint(
+                            DataCodeCheckpointState(
+                                query=normalized,
+                                config_snapshot=self._checkpoint_manager.config_snapshot,
+                                by_code=dict(by_code),
+                                last_envelope=last_envelope,
+                                chunk_index=chunk_plan.chunk_index,
+                                start_position=current_position,
+                            ),
+                            chain=chain,
+                            cadence=cadence,
+                            on_checkpoint=on_checkpoint,
+                        )
                 logger.debug(
                     "data_code chunk done chunk_index=%s accumulated_series=%s",
                     chunk_plan.chunk_index + 1,
@@ -156,7 +490,7 @@ class TimeSeriesService:
                 if isinstance(exc, BojValidationError):
                     raise
                 emitted_checkpoint_id: str | None = None
-                if by_code and self._checkpoint_manager.enabled:
+                if by_code and allow_checkpoint and self._checkpoint_manager.enabled:
                     emitted_checkpoint_id = self._checkpoint_manager.save_data_code(
                         DataCodeCheckpointState(
                             query=normalized,
@@ -165,7 +499,8 @@ class TimeSeriesService:
                             last_envelope=last_envelope,
                             chunk_index=chunk_plan.chunk_index,
                             start_position=current_position,
-                        )
+                        ),
+                        chain=chain,
                     )
                 partial = build_data_code_response(
                     ordered_codes=normalized.code,
@@ -195,9 +530,26 @@ class TimeSeriesService:
                 )
                 raise
             resume_start_position = 1
+            if (
+                cadence is not None
+                and cadence.advance(pages=1, chunks=1)
+                and chunk_plan.chunk_index + 1 < len(code_chunks)
+            ):
+                self._save_progress_checkpoint(
+                    DataCodeCheckpointState(
+                        query=normalized,
+                        config_snapshot=self._checkpoint_manager.config_snapshot,
+                        by_code=dict(by_code),
+                        last_envelope=last_envelope,
+                        chunk_index=chunk_plan.chunk_index + 1,
+                        start_position=1,
+                    ),
+                    chain=chain,
+                    cadence=cadence,
+                    on_checkpoint=on_checkpoint,
+                )
 
-        if checkpoint_id is not None:
-            self._checkpoint_manager.cleanup(checkpoint_id)
+        self._checkpoint_manager.discard(chain.stored_ids)
 
         logger.info("data_code completed series=%s", len(by_code))
         return build_data_code_response(
@@ -211,31 +563,53 @@ class TimeSeriesService:
         query: DataLayerQuery,
         *,
         checkpoint_id: str | None = None,
+        deadline: float | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataLayerResponse:
         normalized = normalize_data_layer_query(query)
+        _validate_deadline(deadline)
+        with retry_budget_scope(self._job_retry_budget), deadline_scope(deadline):
+            return self._get_data_layer(
+                normalized,
+                checkpoint_id=checkpoint_id,
+                on_checkpoint=on_checkpoint,
+            )
 
+    def _get_data_layer(
+        self,
+        normalized: DataLayerQuery,
+        *,
+        checkpoint_id: str | None,
+        on_checkpoint: CheckpointCallback | None = None,
+    ) -> DataLayerResponse:
         if checkpoint_id is not None:
+            chain = CheckpointChain()
             state = self._checkpoint_manager.load_data_layer(
                 checkpoint_id=checkpoint_id,
                 normalized=normalized,
+                chain=chain,
             )
             if isinstance(state, DataLayerDirectCheckpointState):
-                response = self._get_data_layer_direct(normalized, checkpoint_state=state)
-            elif isinstance(state, DataLayerAutoPartitionCheckpointState):
-                response = self._get_data_layer_via_metadata(
+                return self._get_data_layer_direct(
                     normalized,
                     checkpoint_state=state,
+                    chain=chain,
+                    on_checkpoint=on_checkpoint,
                 )
-            else:
+            if not isinstance(state, DataLayerAutoPartitionCheckpointState):
                 raise BojValidationError("checkpoint path mismatch")
+            response = self._get_data_layer_via_metadata(
+                normalized,
+                checkpoint_state=state,
+            )
             self._checkpoint_manager.cleanup(checkpoint_id)
             return response
 
         if not self._enable_layer_auto_partition:
-            return self._get_data_layer_direct(normalized)
+            return self._get_data_layer_direct(normalized, on_checkpoint=on_checkpoint)
 
         try:
-            return self._get_data_layer_direct(normalized)
+            return self._get_data_layer_direct(normalized, on_checkpoint=on_checkpoint)
         except BojValidationError as exc:
             if not should_use_auto_partition(exc):
                 raise
@@ -251,8 +625,12 @@ class TimeSeriesService:
         normalized: DataLayerQuery,
         *,
         checkpoint_state: DataLayerDirectCheckpointState | None = None,
+        chain: CheckpointChain | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
     ) -> DataLayerResponse:
         logger.info("data_layer start db=%s frequency=%s", normalized.db, normalized.frequency)
+        chain = CheckpointChain() if chain is None else chain
+        cadence = self._start_checkpoint_cadence()
         by_code: dict[str, TimeSeries] = {}
         last_envelope = make_success_envelope()
         final_next_position = None
@@ -277,7 +655,7 @@ class TimeSeriesService:
                     normalized,
                     start_position=current_position,
                 )
-                parsed = parse_data_layer_response(payload)
+                parsed = self._parse_payload(parse_data_layer_response, payload)
                 last_envelope = parsed.envelope
                 merge_series_map(by_code, parsed.series)
                 if len(by_code) > 1250:
@@ -297,6 +675,20 @@ class TimeSeriesService:
                 if next_position is None:
                     break
                 current_position = next_position
+                if cadence is not None and cadence.advance(pages=1):
+                    self._save_progress_checkpoint(
+                        DataLayerDirectCheckpointState(
+                            query=normalized,
+                            config_snapshot=self._checkpoint_manager.config_snapshot,
+                            by_code=dict(by_code),
+                            last_envelope=last_envelope,
+                            start_position=current_position,
+                            next_position=final_next_position,
+                        ),
+                        chain=chain,
+                        cadence=cadence,
+                        on_checkpoint=on_checkpoint,
+                    )
         except Exception as exc:
             if isinstance(exc, BojValidationError):
                 raise
@@ -315,7 +707,8 @@ class TimeSeriesService:
                         last_envelope=last_envelope,
                         start_position=current_position,
                         next_position=final_next_position,
-                    )
+                    ),
+                    chain=chain,
                 )
             if partial_series:
                 logger.warning(
@@ -338,6 +731,7 @@ class TimeSeriesService:
                 ) from exc
             raise
 
+        self._checkpoint_manager.discard(chain.stored_ids)
         logger.info("data_layer completed series=%s", len(by_code))
         return build_data_layer_response_from_map(
             envelope=last_envelope,
@@ -423,15 +817,106 @@ class TimeSeriesService:
             next_position=None,
         )
 
+    def _start_checkpoint_cadence(self) -> CheckpointCadence | None:
+        policy = self._checkpoint_policy
+        if policy is None or not policy.enabled or not self._checkpoint_manager.enabled:
+            return None
+        return policy.start()
+
+    def _save_progress_checkpoint(
+        self,
+        state: DataCodeCheckpointState | DataLayerDirectCheckpointState,
+        *,
+        chain: CheckpointChain,
+        cadence: CheckpointCadence,
+        on_checkpoint: CheckpointCallback | None,
+    ) -> None:
+        cadence.mark_saved()
+        if not state.by_code:
+            return
+        try:
+            if isinstance(state, DataCodeCheckpointState):
+                checkpoint_id = self._checkpoint_manager.save_data_code(state, chain=chain)
+            else:
+                checkpoint_id = self._checkpoint_manager.save_data_layer_direct(state, chain=chain)
+        except Exception as exc:
+            # A failed progress save must not abort a healthy run.
+            logger.warning("progress checkpoint save failed cause=%s", type(exc).__name__)
+            return
+        logger.info(
+            "progress checkpoint saved checkpoint_id=%s series=%s",
+            checkpoint_id,
+            len(state.by_code),
+        )
+        if on_checkpoint is not None:
+            on_checkpoint(checkpoint_id)
+
+    def _parse_payload(
+        self,
+        parser: Callable[[dict[str, object]], _ParsedT],
+        payload: dict[str, object],
+    ) -> _ParsedT:
+        threshold = self._offload_parse_min_values
+        offload = threshold is not None and estimate_payload_weight(payload) >= threshold
+        return run_offloaded(
+            partial(parser, payload),
+            offload=offload,
+            executor=self._offload_executor,
+        )
+
     def get_metadata(self, query: MetadataQuery) -> MetadataResponse:
         normalized = normalize_metadata_query(query)
         logger.info("metadata start db=%s", normalized.db)
         payload = self._strict.execute_metadata(normalized)
-        parsed = parse_metadata_response(payload)
+        parsed = self._parse_payload(parse_metadata_response, payload)
         logger.info("metadata completed entries=%s", len(parsed.entries))
         return parsed
 
 
+def _with_resume_cursors(
+    pages: Iterator[dict[str, object]],
+    *,
+    kind: str,
+    digest: str,
+    chunk_index: int,
+    last_chunk: bool,
+) -> Iterator[tuple[dict[str, object], str | None]]:
+    """Pair each payload with the cursor of the page that follows it (None at the end)."""
+
+    try:
+        for payload in pages:
+            next_position = parse_next_position(payload)
+            if next_position is None and last_chunk:
+                yield payload, None
+                continue
+            cursor = ResumeCursor(
+                kind=kind,
+                chunk_index=chunk_index if next_position is not None else chunk_index + 1,
+                start_position=next_position if next_position is not None else 1,
+                query_digest=digest,
+            )
+            yield payload, encode_resume_cursor(cursor)
+    finally:
+        pages.close()
+
+
+def _parse_data_code_page(item: tuple[dict[str, object], str | None]) -> DataCodeResponse:
+    payload, cursor = item
+    return replace(parse_data_code_response(payload), resume_cursor=cursor)
+
+
+def _parse_data_layer_page(item: tuple[dict[str, object], str | None]) -> DataLayerResponse:
+    payload, cursor = item
+    return replace(parse_data_layer_response(payload), resume_cursor=cursor)
+
+
+def _validate_deadline(deadline: float | None) -> None:
+    if deadline is None:
+        return
+    if isinstance(deadline, bool) or not isinstance(deadline, (int, float)) or deadline < 0:
+        raise BojValidationError("deadline must be None or seconds >= 0")
+
+
 __all__ = [
     "TimeSeriesService",
 ]
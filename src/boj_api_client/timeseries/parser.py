@@ -157,6 +157,27 @@ def _metadata_from_item(item: JsonObject) -> MetadataEntry:
     )
 
 
+def estimate_payload_weight(payload: JsonObject) -> int:
+    """Return a cheap size estimate: RESULTSET entries plus observation values.
+
+    Malformed shapes count as zero so the real parser reports them.
+    """
+
+    raw = payload.get("RESULTSET")
+    if not isinstance(raw, list):
+        return 0
+    weight = len(raw)
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        values_obj = item.get("VALUES")
+        if isinstance(values_obj, dict):
+            values = values_obj.get("VALUES")
+            if isinstance(values, list):
+                weight += len(values)
+    return weight
+
+
 def parse_metadata_response(payload: JsonObject) -> MetadataResponse:
     envelope = ApiEnvelope.from_payload(payload)
     entries = tuple(_metadata_from_item(item) for item in _as_resultset(payload))
@@ -164,6 +185,7 @@ def parse_metadata_response(payload: JsonObject) -> MetadataResponse:
 
 
 __all__ = [
+    "estimate_payload_weight",
     "parse_data_code_response",
     "parse_data_layer_response",
     "parse_metadata_response",
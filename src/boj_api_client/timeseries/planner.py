@@ -60,6 +60,94 @@ def plan_data_code_chunks(
     return plans
 
 
+@dataclass(slots=True, frozen=True)
+class DateWindowPlan:
+    window_index: int
+    start_date: str | None
+    end_date: str | None
+
+
+# Sub-annual periods per year for the 6-digit ``YYYYPP`` dates of each BOJ
+# frequency code. Monthly, weekly and daily series all use ``YYYYMM``.
+_PERIODS_PER_YEAR = {
+    "M": 12,
+    "W": 12,
+    "D": 12,
+    "Q": 4,
+    "CH": 2,
+    "FH": 2,
+}
+DATE_WINDOW_FREQUENCIES = frozenset(_PERIODS_PER_YEAR)
+
+
+def _parse_period(value: str, periods_per_year: int | None) -> tuple[int, int] | None:
+    """Return ``(ordinal, periods_per_year)`` for ``YYYY`` or ``YYYYPP`` period strings."""
+
+    text = value.strip()
+    if not text.isdigit():
+        return None
+    if len(text) == 4:
+        return int(text), 1
+    if len(text) == 6 and periods_per_year is not None:
+        period = int(text[4:])
+        if not 1 <= period <= periods_per_year:
+            return None
+        return int(text[:4]) * periods_per_year + (period - 1), periods_per_year
+    return None
+
+
+def _format_period(ordinal: int, periods_per_year: int) -> str:
+    if periods_per_year == 1:
+        return f"{ordinal:04d}"
+    year, period_index = divmod(ordinal, periods_per_year)
+    return f"{year:04d}{period_index + 1:02d}"
+
+
+def plan_date_windows(
+    *,
+    start_date: str | None,
+    end_date: str | None,
+    window_count: int,
+    frequency: str | None = None,
+) -> list[DateWindowPlan]:
+    """Split an inclusive ``start_date``/``end_date`` range into contiguous windows.
+
+    ``YYYY`` ranges can always be split. 6-digit ranges are only split when
+    ``frequency`` says how to read them: ``YYYYMM`` for ``M``/``W``/``D``,
+    ``YYYYQQ`` for ``Q`` and ``YYYYHH`` for ``CH``/``FH``. Any other range is
+    returned unchanged as a single window.
+    """
+
+    if window_count < 1:
+        raise ValueError("window_count must be >= 1")
+    single = [DateWindowPlan(window_index=0, start_date=start_date, end_date=end_date)]
+    if window_count == 1 or start_date is None or end_date is None:
+        return single
+    periods_per_year = _PERIODS_PER_YEAR.get((frequency or "").upper())
+    start = _parse_period(start_date, periods_per_year)
+    end = _parse_period(end_date, periods_per_year)
+    if start is None or end is None or start[1] != end[1] or start[0] > end[0]:
+        return single
+
+    per_year = start[1]
+    total_periods = end[0] - start[0] + 1
+    count = min(window_count, total_periods)
+    base_size, remainder = divmod(total_periods, count)
+    windows: list[DateWindowPlan] = []
+    cursor = start[0]
+    for index in range(count):
+        size = base_size + (1 if index < remainder else 0)
+        windows.append(
+            DateWindowPlan(
+                window_index=index,
+                start_date=_format_period(cursor, per_year),
+                end_date=_format_period(cursor + size - 1, per_year),
+            )
+        )
+        cursor += size
+    return windows
+
+
 def should_use_auto_partition(
     error: BojValidationError,
     *,
@@ -84,10 +172,13 @@ def next_position_or_raise(
 
 
 __all__ = [
+    "DATE_WINDOW_FREQUENCIES",
     "AUTO_PARTITION_LIMIT_MARKER",
     "DataCodeChunkPlan",
+    "DateWindowPlan",
     "chunk_codes",
     "plan_data_code_chunks",
+    "plan_date_windows",
     "should_use_auto_partition",
     "next_position_or_raise",
 ]
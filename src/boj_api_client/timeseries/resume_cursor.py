@@ -0,0 +1,82 @@
+"""Opaque resume cursors for the ``iter_data_code`` / ``iter_data_layer`` streams.
+
+Each yielded page carries the position of the *next* page: the code-chunk
+index plus ``startPosition``. A cursor is bound to its normalized query, so
+passing it back with a different query fails fast instead of silently
+skipping data.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+
+from ..core.errors import BojValidationError
+from .queries import DataCodeQuery, DataLayerQuery
+
+_CURSOR_PREFIX = "bjr1."
+
+
+@dataclass(slots=True, frozen=True)
+class ResumeCursor:
+    kind: str
+    chunk_index: int
+    start_position: int
+    query_digest: str
+
+
+def query_digest(query: DataCodeQuery | DataLayerQuery) -> str:
+    encoded = json.dumps(asdict(query), sort_keys=True, separators=(",", ":"), default=list)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_resume_cursor(cursor: ResumeCursor) -> str:
+    body = json.dumps(
+        [cursor.kind, cursor.chunk_index, cursor.start_position, cursor.query_digest],
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return _CURSOR_PREFIX + base64.urlsafe_b64encode(body).decode("ascii").rstrip("=")
+
+
+def decode_resume_cursor(
+    token: str,
+    *,
+    kind: str,
+    normalized: DataCodeQuery | DataLayerQuery,
+) -> ResumeCursor:
+    if not isinstance(token, str) or not token.startswith(_CURSOR_PREFIX):
+        raise BojValidationError("resume cursor is invalid")
+    body = token[len(_CURSOR_PREFIX) :]
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+        cursor = ResumeCursor(
+            kind=raw[0],
+            chunk_index=raw[1],
+            start_position=raw[2],
+            query_digest=raw[3],
+        )
+    except (binascii.Error, ValueError, TypeError, IndexError, KeyError) as exc:
+        raise BojValidationError("resume cursor is invalid") from exc
+    if (
+        len(raw) != 4
+        or not all(isinstance(value, int) and not isinstance(value, bool) for value in raw[1:3])
+        or cursor.chunk_index < 0
+        or cursor.start_position < 1
+    ):
+        raise BojValidationError("resume cursor is invalid")
+    if cursor.kind != kind:
+        raise BojValidationError("resume cursor kind mismatch")
+    if cursor.query_digest != query_digest(normalized):
+        raise BojValidationError("resume cursor query mismatch")
+    return cursor
+
+
+__all__ = [
+    "ResumeCursor",
+    "decode_resume_cursor",
+    "encode_resume_cursor",
+    "query_digest",
+]
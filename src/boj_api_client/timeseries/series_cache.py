@@ -0,0 +1,308 @@
+"""Two-tier cache of parsed series used by ``TimeSeriesService``.
+
+L1 is an in-process LRU bounded by estimated bytes. L2 stores each series in
+the compact binary form of :mod:`.series_codec`, so warm reads skip both the
+network and JSON parsing. Both tiers are keyed by
+``(db, lang, series_code, start_date, end_date)``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+from .models import TimeSeries
+from .queries import DataCodeQuery
+from .series_codec import decode_series, encode_series
+
+logger = logging.getLogger("boj_api_client")
+
+SeriesCacheKey = tuple[str, str, str, str | None, str | None]
+
+_DISK_HEADER = struct.Struct("<4sd")
+_DISK_MAGIC = b"BJC1"
+# Trimming below the cap leaves headroom, so writes after a trim do not each rescan.
+_DISK_TRIM_RATIO = 0.9
+_SERIES_BASE_BYTES = 400
+_POINT_BYTES = 150
+
+
+def series_cache_key(query: DataCodeQuery, series_code: str) -> SeriesCacheKey:
+    return (query.db, query.lang, series_code, query.start_date, query.end_date)
+
+
+def estimate_series_bytes(series: TimeSeries) -> int:
+    """Rough in-memory footprint of a parsed series, used for L1 accounting."""
+
+    text = sum(
+        len(value)
+        for value in (
+            series.series_code,
+            series.name,
+            series.unit,
+            series.frequency,
+            series.category,
+            series.last_update,
+        )
+        if value
+    )
+    return _SERIES_BASE_BYTES + 2 * text + _POINT_BYTES * len(series.points)
+
+
+class MemorySeriesCache:
+    """Thread-safe LRU of parsed series bounded by estimated bytes."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[SeriesCacheKey, tuple[TimeSeries, int, float]] = OrderedDict()
+        self._size_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._size_bytes
+
+    def get(self, key: SeriesCacheKey) -> TimeSeries | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            series, _, stored_at = entry
+            if self._clock() - stored_at >= self._ttl_seconds:
+                self._remove_locked(key)
+                return None
+            self._entries.move_to_end(key)
+            return series
+
+    def put(self, key: SeriesCacheKey, series: TimeSeries, *, age_seconds: float = 0.0) -> None:
+        """Store ``series``; ``age_seconds`` backdates entries promoted from a slower tier."""
+
+        size = estimate_series_bytes(series)
+        with self._lock:
+            self._remove_locked(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (series, size, self._clock() - age_seconds)
+            self._size_bytes += size
+            while self._size_bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+
+    def _remove_locked(self, key: SeriesCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+
+class DiskSeriesCache:
+    """One binary file per series; expiry uses wall-clock time so it survives restarts.
+
+    With ``max_bytes`` set, the directory is trimmed oldest-file-first once the
+    bytes written push it over the cap. The running total is an estimate
+    refreshed by each trim, so other processes sharing the directory are
+    accounted for at the next trim rather than on every write.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | Path,
+        ttl_seconds: float = 3600.0,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be None or >= 1")
+        self._directory = Path(directory).resolve()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._clock = clock or time.time
+        self._lock = threading.Lock()
+        self._estimated_bytes = self._scan_bytes() if max_bytes is not None else 0
+
+    def get(self, key: SeriesCacheKey) -> TimeSeries | None:
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: SeriesCacheKey) -> tuple[TimeSeries, float] | None:
+        """Return the cached series and its age in seconds."""
+
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            magic, stored_at = _DISK_HEADER.unpack_from(data)
+            if magic != _DISK_MAGIC:
+                raise ValueError("unknown series cache file")
+            series = decode_series(memoryview(data)[_DISK_HEADER.size :])
+        except (struct.error, ValueError):
+            logger.warning("corrupt series cache entry removed path=%s", path)
+            self._unlink(path)
+            return None
+        age = max(0.0, self._clock() - stored_at)
+        if age >= self._ttl_seconds:
+            self._unlink(path)
+            return None
+        if series.series_code != key[2]:
+            return None
+        return series, age
+
+    def put(self, key: SeriesCacheKey, series: TimeSeries) -> None:
+        path = self._path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        blob = encode_series(series)
+        try:
+            with tmp_path.open("wb") as file_obj:
+                file_obj.write(_DISK_HEADER.pack(_DISK_MAGIC, self._clock()))
+                file_obj.write(blob)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("series cache write failed path=%s", path)
+            self._unlink(tmp_path)
+            return
+        if self._max_bytes is None:
+            return
+        with self._lock:
+            self._estimated_bytes += _DISK_HEADER.size + len(blob)
+            if self._estimated_bytes > self._max_bytes:
+                self._estimated_bytes = self._trim_locked(int(self._max_bytes * _DISK_TRIM_RATIO))
+
+    def purge_expired(self) -> int:
+        """Remove expired and unreadable entries; return how many files were removed."""
+
+        removed = 0
+        now = self._clock()
+        for path in self._directory.glob("*.bjs"):
+            try:
+                with path.open("rb") as file_obj:
+                    magic, stored_at = _DISK_HEADER.unpack(file_obj.read(_DISK_HEADER.size))
+            except FileNotFoundError:
+                continue
+            except (OSError, struct.error):
+                magic, stored_at = b"", now - self._ttl_seconds
+            if magic != _DISK_MAGIC or now - stored_at >= self._ttl_seconds:
+                self._unlink(path)
+                removed += 1
+        if removed and self._max_bytes is not None:
+            with self._lock:
+                self._estimated_bytes = self._scan_bytes()
+        return removed
+
+    def _trim_locked(self, max_bytes: int) -> int:
+        files = []
+        for path in self._directory.glob("*.bjs"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        files.sort()
+        for _, size, path in files:
+            if total <= max_bytes:
+                break
+            self._unlink(path)
+            total -= size
+        return total
+
+    def _scan_bytes(self) -> int:
+        total = 0
+        for path in self._directory.glob("*.bjs"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _path_for(self, key: SeriesCacheKey) -> Path:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:40]
+        return self._directory / f"{digest}.bjs"
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        except OSError:
+            logger.warning("series cache cleanup failed path=%s", path)
+
+
+class TieredSeriesCache:
+    """Reads L1 first, then L2 (promoting hits to L1); writes go to both tiers."""
+
+    def __init__(
+        self,
+        *,
+        memory: MemorySeriesCache | None = None,
+        disk: DiskSeriesCache | None = None,
+    ) -> None:
+        if memory is None and disk is None:
+            raise ValueError("at least one cache tier is required")
+        self._memory = memory
+        self._disk = disk
+
+    @property
+    def uses_disk(self) -> bool:
+        return self._disk is not None
+
+    def get_many(self, keys: Sequence[SeriesCacheKey]) -> dict[SeriesCacheKey, TimeSeries]:
+        hits: dict[SeriesCacheKey, TimeSeries] = {}
+        for key in keys:
+            series = self._memory.get(key) if self._memory is not None else None
+            if series is None and self._disk is not None:
+                entry = self._disk.get_entry(key)
+                if entry is not None:
+                    series, age = entry
+                    if self._memory is not None:
+                        # Keep the disk entry's age so promotion does not extend its TTL.
+                        self._memory.put(key, series, age_seconds=age)
+            if series is not None:
+                hits[key] = series
+        return hits
+
+    def put_many(self, items: Iterable[tuple[SeriesCacheKey, TimeSeries]]) -> None:
+        for key, series in items:
+            if self._memory is not None:
+                self._memory.put(key, series)
+            if self._disk is not None:
+                self._disk.put(key, series)
+
+
+__all__ = [
+    "DiskSeriesCache",
+    "MemorySeriesCache",
+    "SeriesCacheKey",
+    "TieredSeriesCache",
+    "estimate_series_bytes",
+    "series_cache_key",
+]
@@ -0,0 +1,216 @@
+"""Compact binary encoding of :class:`TimeSeries`.
+
+Layout (little endian)::
+
+    b"BJS1" | u32 header length | UTF-8 JSON header | u32 point count
+            | float64 values[count] | null bitmap | int bitmap
+
+The header holds the series attributes and survey dates. Observations are
+stored as an ``array('d')`` column plus two ``ceil(count / 8)`` byte
+bitmaps (bit ``i`` is ``1 << (i % 8)`` of byte ``i // 8``): one marks nulls,
+the other marks values that were ``int`` so they come back as ``int`` rather
+than ``float``. Series whose values are not plain numbers keep them in the
+header instead (point count 0).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .models import TimeSeries, TimeSeriesPoint
+
+SERIES_CODEC_MAGIC = b"BJS1"
+_U32 = struct.Struct("<I")
+_MAX_EXACT_INT = 2**53
+
+
+@dataclass(slots=True, frozen=True)
+class ColumnarSeries:
+    series_code: str
+    name: str | None
+    unit: str | None
+    frequency: str | None
+    category: str | None
+    last_update: str | None
+    survey_dates: tuple[str, ...]
+    values: array
+    nulls: bytes
+    ints: bytes
+
+    def to_time_series(self) -> TimeSeries:
+        values: list[int | float | None] = self.values.tolist()
+        if self.ints == _full_bitmap(len(values)):
+            values = list(map(int, values))
+        else:
+            for idx in _set_bits(self.ints):
+                values[idx] = int(values[idx])
+        for idx in _set_bits(self.nulls):
+            values[idx] = None
+        return TimeSeries(
+            series_code=self.series_code,
+            name=self.name,
+            unit=self.unit,
+            frequency=self.frequency,
+            category=self.category,
+            last_update=self.last_update,
+            points=tuple(map(TimeSeriesPoint, self.survey_dates, values)),
+        )
+
+
+def encode_point_values(values: list[object]) -> tuple[array, bytes, bytes] | None:
+    """Encode observation values as a column plus null and int bitmaps.
+
+    Returns ``None`` when a value is not numeric; integers outside the exactly
+    representable float range also return ``None`` so the caller can keep the
+    object form without losing precision.
+    """
+
+    encoded = array("d", bytes(8 * len(values)))
+    nulls = bytearray(_bitmap_size(len(values)))
+    ints = bytearray(len(nulls))
+    for idx, value in enumerate(values):
+        if value is None:
+            nulls[idx >> 3] |= 1 << (idx & 7)
+        elif isinstance(value, bool):
+            return None
+        elif isinstance(value, int):
+            if abs(value) > _MAX_EXACT_INT:
+                return None
+            encoded[idx] = float(value)
+            ints[idx >> 3] |= 1 << (idx & 7)
+        elif isinstance(value, float):
+            encoded[idx] = value
+        else:
+            return None
+    return encoded, bytes(nulls), bytes(ints)
+
+
+def _bitmap_size(count: int) -> int:
+    return (count + 7) >> 3
+
+
+def _full_bitmap(count: int) -> bytes:
+    full, rest = divmod(count, 8)
+    return b"\xff" * full + (bytes(((1 << rest) - 1,)) if rest else b"")
+
+
+def _set_bits(bitmap: bytes) -> Iterator[int]:
+    for byte_idx, byte in enumerate(bitmap):
+        while byte:
+            low = byte & -byte
+            yield (byte_idx << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def encode_series(series: TimeSeries) -> bytes:
+    values = [point.value for point in series.points]
+    header: dict[str, object] = {
+        "c": series.series_code,
+        "n": series.name,
+        "u": series.unit,
+        "f": series.frequency,
+        "g": series.category,
+        "l": series.last_update,
+        "d": [point.survey_date for point in series.points],
+    }
+    encoded = encode_point_values(values)
+    if encoded is None:
+        header["v"] = values
+        column, nulls, ints = array("d"), b"", b""
+    else:
+        column, nulls, ints = encoded
+        if sys.byteorder != "little":
+            column.byteswap()
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"".join(
+        (
+            SERIES_CODEC_MAGIC,
+            _U32.pack(len(header_bytes)),
+            header_bytes,
+            _U32.pack(len(column)),
+            column.tobytes(),
+            nulls,
+            ints,
+        )
+    )
+
+
+def decode_series(data: bytes | memoryview) -> TimeSeries:
+    """Decode :func:`encode_series` output; raises ``ValueError`` when malformed."""
+
+    view = memoryview(data)
+    if bytes(view[:4]) != SERIES_CODEC_MAGIC:
+        raise ValueError("not an encoded series")
+    try:
+        (header_len,) = _U32.unpack_from(view, 4)
+        header_end = 8 + header_len
+        header = json.loads(bytes(view[8:header_end]).decode("utf-8"))
+        (count,) = _U32.unpack_from(view, header_end)
+    except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("corrupt encoded series") from exc
+    values_start = header_end + 4
+    nulls_start = values_start + 8 * count
+    ints_start = nulls_start + _bitmap_size(count)
+    if len(view) != ints_start + _bitmap_size(count) or not isinstance(header, dict):
+        raise ValueError("corrupt encoded series")
+    try:
+        return _decode_body(header, view, count, values_start, nulls_start, ints_start)
+    except (KeyError, TypeError, IndexError) as exc:
+        raise ValueError("corrupt encoded series") from exc
+
+
+def _decode_body(
+    header: dict[str, Any],
+    view: memoryview,
+    count: int,
+    values_start: int,
+    nulls_start: int,
+    ints_start: int,
+) -> TimeSeries:
+    survey_dates = tuple(header["d"])
+    if "v" in header:
+        values = header["v"]
+        if count or len(values) != len(survey_dates):
+            raise ValueError("corrupt encoded series")
+        return TimeSeries(
+            series_code=header["c"],
+            name=header["n"],
+            unit=header["u"],
+            frequency=header["f"],
+            category=header["g"],
+            last_update=header["l"],
+            points=tuple(map(TimeSeriesPoint, survey_dates, values)),
+        )
+    if len(survey_dates) != count:
+        raise ValueError("corrupt encoded series")
+    column = array("d")
+    column.frombytes(view[values_start:nulls_start])
+    if sys.byteorder != "little":
+        column.byteswap()
+    return ColumnarSeries(
+        series_code=header["c"],
+        name=header["n"],
+        unit=header["u"],
+        frequency=header["f"],
+        category=header["g"],
+        last_update=header["l"],
+        survey_dates=survey_dates,
+        values=column,
+        nulls=bytes(view[nulls_start:ints_start]),
+        ints=bytes(view[ints_start:]),
+    ).to_time_series()
+
+
+__all__ = [
+    "ColumnarSeries",
+    "SERIES_CODEC_MAGIC",
+    "decode_series",
+    "encode_point_values",
+    "encode_series",
+]
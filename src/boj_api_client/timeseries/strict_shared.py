@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 
+from ..core.errors import BojValidationError
 from .params import build_data_code_params, build_data_layer_params, build_metadata_params
 from .queries import DataCodeQuery, DataLayerQuery, MetadataQuery
 from .validators import (
@@ -49,19 +52,123 @@ def _build_strict_data_layer_query(
     )
 
 
-def build_strict_data_code_params(
+_TRAILING_PARAM_KEYS = frozenset({"startDate", "endDate"})
+_PREPARED_CACHE_SIZE = 256
+
+
+@dataclass(slots=True, frozen=True)
+class PreparedChunkRequest:
+    """Validated request parameters for one chunk; only ``startPosition`` varies per page."""
+
+    leading: tuple[tuple[str, str], ...]
+    trailing: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_params(cls, params: dict[str, str]) -> "PreparedChunkRequest":
+        return cls(
+            leading=tuple((k, v) for k, v in params.items() if k not in _TRAILING_PARAM_KEYS),
+            trailing=tuple((k, v) for k, v in params.items() if k in _TRAILING_PARAM_KEYS),
+        )
+
+    def params(self, *, start_position: int) -> dict[str, str]:
+        if start_position < 1:
+            raise BojValidationError("start_position must be >= 1")
+        params = dict(self.leading)
+        if start_position > 1:
+            params["startPosition"] = str(start_position)
+        params.update(self.trailing)
+        return params
+
+
+def prepare_strict_data_code_request(
     query: DataCodeQuery,
     *,
     code_subset: Sequence[str],
-    start_position: int,
-) -> dict[str, str]:
+) -> PreparedChunkRequest:
     strict_query = _build_strict_data_code_query(
         query,
         code_subset=code_subset,
-        start_position=start_position,
+        start_position=1,
     )
+    if _is_hashable(strict_query):
+        return _prepare_data_code_cached(strict_query)
+    return _prepare_data_code(strict_query)
+
+
+def prepare_strict_data_layer_request(query: DataLayerQuery) -> PreparedChunkRequest:
+    strict_query = _build_strict_data_layer_query(query, start_position=1)
+    if _is_hashable(strict_query):
+        return _prepare_data_layer_cached(strict_query)
+    return _prepare_data_layer(strict_query)
+
+
+def _is_hashable(strict_query: DataCodeQuery | DataLayerQuery) -> bool:
+    # Queries built from caller input may hold unhashable field values; those
+    # skip the LRU and still reach strict validation.
+    try:
+        hash(strict_query)
+    except TypeError:
+        return False
+    return True
+
+
+def _prepare_data_code(strict_query: DataCodeQuery) -> PreparedChunkRequest:
     strict_validate_data_code_query(strict_query)
-    return build_data_code_params(strict_query, start_position=start_position)
+    return PreparedChunkRequest.from_params(build_data_code_params(strict_query, start_position=1))
+
+
+def _prepare_data_layer(strict_query: DataLayerQuery) -> PreparedChunkRequest:
+    strict_validate_data_layer_query(strict_query)
+    return PreparedChunkRequest.from_params(build_data_layer_params(strict_query, start_position=1))
+
+
+_prepare_data_code_cached = lru_cache(maxsize=_PREPARED_CACHE_SIZE)(_prepare_data_code)
+_prepare_data_layer_cached = lru_cache(maxsize=_PREPARED_CACHE_SIZE)(_prepare_data_layer)
+
+
+class PreparedRequestCache:
+    """Per-service memo that skips even the cache-key hash for the chunk being paged.
+
+    The resilient orchestrator passes the same query and ``code_subset`` tuple
+    for every page of a chunk, so an identity check on the last entry is
+    enough; anything else falls back to the value-keyed LRU above.
+    """
+
+    def __init__(self) -> None:
+        self._last_data_code: tuple[object, object, PreparedChunkRequest] | None = None
+        self._last_data_layer: tuple[object, PreparedChunkRequest] | None = None
+
+    def data_code(
+        self,
+        query: DataCodeQuery,
+        *,
+        code_subset: Sequence[str],
+    ) -> PreparedChunkRequest:
+        last = self._last_data_code
+        if last is not None and last[0] is query and last[1] is code_subset:
+            return last[2]
+        prepared = prepare_strict_data_code_request(query, code_subset=code_subset)
+        if isinstance(code_subset, tuple):
+            self._last_data_code = (query, code_subset, prepared)
+        return prepared
+
+    def data_layer(self, query: DataLayerQuery) -> PreparedChunkRequest:
+        last = self._last_data_layer
+        if last is not None and last[0] is query:
+            return last[1]
+        prepared = prepare_strict_data_layer_request(query)
+        self._last_data_layer = (query, prepared)
+        return prepared
+
+
+def build_strict_data_code_params(
+    query: DataCodeQuery,
+    *,
+    code_subset: Sequence[str],
+    start_position: int,
+) -> dict[str, str]:
+    prepared = prepare_strict_data_code_request(query, code_subset=code_subset)
+    return prepared.params(start_position=start_position)
 
 
 def build_strict_data_layer_params(
@@ -69,12 +176,7 @@ def build_strict_data_layer_params(
     *,
     start_position: int,
 ) -> dict[str, str]:
-    strict_query = _build_strict_data_layer_query(
-        query,
-        start_position=start_position,
-    )
-    strict_validate_data_layer_query(strict_query)
-    return build_data_layer_params(strict_query, start_position=start_position)
+    return prepare_strict_data_layer_request(query).params(start_position=start_position)
 
 
 def build_strict_metadata_params(query: MetadataQuery) -> dict[str, str]:
@@ -83,6 +185,10 @@ def build_strict_metadata_params(query: MetadataQuery) -> dict[str, str]:
 
 
 __all__ = [
+    "PreparedChunkRequest",
+    "PreparedRequestCache",
+    "prepare_strict_data_code_request",
+    "prepare_strict_data_layer_request",
     "build_strict_data_code_params",
     "build_strict_data_layer_params",
     "build_strict_metadata_params",
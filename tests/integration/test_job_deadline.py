@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
+from boj_api_client.core.errors import BojPartialResultError, BojTransportError, BojValidationError
+from boj_api_client.core.job_context import deadline_scope
+from boj_api_client.core.transport import SyncTransport
+from boj_api_client.timeseries.orchestrator import TimeSeriesService
+from boj_api_client.timeseries.queries import DataLayerQuery
+from boj_api_client.timeseries.strict import StrictTimeSeriesService
+from tests.shared.transport import Response, build_config
+
+
+class _SlowSecondPageClient:
+    def __init__(self, fixture_loader, *, stall_seconds: float):
+        self._load = fixture_loader
+        self._stall_seconds = stall_seconds
+        self.now = 0.0
+        self.calls = 0
+
+    def get(self, endpoint: str, params: dict[str, str], **options: object):
+        self.calls += 1
+        if str(params.get("startPosition", "1")) == "1":
+            return Response(200, copy.deepcopy(self._load("get_data_layer_page1.json")))
+        self.now += self._stall_seconds
+        raise TimeoutError("read timed out")
+
+    def close(self):
+        return None
+
+
+def _build_service(client) -> TimeSeriesService:
+    transport = SyncTransport(build_config(max_attempts=5), client=client)
+    return TimeSeriesService(
+        StrictTimeSeriesService(transport),
+        checkpoint_store=MemoryCheckpointStore(),
+    )
+
+
+def test_deadline_returns_partial_result_with_checkpoint(fixture_loader):
+    client = _SlowSecondPageClient(fixture_loader, stall_seconds=30.0)
+    service = _build_service(client)
+    query = DataLayerQuery(db="MD10", frequency="Q", layer1="*", lang="EN")
+
+    with deadline_scope(10.0, clock=lambda: client.now):
+        with pytest.raises(BojPartialResultError) as exc:
+            service.get_data_layer(query)
+
+    assert exc.value.cause == "deadline"
+    assert exc.value.checkpoint_id is not None
+    assert exc.value.partial_result.next_position == 255
+    assert client.calls == 2
+
+
+def test_expired_deadline_fails_before_first_request(fixture_loader):
+    client = _SlowSecondPageClient(fixture_loader, stall_seconds=0.0)
+    service = _build_service(client)
+
+    with pytest.raises(BojTransportError) as exc:
+        service.get_data_layer(DataLayerQuery(db="MD10", frequency="Q", layer1="*"), deadline=0.0)
+
+    assert exc.value.cause == "deadline"
+    assert client.calls == 0
+
+
+def test_negative_deadline_is_rejected(fixture_loader):
+    service = _build_service(_SlowSecondPageClient(fixture_loader, stall_seconds=0.0))
+
+    with pytest.raises(BojValidationError):
+        service.get_data_layer(DataLayerQuery(db="MD10", frequency="Q", layer1="*"), deadline=-1.0)
@@ -36,7 +36,7 @@ def test_http_400_body_200_is_protocol_error():
 )
 def test_http_error_with_missing_body_status_is_mapped_by_http_status(http_status, expected_error):
     client = SyncSequencedClient([Response(http_status, {"MESSAGE": "missing status"})])
-    transport = SyncTransport(build_config(), client=client, sleeper=lambda _: None, clock=lambda: 0.0)
+    transport = SyncTransport(build_config(max_attempts=1), client=client, sleeper=lambda _: None, clock=lambda: 0.0)
     with pytest.raises(expected_error):
         transport.request("/getMetadata", params={"db": "FM08"})
 
@@ -51,7 +51,7 @@ def test_http_error_with_missing_body_status_is_mapped_by_http_status(http_statu
 )
 def test_http_error_with_non_json_body_is_mapped_by_http_status(http_status, expected_error):
     client = SyncSequencedClient([Response(http_status, ValueError("not json"))])
-    transport = SyncTransport(build_config(), client=client, sleeper=lambda _: None, clock=lambda: 0.0)
+    transport = SyncTransport(build_config(max_attempts=1), client=client, sleeper=lambda _: None, clock=lambda: 0.0)
     with pytest.raises(expected_error):
         transport.request("/getMetadata", params={"db": "FM08"})
 
@@ -58,6 +58,8 @@ class CheckpointAwareTimeSeriesService:
     def __init__(self):
         self.code_checkpoint_id: str | None = None
         self.layer_checkpoint_id: str | None = None
+        self.code_resume_from: str | None = None
+        self.layer_resume_from: str | None = None
 
     def get_data_code(self, query: DataCodeQuery, *, checkpoint_id: str | None = None):
         self.code_checkpoint_id = checkpoint_id
@@ -70,11 +72,13 @@ class CheckpointAwareTimeSeriesService:
     def get_metadata(self, query: MetadataQuery):
         return MetadataResponse(envelope=make_success_envelope(), entries=[])
 
-    def iter_data_code(self, query: DataCodeQuery):
+    def iter_data_code(self, query: DataCodeQuery, *, resume_from: str | None = None):
+        self.code_resume_from = resume_from
         if False:
             yield None
 
-    def iter_data_layer(self, query: DataLayerQuery):
+    def iter_data_layer(self, query: DataLayerQuery, *, resume_from: str | None = None):
+        self.layer_resume_from = resume_from
         if False:
             yield None
 
@@ -83,6 +87,8 @@ class CheckpointAwareAsyncTimeSeriesService:
     def __init__(self):
         self.code_checkpoint_id: str | None = None
         self.layer_checkpoint_id: str | None = None
+        self.code_resume_from: str | None = None
+        self.layer_resume_from: str | None = None
 
     async def get_data_code(
         self,
@@ -105,11 +111,13 @@ class CheckpointAwareAsyncTimeSeriesService:
     async def get_metadata(self, query: MetadataQuery) -> MetadataResponse:
         return MetadataResponse(envelope=make_success_envelope(), entries=[])
 
-    async def iter_data_code(self, query: DataCodeQuery):
+    async def iter_data_code(self, query: DataCodeQuery, *, resume_from: str | None = None):
+        self.code_resume_from = resume_from
         if False:
             yield None
 
-    async def iter_data_layer(self, query: DataLayerQuery):
+    async def iter_data_layer(self, query: DataLayerQuery, *, resume_from: str | None = None):
+        self.layer_resume_from = resume_from
         if False:
             yield None
 
@@ -6,9 +6,10 @@ from boj_api_client.config import BojClientConfig, RetryConfig, ThrottlingConfig
 
 
 class Response:
-    def __init__(self, status_code: int, payload: object):
+    def __init__(self, status_code: int, payload: object, *, headers: dict[str, str] | None = None):
         self.status_code = status_code
         self._payload = payload
+        self.headers = headers or {}
 
     def json(self) -> object:
         if isinstance(self._payload, Exception):
@@ -23,9 +24,11 @@ class SyncSequencedClient:
     def __init__(self, steps: Sequence[Step]):
         self.steps = list(steps)
         self.calls = 0
+        self.options: list[dict[str, object]] = []
 
-    def get(self, endpoint: str, params: dict[str, str]):
+    def get(self, endpoint: str, params: dict[str, str], **options: object):
         self.calls += 1
+        self.options.append(options)
         step = self.steps.pop(0)
         if isinstance(step, Exception):
             raise step
@@ -40,9 +43,11 @@ class AsyncSequencedClient:
         self.steps = list(steps)
         self.calls = 0
         self.closed = False
+        self.options: list[dict[str, object]] = []
 
-    async def get(self, endpoint: str, params: dict[str, str]):
+    async def get(self, endpoint: str, params: dict[str, str], **options: object):
         self.calls += 1
+        self.options.append(options)
         step = self.steps.pop(0)
         if isinstance(step, Exception):
             raise step
@@ -10,6 +10,8 @@ from boj_api_client.timeseries.aggregation import (
     build_data_layer_response_from_series,
     cause_from_error,
     merge_series_map,
+    merge_sorted_points,
+    merge_window_series_maps,
 )
 from boj_api_client.timeseries.models import TimeSeries, TimeSeriesPoint
 
@@ -77,3 +79,29 @@ def test_build_data_layer_response_from_series_sorts_by_series_code():
 )
 def test_cause_from_error(error: Exception, expected: str):
     assert cause_from_error(error) == expected
+
+
+def test_merge_sorted_points_interleaves_and_prefers_right_on_ties():
+    left = _series("A", [("202401", 1), ("202403", 3)]).points
+    right = _series("A", [("202402", 2), ("202403", 30), ("202404", 4)]).points
+
+    merged = merge_sorted_points(left, right)
+
+    assert [(p.survey_date, p.value) for p in merged] == [
+        ("202401", 1),
+        ("202402", 2),
+        ("202403", 30),
+        ("202404", 4),
+    ]
+
+
+def test_merge_window_series_maps_concatenates_windows_per_series():
+    merged = merge_window_series_maps(
+        [
+            {"A": _series("A", [("202401", 1)])},
+            {"A": _series("A", [("202402", 2)]), "B": _series("B", [("202402", 5)])},
+        ]
+    )
+
+    assert list(merged) == ["A", "B"]
+    assert [point.survey_date for point in merged["A"].points] == ["202401", "202402"]
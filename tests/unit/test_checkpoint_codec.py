@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pickle
+import zlib
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+from boj_api_client.core.errors import BojValidationError
+from boj_api_client.timeseries import checkpoint_codec
+from boj_api_client.timeseries.checkpoint_codec import (
+    SERIES_MAP_MAGIC,
+    parse_series_map,
+    resolve_checkpoint_compression,
+    serialize_series_map,
+)
+from boj_api_client.timeseries.models import TimeSeries, TimeSeriesPoint
+
+
+def _series(code: str, points: int = 120) -> TimeSeries:
+    return TimeSeries(
+        series_code=code,
+        name=f"{code} name",
+        unit="u",
+        frequency="MONTHLY",
+        category="c",
+        last_update="20260101",
+        points=tuple(
+            TimeSeriesPoint(
+                survey_date=str(200001 + idx),
+                value=None if idx % 7 == 0 else (idx if idx % 2 else idx / 3),
+            )
+            for idx in range(points)
+        ),
+    )
+
+
+def test_series_map_blob_round_trips_nulls_ints_and_floats():
+    by_code = {"B": _series("B"), "A": _series("A", points=0)}
+
+    blob = serialize_series_map(by_code)
+
+    assert blob.startswith(SERIES_MAP_MAGIC)
+    assert parse_series_map(blob) == by_code
+
+
+def test_series_map_blob_is_smaller_than_pickled_asdict_form():
+    by_code = {f"S{idx:03d}": _series(f"S{idx:03d}") for idx in range(50)}
+    legacy = pickle.dumps({code: asdict(series) for code, series in by_code.items()})
+
+    assert len(serialize_series_map(by_code)) * 3 < len(legacy)
+
+
+def test_parse_series_map_still_accepts_legacy_asdict_records():
+    series = _series("A", points=3)
+
+    assert parse_series_map({"A": asdict(series)}) == {"A": series}
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [SERIES_MAP_MAGIC, SERIES_MAP_MAGIC + b"\x01garbage", SERIES_MAP_MAGIC + b"\x09abc", b"XXXX\x01"],
+)
+def test_parse_series_map_rejects_corrupt_blobs(blob):
+    with pytest.raises(BojValidationError, match="checkpoint by_code is invalid"):
+        parse_series_map(blob)
+
+
+def test_parse_series_map_reports_missing_compression_package(monkeypatch):
+    monkeypatch.setattr(checkpoint_codec, "_optional_module", lambda name: None)
+
+    with pytest.raises(BojValidationError, match=r"pip install 'boj-api-client\[zstd\]'"):
+        parse_series_map(SERIES_MAP_MAGIC + b"\x03payload")
+
+
+def _fake_zstandard() -> SimpleNamespace:
+    return SimpleNamespace(
+        ZstdCompressor=lambda level: SimpleNamespace(compress=zlib.compress),
+        ZstdDecompressor=lambda: SimpleNamespace(decompress=zlib.decompress),
+    )
+
+
+def test_series_map_blob_defaults_to_zlib_even_when_zstd_is_installed(monkeypatch):
+    monkeypatch.setattr(checkpoint_codec, "_optional_module", lambda name: _fake_zstandard())
+    by_code = {"A": _series("A")}
+
+    blob = serialize_series_map(by_code)
+
+    assert blob[len(SERIES_MAP_MAGIC)] == 1
+    assert parse_series_map(blob) == by_code
+
+
+def test_series_map_blob_uses_zstd_only_when_chosen(monkeypatch):
+    monkeypatch.setattr(checkpoint_codec, "_optional_module", lambda name: _fake_zstandard())
+    by_code = {"A": _series("A")}
+
+    blob = serialize_series_map(by_code, compression="zstd")
+
+    assert blob[len(SERIES_MAP_MAGIC)] == 3
+    assert parse_series_map(blob) == by_code
+
+
+def test_resolve_checkpoint_compression_rejects_unknown_or_missing_codecs(monkeypatch):
+    monkeypatch.setattr(checkpoint_codec, "_optional_module", lambda name: None)
+
+    assert resolve_checkpoint_compression("zlib") == "zlib"
+    with pytest.raises(ValueError, match="must be one of zlib, zstd, lz4"):
+        resolve_checkpoint_compression("brotli")
+    with pytest.raises(ImportError, match=r"pip install 'boj-api-client\[lz4\]'"):
+        resolve_checkpoint_compression("lz4")
@@ -5,7 +5,9 @@ import pytest
 from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
 from boj_api_client.core.errors import BojValidationError
 from boj_api_client.core.models import ApiEnvelope
+from boj_api_client.timeseries.checkpoint_codec import parse_series_map
 from boj_api_client.timeseries.checkpoint_manager import CheckpointManager
+from boj_api_client.timeseries.checkpoint_models import CheckpointChain
 from boj_api_client.timeseries.checkpoint_state import (
     DataCodeCheckpointState,
     DataLayerAutoPartitionCheckpointState,
@@ -176,3 +178,104 @@ def test_checkpoint_manager_rejects_point_with_missing_survey_date():
 
     with pytest.raises(BojValidationError, match="checkpoint points is invalid"):
         manager.load_data_code(checkpoint_id=checkpoint_id, normalized=query)
+
+
+def _data_code_state(query: DataCodeQuery, by_code: dict[str, TimeSeries], chunk_index: int):
+    return DataCodeCheckpointState(
+        query=query,
+        config_snapshot={},
+        by_code=by_code,
+        last_envelope=ApiEnvelope(status=200, message_id="M181000I", message="ok", date=None),
+        chunk_index=chunk_index,
+        start_position=1,
+    )
+
+
+def test_checkpoint_manager_saves_deltas_and_compacts_chain_on_load():
+    query = DataCodeQuery(db="CO", code=["A", "B", "C"])
+    store = MemoryCheckpointStore()
+    manager = CheckpointManager(store=store)
+    chain = CheckpointChain()
+    by_code = {"A": _series("A")}
+    first_id = manager.save_data_code(_data_code_state(query, by_code, 0), chain=chain)
+    by_code = {**by_code, "B": _series("B"), "C": _series("C")}
+    head_id = manager.save_data_code(_data_code_state(query, by_code, 2), chain=chain)
+
+    head_record = store.load(head_id)
+    assert head_record["parents"] == [first_id]
+    assert sorted(parse_series_map(head_record["by_code"])) == ["B", "C"]
+    assert chain.record_ids == (first_id, head_id)
+
+    resumed = CheckpointChain()
+    loaded = manager.load_data_code(checkpoint_id=head_id, normalized=query, chain=resumed)
+    assert list(loaded.by_code) == ["A", "B", "C"]
+    assert loaded.chunk_index == 2
+    assert resumed.record_ids == (first_id, head_id)
+
+    manager.cleanup(head_id)
+    for checkpoint_id in (first_id, head_id):
+        with pytest.raises(BojValidationError, match="not found"):
+            store.load(checkpoint_id)
+
+
+def test_checkpoint_manager_restarts_chain_before_parents_expire():
+    now = [0.0]
+    query = DataCodeQuery(db="CO", code=["A", "B", "C"])
+    store = MemoryCheckpointStore(ttl_seconds=100.0, clock=lambda: now[0])
+    manager = CheckpointManager(store=store)
+    chain = CheckpointChain()
+    by_code = {"A": _series("A")}
+    root_id = manager.save_data_code(_data_code_state(query, by_code, 0), chain=chain)
+    now[0] = 49.0
+    by_code = {**by_code, "B": _series("B")}
+    delta_id = manager.save_data_code(_data_code_state(query, by_code, 1), chain=chain)
+    assert store.load(delta_id)["parents"] == [root_id]
+
+    now[0] = 50.0
+    by_code = {**by_code, "C": _series("C")}
+    head_id = manager.save_data_code(_data_code_state(query, by_code, 2), chain=chain)
+    assert "parents" not in store.load(head_id)
+    assert chain.record_ids == (head_id,)
+    assert chain.retired_ids == (root_id, delta_id)
+
+    now[0] = 120.0
+    loaded = manager.load_data_code(checkpoint_id=head_id, normalized=query)
+    assert list(loaded.by_code) == ["A", "B", "C"]
+
+
+def test_checkpoint_manager_resumed_chain_keeps_root_age():
+    now = [0.0]
+    query = DataCodeQuery(db="CO", code=["A", "B", "C"])
+    store = MemoryCheckpointStore(ttl_seconds=100.0, clock=lambda: now[0])
+    manager = CheckpointManager(store=store)
+    root_id = manager.save_data_code(
+        _data_code_state(query, {"A": _series("A")}, 0),
+        chain=CheckpointChain(),
+    )
+
+    now[0] = 30.0
+    resumed = CheckpointChain()
+    loaded = manager.load_data_code(checkpoint_id=root_id, normalized=query, chain=resumed)
+    by_code = {**loaded.by_code, "B": _series("B")}
+    delta_id = manager.save_data_code(_data_code_state(query, by_code, 1), chain=resumed)
+    assert store.load(delta_id)["parents"] == [root_id]
+
+    now[0] = 60.0
+    again = CheckpointChain()
+    loaded = manager.load_data_code(checkpoint_id=delta_id, normalized=query, chain=again)
+    by_code = {**loaded.by_code, "C": _series("C")}
+    head_id = manager.save_data_code(_data_code_state(query, by_code, 2), chain=again)
+    assert "parents" not in store.load(head_id)
+    assert again.retired_ids == (root_id, delta_id)
+
+
+def test_checkpoint_manager_hands_snapshot_stores_series_by_reference():
+    query = DataCodeQuery(db="CO", code=["A"])
+    store = MemoryCheckpointStore()
+    manager = CheckpointManager(store=store)
+    series = _series("A")
+    checkpoint_id = manager.save_data_code(_data_code_state(query, {"A": series}, 0))
+
+    assert store.load(checkpoint_id)["by_code"] == {"A": series}
+    loaded = manager.load_data_code(checkpoint_id=checkpoint_id, normalized=query)
+    assert loaded.by_code["A"] is series
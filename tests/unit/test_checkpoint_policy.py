@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+
+from boj_api_client.timeseries.checkpoint_policy import CheckpointPolicy
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_checkpoint_cadence_fires_on_pages_chunks_or_elapsed_time():
+    clock = _Clock()
+    cadence = CheckpointPolicy(every_pages=3, every_chunks=2, every_seconds=60.0).start(clock)
+
+    assert not cadence.advance(pages=2)
+    assert cadence.advance(pages=1)
+    cadence.mark_saved()
+    assert not cadence.advance(pages=1, chunks=1)
+    assert cadence.advance(chunks=1)
+    cadence.mark_saved()
+    clock.now = 60.0
+    assert cadence.advance()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"every_pages": 0}, {"every_chunks": True}, {"every_seconds": 0.0}],
+)
+def test_checkpoint_policy_rejects_invalid_values(kwargs):
+    with pytest.raises(ValueError):
+        CheckpointPolicy(**kwargs)
+
+
+def test_checkpoint_policy_without_thresholds_is_disabled():
+    assert not CheckpointPolicy().enabled
+    assert CheckpointPolicy(every_seconds=1.0).enabled
@@ -4,6 +4,7 @@ import pytest
 
 from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
 from boj_api_client.core.errors import BojValidationError
+from boj_api_client.timeseries.models import TimeSeries, TimeSeriesPoint
 
 
 class _FakeClock:
@@ -60,6 +61,29 @@ def test_memory_checkpoint_store_state_is_copied():
     assert loaded["nested"]["cursor"] == 1
 
 
+def test_memory_checkpoint_store_shares_frozen_series_and_copies_containers():
+    store = MemoryCheckpointStore()
+    series = TimeSeries(
+        series_code="A",
+        name=None,
+        unit=None,
+        frequency=None,
+        category=None,
+        last_update=None,
+        points=[TimeSeriesPoint(survey_date="202401", value=1.0)],
+    )
+    original = {"by_code": {"A": series}, "codes": ["A"]}
+    checkpoint_id = store.save(original)
+    original["by_code"]["B"] = series
+    original["codes"].append("B")
+
+    loaded = store.load(checkpoint_id)
+    assert loaded == {"by_code": {"A": series}, "codes": ["A"]}
+    assert loaded["by_code"]["A"] is series
+    loaded["codes"].append("C")
+    assert store.load(checkpoint_id)["codes"] == ["A"]
+
+
 @pytest.mark.parametrize("checkpoint_id", ["", "missing", "../escape", "A" * 32, "a" * 31])
 def test_memory_checkpoint_store_rejects_invalid_checkpoint_id(checkpoint_id: str):
     store = MemoryCheckpointStore()
@@ -69,3 +93,28 @@ def test_memory_checkpoint_store_rejects_invalid_checkpoint_id(checkpoint_id: st
 
     with pytest.raises(BojValidationError, match="checkpoint_id is invalid"):
         store.delete(checkpoint_id)
+
+
+def test_memory_checkpoint_store_without_lazy_purge_keeps_expired_until_swept():
+    clock = _FakeClock()
+    store = MemoryCheckpointStore(ttl_seconds=1.0, clock=clock, lazy_purge=False)
+    expired_id = store.save({"cursor": 1})
+    clock.advance(2.0)
+    live_id = store.save({"cursor": 2})
+
+    assert store.load(live_id) == {"cursor": 2}
+    assert store.purge_expired() == 1
+    assert store.purge_expired() == 0
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        store.load(expired_id)
+    assert store.load(live_id) == {"cursor": 2}
+
+
+def test_memory_checkpoint_store_without_lazy_purge_still_rejects_expired_load():
+    clock = _FakeClock()
+    store = MemoryCheckpointStore(ttl_seconds=1.0, clock=clock, lazy_purge=False)
+    checkpoint_id = store.save({"cursor": 1})
+
+    clock.advance(2.0)
+    with pytest.raises(BojValidationError, match="checkpoint_id expired"):
+        store.load(checkpoint_id)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import pickle
 
 import pytest
@@ -127,3 +128,75 @@ def test_file_checkpoint_store_rejects_invalid_checkpoint_id(tmp_path, checkpoin
 
     with pytest.raises(BojValidationError, match="checkpoint_id is invalid"):
         store.delete(checkpoint_id)
+
+
+def test_file_checkpoint_store_purge_reads_file_expiry_without_unpickling(tmp_path, monkeypatch):
+    clock = _FakeClock()
+    store = FileCheckpointStore(base_dir=tmp_path, ttl_seconds=2.0, clock=clock)
+    expired_id = store.save({"cursor": 1})
+    clock.advance(3.0)
+    reads: list[str] = []
+    original_read = FileCheckpointStore._read
+
+    def _counting_read(self, path):
+        reads.append(path.name)
+        return original_read(self, path)
+
+    monkeypatch.setattr(FileCheckpointStore, "_read", _counting_read)
+    alive_id = store.save({"cursor": 2})
+    store.delete(alive_id)
+
+    assert reads == []
+    assert not (tmp_path / f"{expired_id}.pkl").exists()
+
+
+def test_file_checkpoint_store_instances_sharing_a_directory_keep_each_others_expiry(tmp_path):
+    clock = _FakeClock()
+    first = FileCheckpointStore(base_dir=tmp_path, ttl_seconds=2.0, clock=clock)
+    second = FileCheckpointStore(base_dir=tmp_path, ttl_seconds=10.0, clock=clock)
+    short_id = first.save({"cursor": 1})
+    long_id = second.save({"cursor": 2})
+
+    clock.advance(3.0)
+    assert first.purge_expired() == 1
+    assert not (tmp_path / f"{short_id}.pkl").exists()
+    assert first.load(long_id)["cursor"] == 2
+
+
+def test_file_checkpoint_store_save_and_delete_touch_only_their_own_file(tmp_path, monkeypatch):
+    store = FileCheckpointStore(base_dir=tmp_path, lazy_purge=False)
+    existing = [store.save({"cursor": index}) for index in range(50)]
+    before = {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+    replaced: list[str] = []
+    original_replace = os.replace
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError("foreground operation scanned the directory")
+
+    def _recording_replace(src, dst):
+        replaced.append(os.path.basename(dst))
+        original_replace(src, dst)
+
+    monkeypatch.setattr(os, "scandir", _no_scan)
+    monkeypatch.setattr(os, "replace", _recording_replace)
+    new_id = store.save({"cursor": 50})
+    store.delete(existing[0])
+
+    assert replaced == [f"{new_id}.pkl"]
+    after = {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+    del before[f"{existing[0]}.pkl"]
+    del after[f"{new_id}.pkl"]
+    assert after == before
+
+
+def test_file_checkpoint_store_purge_expired_without_lazy_purge(tmp_path):
+    clock = _FakeClock()
+    store = FileCheckpointStore(base_dir=tmp_path, ttl_seconds=2.0, clock=clock, lazy_purge=False)
+    expired_id = store.save({"cursor": 1})
+    clock.advance(3.0)
+    alive_id = store.save({"cursor": 2})
+
+    assert (tmp_path / f"{expired_id}.pkl").exists()
+    assert store.purge_expired() == 1
+    assert not (tmp_path / f"{expired_id}.pkl").exists()
+    assert store.load(alive_id)["cursor"] == 2
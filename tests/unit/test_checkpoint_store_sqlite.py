@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import sqlite3
+
+import pytest
+
+from boj_api_client.core.checkpoint_store import SqliteCheckpointStore
+from boj_api_client.core.errors import BojValidationError
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _save_many(path: str, count: int, queue) -> None:
+    store = SqliteCheckpointStore(path=path)
+    queue.put([store.save({"worker": True, "index": index}) for index in range(count)])
+    store.close()
+
+
+def test_sqlite_checkpoint_store_save_load_and_delete_roundtrip(tmp_path):
+    store = SqliteCheckpointStore(path=tmp_path / "checkpoints.db")
+    checkpoint_id = store.save({"cursor": 10, "series": {"A": [1, 2]}})
+
+    assert store.load(checkpoint_id) == {"cursor": 10, "series": {"A": [1, 2]}}
+    store.delete(checkpoint_id)
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        store.load(checkpoint_id)
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        store.delete(checkpoint_id)
+
+
+def test_sqlite_checkpoint_store_uses_wal_and_compresses_states(tmp_path):
+    path = tmp_path / "checkpoints.db"
+    store = SqliteCheckpointStore(path=path)
+    store.save({"values": [0.0] * 10_000})
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        (blob,) = connection.execute("SELECT state FROM checkpoints").fetchone()
+    assert len(blob) < 2_000
+
+
+def test_sqlite_checkpoint_store_expires_and_purges(tmp_path):
+    clock = _FakeClock()
+    store = SqliteCheckpointStore(path=tmp_path / "checkpoints.db", ttl_seconds=2.0, clock=clock)
+    expired_id = store.save({"cursor": 1})
+    clock.advance(1.0)
+    alive_id = store.save({"cursor": 2})
+    clock.advance(1.5)
+
+    assert store.load(alive_id)["cursor"] == 2
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        store.load(expired_id)
+    clock.advance(1.0)
+    with pytest.raises(BojValidationError, match="checkpoint_id expired"):
+        store.load(alive_id)
+
+
+def test_sqlite_checkpoint_store_removes_corrupt_rows(tmp_path, caplog):
+    path = tmp_path / "checkpoints.db"
+    store = SqliteCheckpointStore(path=path)
+    checkpoint_id = store.save({"cursor": 1})
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE checkpoints SET state = ?", (b"garbage",))
+
+    caplog.set_level(logging.WARNING, logger="boj_api_client")
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        store.load(checkpoint_id)
+    assert "corrupt checkpoint removed" in caplog.text
+
+
+def test_sqlite_checkpoint_store_batch_commits_together(tmp_path):
+    path = tmp_path / "checkpoints.db"
+    store = SqliteCheckpointStore(path=path)
+
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.save({"cursor": 1})
+            raise RuntimeError("abort")
+    with store.batch():
+        first = store.save({"cursor": 1})
+        second = store.save({"cursor": 2})
+
+    with sqlite3.connect(path) as connection:
+        ids = {row[0] for row in connection.execute("SELECT id FROM checkpoints")}
+    assert ids == {first, second}
+
+
+def test_sqlite_checkpoint_store_read_batch_does_not_lock_out_writers(tmp_path):
+    path = tmp_path / "checkpoints.db"
+    store = SqliteCheckpointStore(path=path, lazy_purge=False)
+    checkpoint_id = store.save({"cursor": 1})
+    writer = sqlite3.connect(path, timeout=0.0, isolation_level=None)
+    insert = "INSERT INTO checkpoints VALUES (?, 0.0, x'00')"
+    try:
+        with store.batch(write=False):
+            assert store.load(checkpoint_id) == {"cursor": 1}
+            writer.execute(insert, ("b" * 32,))
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            with store.batch():
+                writer.execute(insert, ("c" * 32,))
+    finally:
+        writer.close()
+        store.close()
+
+
+def test_sqlite_checkpoint_store_is_shared_by_worker_processes(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    workers = [context.Process(target=_save_many, args=(path, 10, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    saved = [checkpoint_id for _ in workers for checkpoint_id in queue.get(timeout=60)]
+    for worker in workers:
+        worker.join(timeout=60)
+
+    store = SqliteCheckpointStore(path=path)
+    assert len(set(saved)) == 30
+    assert all(store.load(checkpoint_id)["worker"] for checkpoint_id in saved)
+
+
+def test_sqlite_checkpoint_store_purge_expired_without_lazy_purge(tmp_path):
+    clock = _FakeClock()
+    path = tmp_path / "checkpoints.db"
+    store = SqliteCheckpointStore(path=path, ttl_seconds=2.0, clock=clock, lazy_purge=False)
+    store.save({"cursor": 1})
+    store.save({"cursor": 2})
+    clock.advance(3.0)
+    alive_id = store.save({"cursor": 3})
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM checkpoints").fetchone() == (3,)
+    assert store.purge_expired() == 2
+    assert store.load(alive_id)["cursor"] == 3
+    store.close()
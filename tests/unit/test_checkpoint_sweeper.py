@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+
+from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
+from boj_api_client.core.checkpoint_sweeper import CheckpointSweeper
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _SignallingStore:
+    def __init__(self, store: MemoryCheckpointStore, *, fail: bool = False) -> None:
+        self._store = store
+        self._fail = fail
+        self.swept = threading.Event()
+
+    def purge_expired(self) -> int:
+        try:
+            if self._fail:
+                raise OSError("disk gone")
+            return self._store.purge_expired()
+        finally:
+            self.swept.set()
+
+
+def test_checkpoint_sweeper_purges_expired_checkpoints_in_background():
+    clock = _FakeClock()
+    store = MemoryCheckpointStore(ttl_seconds=1.0, clock=clock, lazy_purge=False)
+    store.save({"cursor": 1})
+    clock.advance(2.0)
+    alive_id = store.save({"cursor": 2})
+    signalling = _SignallingStore(store)
+
+    with CheckpointSweeper(signalling, interval_seconds=0.01) as sweeper:
+        assert sweeper.running
+        assert signalling.swept.wait(timeout=5.0)
+    assert not sweeper.running
+
+    assert store.purge_expired() == 0
+    assert store.load(alive_id) == {"cursor": 2}
+
+
+def test_checkpoint_sweeper_logs_failures_and_keeps_running(caplog):
+    store = _SignallingStore(MemoryCheckpointStore(), fail=True)
+    sweeper = CheckpointSweeper(store, interval_seconds=60.0)
+
+    with caplog.at_level(logging.WARNING, logger="boj_api_client"):
+        assert sweeper.sweep() == 0
+    assert "checkpoint sweep failed" in caplog.text
+
+
+def test_checkpoint_sweeper_rejects_non_positive_interval():
+    with pytest.raises(ValueError, match="interval_seconds"):
+        CheckpointSweeper(MemoryCheckpointStore(), interval_seconds=0)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+from boj_api_client.core.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+)
+from boj_api_client.core.errors import BojUnavailableError
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=10.0, clock=clock)
+
+    breaker.record_failure("getDataCode")
+    breaker.before_request("getDataCode")
+    breaker.record_failure("getDataCode")
+
+    assert breaker.state("getDataCode") == CIRCUIT_OPEN
+    assert breaker.state("getMetadata") == CIRCUIT_CLOSED
+    with pytest.raises(BojUnavailableError) as exc_info:
+        breaker.before_request("getDataCode")
+    assert exc_info.value.cause == "circuit_open"
+    breaker.before_request("getMetadata")
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=10.0)
+    breaker.record_failure("getDataCode")
+    breaker.record_success("getDataCode")
+    breaker.record_failure("getDataCode")
+    assert breaker.state("getDataCode") == CIRCUIT_CLOSED
+
+
+@pytest.mark.parametrize(("probe_ok", "expected"), [(True, CIRCUIT_CLOSED), (False, CIRCUIT_OPEN)])
+def test_half_open_allows_single_probe(probe_ok, expected):
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=10.0, clock=clock)
+    breaker.record_failure("getDataCode")
+
+    clock.now = 10.0
+    breaker.before_request("getDataCode")
+    assert breaker.state("getDataCode") == CIRCUIT_HALF_OPEN
+    with pytest.raises(BojUnavailableError):
+        breaker.before_request("getDataCode")
+
+    if probe_ok:
+        breaker.record_success("getDataCode")
+    else:
+        breaker.record_failure("getDataCode")
+    assert breaker.state("getDataCode") == expected
+
+
+def test_abandoned_probe_expires_after_recovery_period():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=5.0, clock=clock)
+    breaker.record_failure("getDataCode")
+    clock.now = 5.0
+    breaker.before_request("getDataCode")
+    clock.now = 10.0
+    breaker.before_request("getDataCode")
+
+
+def test_released_probe_lets_next_request_probe_immediately():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=5.0, clock=clock)
+    breaker.record_failure("getDataCode")
+    clock.now = 5.0
+    breaker.before_request("getDataCode")
+
+    breaker.release_probe("getDataCode")
+
+    breaker.before_request("getDataCode")
+    assert breaker.state("getDataCode") == CIRCUIT_HALF_OPEN
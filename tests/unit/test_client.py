@@ -105,3 +105,18 @@ def test_client_passes_checkpoint_id_to_delegate_service():
     assert delegate.code_checkpoint_id == "cp-code"
     assert delegate.layer_checkpoint_id == "cp-layer"
 
+
+def test_client_passes_resume_cursor_to_delegate_iterators():
+    delegate = CheckpointAwareTimeSeriesService()
+    with BojClient(transport=DummyTransport(), timeseries_service=delegate) as client:
+        list(client.timeseries.iter_data_code(DataCodeQuery(db="CO", code=["A"]), resume_from="cur-code"))
+        list(
+            client.timeseries.iter_data_layer(
+                DataLayerQuery(db="MD10", frequency="Q", layer1="*"),
+                resume_from="cur-layer",
+            )
+        )
+
+    assert delegate.code_resume_from == "cur-code"
+    assert delegate.layer_resume_from == "cur-layer"
+
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from boj_api_client.client import BojClient
+from boj_api_client.config import BojClientConfig, TransportConfig
+from boj_api_client.core.client_pool import DEFAULT_CLIENT_POOL, SharedClientPool
+from boj_api_client.core.transport import SyncTransport
+from tests.shared.transport import Response, build_config
+
+
+class _FakeHttpClient:
+    def __init__(self, config: BojClientConfig):
+        self.config = config
+        self.closed = 0
+        self.calls = 0
+
+    def get(self, endpoint: str, params: dict[str, str]):
+        self.calls += 1
+        return Response(200, {"STATUS": 200, "MESSAGEID": "M181000I", "RESULTSET": []})
+
+    def close(self):
+        self.closed += 1
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_shared_client_pool_reference_counts_and_closes_once_idle():
+    clock = _FakeClock()
+    pool = SharedClientPool(
+        factory=_FakeHttpClient,  # type: ignore[arg-type]
+        idle_timeout_seconds=30.0,
+        clock=clock,
+    )
+    cfg = build_config(max_attempts=1)
+
+    first = pool.acquire(cfg)
+    second = pool.acquire(cfg)
+    other = pool.acquire(replace(cfg, base_url="https://example.invalid/api/"))
+
+    assert first is second
+    assert other is not first
+    pool.release(first)
+    pool.release(second)
+    assert first.closed == 0
+    assert len(pool) == 2
+    pool.release(first)
+    clock.now = 30.0
+    pool.release(other)
+    assert first.closed == 1
+    assert other.closed == 0
+    assert len(pool) == 1
+    pool.close()
+    assert other.closed == 1
+    assert len(pool) == 0
+
+
+def test_shared_client_pool_reuses_idle_client_for_sequential_leases():
+    clock = _FakeClock()
+    pool = SharedClientPool(
+        factory=_FakeHttpClient,  # type: ignore[arg-type]
+        idle_timeout_seconds=30.0,
+        clock=clock,
+    )
+    cfg = build_config(max_attempts=1)
+
+    first = pool.acquire(cfg)
+    pool.release(first)
+    clock.now = 29.0
+    second = pool.acquire(cfg)
+    pool.release(second)
+    clock.now = 60.0
+    third = pool.acquire(cfg)
+
+    assert second is first
+    assert first.closed == 1
+    assert third is not first
+
+
+def test_shared_client_pool_without_idle_timeout_closes_on_last_release():
+    pool = SharedClientPool(factory=_FakeHttpClient, idle_timeout_seconds=0.0)  # type: ignore[arg-type]
+    client = pool.acquire(build_config(max_attempts=1))
+    pool.release(client)
+    assert client.closed == 1
+    assert len(pool) == 0
+
+
+def test_sync_transports_share_pooled_client_until_last_close():
+    pool = SharedClientPool(factory=_FakeHttpClient, idle_timeout_seconds=0.0)  # type: ignore[arg-type]
+    cfg = build_config(max_attempts=1)
+    first = SyncTransport(cfg, client_pool=pool)
+    second = SyncTransport(cfg, client_pool=pool)
+
+    first.request("/getMetadata", params={"db": "FM08"})
+    second.request("/getMetadata", params={"db": "FM08"})
+    shared = first._client
+    first.close()
+    first.close()
+
+    assert shared is second._client
+    assert shared.calls == 2
+    assert shared.closed == 0
+    second.close()
+    assert shared.closed == 1
+
+
+def test_clients_share_default_pool_when_enabled():
+    config = BojClientConfig(transport=TransportConfig(share_connection_pool=True))
+    try:
+        with BojClient(config=config) as first, BojClient(config=config) as second:
+            assert first._transport._client is second._transport._client
+            assert len(DEFAULT_CLIENT_POOL) == 1
+        with BojClient(config=config) as third:
+            assert third._transport._client is first._transport._client
+        assert len(DEFAULT_CLIENT_POOL) == 1
+    finally:
+        DEFAULT_CLIENT_POOL.close()
+    assert len(DEFAULT_CLIENT_POOL) == 0
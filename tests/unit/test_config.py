@@ -6,8 +6,10 @@ import pytest
 
 from boj_api_client.config import (
     BojClientConfig,
+    CacheConfig,
     CheckpointConfig,
     RetryConfig,
+    RetryRule,
     ThrottlingConfig,
     TimeSeriesConfig,
     TransportConfig,
@@ -44,10 +46,27 @@ def test_config_default_checkpoint_enabled():
         ("retry", "total_retry_budget_seconds", -1.0),
         ("throttling", "min_wait_interval_seconds", -1.0),
         ("checkpoint", "ttl_seconds", 0.0),
+        ("checkpoint", "save_every_pages", 0),
+        ("checkpoint", "save_every_chunks", True),
+        ("checkpoint", "save_every_seconds", 0.0),
         ("transport", "timeout_connect_seconds", 0.0),
         ("transport", "timeout_read_seconds", 0.0),
         ("transport", "timeout_write_seconds", 0.0),
         ("transport", "timeout_pool_seconds", 0.0),
+        ("transport", "keepalive_expiry_seconds", 0.0),
+        ("transport", "max_connections", 0),
+        ("transport", "max_keepalive_connections", 0),
+        ("transport", "http2", "yes"),
+        ("transport", "circuit_breaker_failure_threshold", 0),
+        ("transport", "circuit_breaker_recovery_seconds", -1.0),
+        ("transport", "hedge_percentile", 1.0),
+        ("transport", "hedge_min_samples", 0),
+        ("transport", "hedge_endpoints", ["getDataCode"]),
+        ("retry", "base_backoff_seconds", -1.0),
+        ("retry", "jitter", "full"),
+        ("retry", "job_retry_budget", -1),
+        ("retry", "rules", (RetryRule(),)),
+        ("retry", "rules", (RetryRule(statuses=(503,), max_attempts=0),)),
     ],
 )
 def test_config_validate_rejects_invalid_numeric_values(section, field, value):
@@ -62,12 +81,77 @@ def test_config_validate_rejects_invalid_numeric_values(section, field, value):
         cfg.validate()
 
 
+def test_config_default_checkpoint_compression_is_zlib():
+    assert BojClientConfig().checkpoint.compression == "zlib"
+
+
+def test_config_validate_rejects_unknown_checkpoint_compression():
+    cfg = BojClientConfig(checkpoint=CheckpointConfig(compression="brotli"))
+    with pytest.raises(ValueError, match="checkpoint.compression must be one of zlib, zstd, lz4"):
+        cfg.validate()
+
+
 def test_config_validate_rejects_non_bool_checkpoint_enabled():
     cfg = BojClientConfig(checkpoint=CheckpointConfig(enabled="yes"))  # type: ignore[arg-type]
     with pytest.raises(ValueError, match="checkpoint.enabled must be bool"):
         cfg.validate()
 
 
+@pytest.mark.parametrize("field", ["data_code_date_windows", "max_concurrent_requests"])
+@pytest.mark.parametrize("value", [0, True, 1.5])
+def test_config_validate_rejects_invalid_timeseries_counts(field, value):
+    cfg = BojClientConfig(timeseries=TimeSeriesConfig(**{field: value}))
+    with pytest.raises(ValueError, match=f"timeseries.{field} must be int >= 1"):
+        cfg.validate()
+
+
+@pytest.mark.parametrize("value", ["monthly", "CY", ""])
+def test_config_validate_rejects_unsplittable_window_frequency(value):
+    cfg = BojClientConfig(timeseries=TimeSeriesConfig(data_code_window_frequency=value))
+    with pytest.raises(ValueError, match="timeseries.data_code_window_frequency must be None or one of"):
+        cfg.validate()
+
+
+@pytest.mark.parametrize("value", [-1, True])
+def test_config_validate_rejects_invalid_prefetch_depth(value):
+    cfg = BojClientConfig(timeseries=TimeSeriesConfig(prefetch_depth=value))
+    with pytest.raises(ValueError, match="timeseries.prefetch_depth must be int >= 0"):
+        cfg.validate()
+
+
+@pytest.mark.parametrize("value", [-1, True, 1.5])
+def test_config_validate_rejects_invalid_offload_thresholds(value):
+    cfg = BojClientConfig(transport=TransportConfig(offload_json_min_bytes=value))
+    with pytest.raises(ValueError, match="transport.offload_json_min_bytes must be None or int >= 0"):
+        cfg.validate()
+    cfg = BojClientConfig(timeseries=TimeSeriesConfig(offload_parse_min_values=value))
+    with pytest.raises(
+        ValueError,
+        match="timeseries.offload_parse_min_values must be None or int >= 0",
+    ):
+        cfg.validate()
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("enabled", "yes", "cache.enabled must be bool"),
+        ("max_entries", 0, "cache.max_entries must be int >= 1"),
+        ("ttl_seconds", -1.0, "cache.ttl_seconds must be >= 0"),
+        ("stale_while_revalidate_seconds", -1.0, "cache.stale_while_revalidate_seconds must be >= 0"),
+        ("negative_ttl_seconds", -1.0, "cache.negative_ttl_seconds must be None or >= 0"),
+        ("series_memory_max_bytes", 0, "cache.series_memory_max_bytes must be None or int >= 1"),
+        ("series_disk_directory", "", "cache.series_disk_directory must be None or a non-empty str"),
+        ("series_disk_max_bytes", True, "cache.series_disk_max_bytes must be None or int >= 1"),
+        ("series_ttl_seconds", 0.0, "cache.series_ttl_seconds must be > 0"),
+    ],
+)
+def test_config_validate_rejects_invalid_cache_settings(field, value, message):
+    cfg = BojClientConfig(cache=CacheConfig(**{field: value}))
+    with pytest.raises(ValueError, match=message):
+        cfg.validate()
+
+
 def test_config_validate_rejects_non_bool_layer_auto_partition():
     cfg = BojClientConfig(
         timeseries=TimeSeriesConfig(enable_layer_auto_partition="yes")  # type: ignore[arg-type]
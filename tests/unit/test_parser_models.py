@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from boj_api_client.timeseries.parser import (
+    estimate_payload_weight,
     parse_data_code_response,
     parse_data_layer_response,
     parse_metadata_response,
@@ -70,3 +71,11 @@ def test_parse_data_code_normalizes_bytes_to_utf8_str():
     assert response.series[0].name == "日本"
     assert response.series[0].unit == "円"
     assert response.series[0].points[0].survey_date == "202401"
+
+
+def test_estimate_payload_weight_counts_entries_and_values(fixture_loader):
+    payload = fixture_loader("get_data_code_success.json")
+    expected = sum(1 + len(item["VALUES"]["VALUES"]) for item in payload["RESULTSET"])
+    assert estimate_payload_weight(payload) == expected
+    assert estimate_payload_weight({"RESULTSET": "broken"}) == 0
+
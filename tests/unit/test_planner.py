@@ -8,6 +8,7 @@ from boj_api_client.timeseries.planner import (
     chunk_codes,
     next_position_or_raise,
     plan_data_code_chunks,
+    plan_date_windows,
     should_use_auto_partition,
 )
 
@@ -64,3 +65,62 @@ def test_next_position_or_raise_tracks_seen_positions():
             seen_positions=seen,
             context_name="data_code",
         )
+
+
+def test_plan_date_windows_splits_monthly_range_evenly():
+    windows = plan_date_windows(start_date="202311", end_date="202404", window_count=4, frequency="M")
+    assert [(w.start_date, w.end_date) for w in windows] == [
+        ("202311", "202312"),
+        ("202401", "202402"),
+        ("202403", "202403"),
+        ("202404", "202404"),
+    ]
+    assert [w.window_index for w in windows] == [0, 1, 2, 3]
+
+
+def test_plan_date_windows_splits_quarterly_range_as_quarters():
+    windows = plan_date_windows(start_date="202303", end_date="202402", window_count=2, frequency="Q")
+    assert [(w.start_date, w.end_date) for w in windows] == [("202303", "202304"), ("202401", "202402")]
+
+
+def test_plan_date_windows_splits_half_yearly_range_as_halves():
+    windows = plan_date_windows(start_date="202202", end_date="202402", window_count=3, frequency="CH")
+    assert [(w.start_date, w.end_date) for w in windows] == [
+        ("202202", "202301"),
+        ("202302", "202401"),
+        ("202402", "202402"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date", "frequency"),
+    [("202301", "202404", None), ("202305", "202401", "Q"), ("202301", "202403", "FH"), ("202301", "202312", "CY")],
+    ids=["unknown-frequency", "quarter-out-of-range", "half-out-of-range", "annual-frequency"],
+)
+def test_plan_date_windows_does_not_split_six_digit_range_without_matching_frequency(
+    start_date,
+    end_date,
+    frequency,
+):
+    windows = plan_date_windows(start_date=start_date, end_date=end_date, window_count=4, frequency=frequency)
+    assert [(w.start_date, w.end_date) for w in windows] == [(start_date, end_date)]
+
+
+def test_plan_date_windows_caps_window_count_to_period_count():
+    windows = plan_date_windows(start_date="2020", end_date="2021", window_count=8)
+    assert [(w.start_date, w.end_date) for w in windows] == [("2020", "2020"), ("2021", "2021")]
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [(None, "202401"), ("202401", None), ("2024", "202401"), ("202413", "202501"), ("202405", "202401")],
+    ids=["open-start", "open-end", "mixed-format", "invalid-month", "reversed"],
+)
+def test_plan_date_windows_keeps_unsplittable_range_as_single_window(start_date, end_date):
+    windows = plan_date_windows(start_date=start_date, end_date=end_date, window_count=4, frequency="M")
+    assert [(w.start_date, w.end_date) for w in windows] == [(start_date, end_date)]
+
+
+def test_plan_date_windows_rejects_non_positive_count():
+    with pytest.raises(ValueError, match="window_count must be >= 1"):
+        plan_date_windows(start_date="2020", end_date="2021", window_count=0)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from boj_api_client.core.prefetch import prefetch_map
+
+
+def test_prefetch_map_without_depth_is_lazy():
+    pulled: list[int] = []
+
+    def source():
+        for value in range(3):
+            pulled.append(value)
+            yield value
+
+    iterator = prefetch_map(source(), lambda value: value * 10, depth=0)
+    assert next(iterator) == 0
+    assert pulled == [0]
+
+
+def test_prefetch_map_fetches_ahead_and_keeps_order():
+    second_pulled = threading.Event()
+
+    def source():
+        yield 1
+        second_pulled.set()
+        yield 2
+        yield 3
+
+    iterator = prefetch_map(source(), lambda value: value * 10, depth=1)
+    assert next(iterator) == 10
+    assert second_pulled.wait(timeout=5.0)
+    assert list(iterator) == [20, 30]
+
+
+def test_prefetch_map_propagates_source_errors():
+    def source():
+        yield 1
+        raise RuntimeError("boom")
+
+    iterator = prefetch_map(source(), lambda value: value, depth=2)
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(iterator)
+
+
+def test_prefetch_map_close_stops_and_closes_source():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for value in range(100):
+                yield value
+        finally:
+            closed.set()
+
+    iterator = prefetch_map(source(), lambda value: value, depth=1)
+    assert next(iterator) == 0
+    iterator.close()
+    assert closed.wait(timeout=5.0)
+
+
+def test_prefetch_map_rejects_negative_depth():
+    with pytest.raises(ValueError, match="depth must be >= 0"):
+        list(prefetch_map(iter([]), lambda value: value, depth=-1))
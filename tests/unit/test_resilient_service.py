@@ -4,6 +4,9 @@ import pytest
 
 from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
 from boj_api_client.core.errors import BojPartialResultError, BojServerError, BojValidationError
+from boj_api_client.core.job_context import current_retry_budget
+from boj_api_client.timeseries.checkpoint_codec import parse_series_map
+from boj_api_client.timeseries.checkpoint_policy import CheckpointPolicy
 from boj_api_client.timeseries.models import DataCodeResponse, DataLayerResponse
 from boj_api_client.timeseries.queries import DataCodeQuery, DataLayerQuery, MetadataQuery
 from boj_api_client.timeseries.orchestrator import TimeSeriesService
@@ -296,6 +299,113 @@ def test_resilient_data_code_resume_from_checkpoint_after_partial_failure():
     assert strict.calls[-1] == ("code", 1, 1)
 
 
+def test_resilient_data_code_resume_failure_saves_only_new_series_as_delta():
+    class _FailOnceStrict(_FakeStrict):
+        def __init__(self):
+            super().__init__()
+            self.failed_offsets: set[str] = set()
+
+        def execute_data_code(self, query, *, code_subset, start_position):
+            first = code_subset[0]
+            if first in ("C250", "C500") and first not in self.failed_offsets:
+                self.failed_offsets.add(first)
+                raise BojServerError("boom", status=500, cause="server_transient")
+            return make_success_payload(resultset=[make_series_payload(code) for code in code_subset])
+
+    strict = _FailOnceStrict()
+    store = MemoryCheckpointStore()
+    service = TimeSeriesService(strict, checkpoint_store=store)
+    codes = [f"C{i:03d}" for i in range(501)]
+    query = DataCodeQuery(db="CO", code=codes)
+
+    with pytest.raises(BojPartialResultError) as first:
+        service.get_data_code(query)
+    with pytest.raises(BojPartialResultError) as second:
+        service.get_data_code(query, checkpoint_id=first.value.checkpoint_id)
+
+    delta = store.load(second.value.checkpoint_id)
+    assert delta["parents"] == [first.value.checkpoint_id]
+    assert sorted(parse_series_map(delta["by_code"])) == codes[250:500]
+    assert len(second.value.partial_result.series) == 500
+
+    resumed = service.get_data_code(query, checkpoint_id=second.value.checkpoint_id)
+    assert [s.series_code for s in resumed.series] == codes
+    for checkpoint_id in (first.value.checkpoint_id, second.value.checkpoint_id):
+        with pytest.raises(BojValidationError, match="not found"):
+            store.load(checkpoint_id)
+
+
+class _WorkerKilled(BaseException):
+    pass
+
+
+def test_resilient_data_code_progress_checkpoint_survives_worker_crash():
+    class _CrashingStrict(_FakeStrict):
+        def __init__(self):
+            super().__init__()
+            self.crash = True
+
+        def execute_data_code(self, query, *, code_subset, start_position):
+            self.calls.append(("code", len(code_subset), start_position))
+            if self.crash and code_subset[0] == "C500":
+                raise _WorkerKilled()
+            return make_success_payload(resultset=[make_series_payload(code) for code in code_subset])
+
+    strict = _CrashingStrict()
+    store = MemoryCheckpointStore()
+    policy = CheckpointPolicy(every_chunks=1)
+    saved: list[str] = []
+    codes = [f"C{i:03d}" for i in range(501)]
+    query = DataCodeQuery(db="CO", code=codes)
+
+    with pytest.raises(_WorkerKilled):
+        TimeSeriesService(strict, checkpoint_store=store, checkpoint_policy=policy).get_data_code(
+            query,
+            on_checkpoint=saved.append,
+        )
+    assert len(saved) == 2
+    assert sorted(parse_series_map(store.load(saved[-1])["by_code"])) == codes[250:500]
+
+    strict.crash = False
+    strict.calls.clear()
+    successor = TimeSeriesService(strict, checkpoint_store=store, checkpoint_policy=policy)
+    resumed = successor.get_data_code(query, checkpoint_id=saved[-1])
+
+    assert [s.series_code for s in resumed.series] == codes
+    assert strict.calls == [("code", 1, 1)]
+    for checkpoint_id in saved:
+        with pytest.raises(BojValidationError, match="not found"):
+            store.load(checkpoint_id)
+
+
+def test_resilient_data_layer_saves_progress_every_n_pages():
+    class _PagedLayerStrict(_FakeStrict):
+        def execute_data_layer(self, query, *, start_position):
+            next_position = start_position + 1 if start_position < 4 else ""
+            return make_success_payload(
+                resultset=[make_series_payload(f"L{start_position}")],
+                next_position=next_position,
+            )
+
+    store = MemoryCheckpointStore()
+    saved: list[str] = []
+    service = TimeSeriesService(
+        _PagedLayerStrict(),
+        checkpoint_store=store,
+        checkpoint_policy=CheckpointPolicy(every_pages=2),
+    )
+
+    response = service.get_data_layer(
+        DataLayerQuery(db="MD10", frequency="Q", layer1="*"),
+        on_checkpoint=saved.append,
+    )
+
+    assert [s.series_code for s in response.series] == ["L1", "L2", "L3", "L4"]
+    assert len(saved) == 1
+    with pytest.raises(BojValidationError, match="not found"):
+        store.load(saved[0])
+
+
 def test_resilient_data_code_resume_rejects_mismatched_query():
     class _ResumeStrict(_FakeStrict):
         def execute_data_code(self, query, *, code_subset, start_position):
@@ -667,5 +777,186 @@ def test_resilient_iter_data_layer_yields_page_responses():
     assert [page.series[0].series_code for page in pages] == ["X1", "X2"]
 
 
+class _TwoPageChunkStrict(_FakeStrict):
+    def execute_data_code(self, query, *, code_subset, start_position):
+        self.calls.append(("code", code_subset[0], start_position))
+        return make_success_payload(
+            next_position=2 if start_position == 1 else "",
+            resultset=[make_series_payload(code_subset[0], points=[(202400 + start_position, 1)])],
+        )
+
+
+def test_resilient_iter_data_code_resumes_from_page_cursor():
+    codes = [f"C{index:03d}" for index in range(251)]
+    strict = _TwoPageChunkStrict()
+    service = TimeSeriesService(strict)
+    pages = list(service.iter_data_code(DataCodeQuery(db="CO", code=codes)))
+
+    assert len(pages) == 4
+    assert all(page.resume_cursor for page in pages[:3])
+    assert pages[3].resume_cursor is None
+
+    strict.calls.clear()
+    resumed = list(
+        service.iter_data_code(DataCodeQuery(db="CO", code=codes), resume_from=pages[1].resume_cursor)
+    )
+    assert strict.calls == [("code", "C250", 1), ("code", "C250", 2)]
+    assert [page.series for page in resumed] == [page.series for page in pages[2:]]
+
+    strict.calls.clear()
+    list(service.iter_data_code(DataCodeQuery(db="CO", code=codes), resume_from=pages[2].resume_cursor))
+    assert strict.calls == [("code", "C250", 2)]
+
+
+def test_resilient_iter_data_code_rejects_cursor_of_other_query():
+    service = TimeSeriesService(_TwoPageChunkStrict())
+    cursor = next(iter(service.iter_data_code(DataCodeQuery(db="CO", code=["A"])))).resume_cursor
+
+    with pytest.raises(BojValidationError, match="resume cursor query mismatch"):
+        next(iter(service.iter_data_code(DataCodeQuery(db="CO", code=["B"]), resume_from=cursor)))
+    with pytest.raises(BojValidationError, match="resume cursor kind mismatch"):
+        next(
+            iter(
+                service.iter_data_layer(
+                    DataLayerQuery(db="MD10", frequency="Q", layer1="*"),
+                    resume_from=cursor,
+                )
+            )
+        )
+    with pytest.raises(BojValidationError, match="resume cursor is invalid"):
+        next(iter(service.iter_data_code(DataCodeQuery(db="CO", code=["A"]), resume_from="bjr1.!!")))
+
+
+def test_resilient_iter_data_layer_resumes_from_page_cursor():
+    class _PagedLayerStrict(_FakeStrict):
+        def execute_data_layer(self, query, *, start_position):
+            self.calls.append(("layer", start_position))
+            return make_success_payload(
+                next_position=start_position + 1 if start_position < 3 else "",
+                resultset=[make_series_payload(f"X{start_position}")],
+            )
+
+    strict = _PagedLayerStrict()
+    service = TimeSeriesService(strict)
+    query = DataLayerQuery(db="MD10", frequency="Q", layer1="*")
+    pages = list(service.iter_data_layer(query))
+    assert pages[-1].resume_cursor is None
+
+    strict.calls.clear()
+    resumed = list(service.iter_data_layer(query, resume_from=pages[0].resume_cursor))
+    assert strict.calls == [("layer", 2), ("layer", 3)]
+    assert [page.series[0].series_code for page in resumed] == ["X2", "X3"]
+
+
+class _WindowedStrict(_FakeStrict):
+    def __init__(self, *, fail_window: str | None = None):
+        super().__init__()
+        self.fail_window = fail_window
+        self.windows: list[tuple[str | None, str | None]] = []
+
+    def execute_data_code(self, query, *, code_subset, start_position):
+        self.windows.append((query.start_date, query.end_date))
+        if query.start_date == self.fail_window:
+            raise BojServerError("boom", status=500, cause="server_transient")
+        return make_success_payload(
+            resultset=[
+                make_series_payload(code, points=[(int(query.start_date), 1), (int(query.end_date), 2)])
+                for code in code_subset
+            ]
+        )
+
+
+def test_resilient_data_code_fetches_date_windows_and_merges_per_series():
+    strict = _WindowedStrict()
+    service = TimeSeriesService(
+        strict,
+        data_code_date_windows=3,
+        data_code_window_frequency="M",
+        max_concurrent_requests=3,
+    )
+
+    response = service.get_data_code(
+        DataCodeQuery(db="FM01", code=["B", "A"], start_date="202401", end_date="202406")
+    )
+
+    assert sorted(strict.windows) == [("202401", "202402"), ("202403", "202404"), ("202405", "202406")]
+    assert [s.series_code for s in response.series] == ["B", "A"]
+    assert [p.survey_date for p in response.series[0].points] == [
+        "202401",
+        "202402",
+        "202403",
+        "202404",
+        "202405",
+        "202406",
+    ]
+
 
+def test_resilient_data_code_windowed_failure_raises_partial_without_checkpoint():
+    strict = _WindowedStrict(fail_window="202403")
+    service = TimeSeriesService(
+        strict,
+        checkpoint_store=MemoryCheckpointStore(),
+        data_code_date_windows=3,
+        data_code_window_frequency="M",
+    )
+
+    with pytest.raises(BojPartialResultError) as exc:
+        service.get_data_code(
+            DataCodeQuery(db="FM01", code=["A"], start_date="202401", end_date="202406")
+        )
+
+    assert exc.value.cause == "server_transient"
+    assert exc.value.checkpoint_id is None
+    assert [p.survey_date for p in exc.value.partial_result.series[0].points] == [
+        "202401",
+        "202402",
+        "202405",
+        "202406",
+    ]
+
+
+def test_resilient_data_code_without_closed_range_is_not_windowed():
+    strict = _WindowedStrict()
+    service = TimeSeriesService(strict, data_code_date_windows=3)
+
+    service.get_data_code(DataCodeQuery(db="FM01", code=["A"], start_date="202401", end_date="202401"))
 
+    assert strict.windows == [("202401", "202401")]
+
+
+def test_resilient_iter_data_code_with_prefetch_yields_pages_in_order():
+    class _PagedStrict(_FakeStrict):
+        def execute_data_code(self, query, *, code_subset, start_position):
+            self.calls.append(("code", len(code_subset), start_position))
+            next_position = start_position + 1 if start_position < 3 else ""
+            return make_success_payload(
+                next_position=next_position,
+                resultset=[make_series_payload(code_subset[0], points=[(202400 + start_position, 1)])],
+            )
+
+    strict = _PagedStrict()
+    service = TimeSeriesService(strict, prefetch_depth=2)
+    pages = list(service.iter_data_code(DataCodeQuery(db="CO", code=["C001"])))
+
+    assert [page.series[0].points[0].survey_date for page in pages] == ["202401", "202402", "202403"]
+    assert strict.calls == [("code", 1, 1), ("code", 1, 2), ("code", 1, 3)]
+
+
+def test_resilient_shares_one_retry_budget_across_job_requests():
+    budgets = []
+
+    class _BudgetSpy(_FakeStrict):
+        def execute_data_code(self, query, *, code_subset, start_position):
+            budgets.append(current_retry_budget())
+            return super().execute_data_code(
+                query,
+                code_subset=code_subset,
+                start_position=start_position,
+            )
+
+    service = TimeSeriesService(_BudgetSpy(), job_retry_budget=3)
+    service.get_data_code(DataCodeQuery(db="CO", code=[f"C{i:03d}" for i in range(251)]))
+
+    assert len(budgets) == 2
+    assert budgets[0] is not None and budgets[0] is budgets[1]
+    assert current_retry_budget() is None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pytest
+
+from boj_api_client.core.response_cache import ResponseCache
+
+_PARAMS = {"format": "json", "lang": "JP", "db": "CO", "code": "C001"}
+
+
+def _data_payload(last_update: object = 20260101, date: str = "2026-01-02T09:00:00+09:00"):
+    return {
+        "STATUS": 200,
+        "MESSAGEID": "M181000I",
+        "DATE": date,
+        "RESULTSET": [{"SERIES_CODE": "C001", "LAST_UPDATE": last_update, "VALUES": {}}],
+    }
+
+
+def _metadata_payload(last_update: str):
+    return {
+        "STATUS": 200,
+        "MESSAGEID": "M181000I",
+        "DB": "CO",
+        "RESULTSET": [{"SERIES_CODE": "C001", "LAST_UPDATE": last_update}],
+    }
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _store(cache: ResponseCache, endpoint: str, params, payload, *, headers=None):
+    cache.store(cache.lookup(endpoint, params), payload, headers=headers)
+
+
+def test_response_cache_serves_fresh_entries_and_evicts_lru():
+    clock = _Clock()
+    cache = ResponseCache(max_entries=2, ttl_seconds=10.0, clock=clock)
+    _store(cache, "getDataCode", _PARAMS, _data_payload())
+    _store(cache, "getDataCode", {**_PARAMS, "code": "C002"}, _data_payload())
+    assert cache.lookup("/getDataCode", dict(reversed(list(_PARAMS.items())))).payload is not None
+
+    _store(cache, "getDataCode", {**_PARAMS, "code": "C003"}, _data_payload())
+
+    assert len(cache) == 2
+    assert cache.lookup("getDataCode", {**_PARAMS, "code": "C002"}).entry is None
+    clock.now = 10.0
+    assert cache.lookup("getDataCode", _PARAMS).payload is None
+
+
+def test_response_cache_builds_conditional_headers_for_stale_entries():
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=1.0, clock=clock)
+    _store(
+        cache,
+        "getDataCode",
+        _PARAMS,
+        _data_payload(),
+        headers={"etag": '"v1"', "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT"},
+    )
+    clock.now = 5.0
+
+    lookup = cache.lookup("getDataCode", _PARAMS)
+    assert lookup.payload is None
+    assert lookup.request_headers == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Thu, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.mark_not_modified(lookup) is lookup.entry.payload
+    assert cache.lookup("getDataCode", _PARAMS).payload is not None
+
+
+@pytest.mark.parametrize(
+    ("cached_update", "observed_update", "revalidated"),
+    [
+        (20260101, "20260101", True),
+        (20260101, "20260105", False),
+        ("", "20260101", True),
+        ("", "20260102", False),
+    ],
+)
+def test_response_cache_revalidates_stale_entries_with_metadata_last_update(
+    cached_update,
+    observed_update,
+    revalidated,
+):
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=1.0, clock=clock)
+    _store(cache, "getDataCode", _PARAMS, _data_payload(cached_update))
+    clock.now = 5.0
+    _store(cache, "getMetadata", {"lang": "JP", "db": "co"}, _metadata_payload(observed_update))
+
+    lookup = cache.lookup("getDataCode", _PARAMS)
+
+    assert (lookup.payload is not None) is revalidated
+    assert lookup.request_headers == {}
+
+
+def test_response_cache_metadata_evicts_updated_series_even_when_fresh():
+    cache = ResponseCache(ttl_seconds=300.0, clock=_Clock())
+    _store(cache, "getDataCode", _PARAMS, _data_payload(20260101))
+
+    _store(cache, "getMetadata", {"db": "CO"}, _metadata_payload("20260110"))
+
+    assert cache.lookup("getDataCode", _PARAMS).entry is None
+
+
+def test_response_cache_serves_stale_entries_within_grace_for_selected_endpoints():
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=10.0, stale_while_revalidate_seconds=5.0, clock=clock)
+    layer_params = {"db": "CO", "frequency": "Q", "layer": "1"}
+    _store(cache, "getDataCode", _PARAMS, _data_payload())
+    _store(cache, "getDataLayer", layer_params, _data_payload())
+    clock.now = 12.0
+
+    lookup = cache.lookup("getDataCode", _PARAMS)
+    assert lookup.stale and lookup.payload is not None
+    assert cache.try_begin_refresh(lookup.key) is True
+    assert cache.try_begin_refresh(lookup.key) is False
+    cache.finish_refresh(lookup.key)
+    assert cache.try_begin_refresh(lookup.key) is True
+    assert cache.lookup("getDataLayer", layer_params).payload is None
+
+    clock.now = 15.0
+    assert cache.lookup("getDataCode", _PARAMS).payload is None
+
+
+def test_response_cache_serves_stale_data_code_only_for_single_page_answers():
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=10.0, stale_while_revalidate_seconds=5.0, clock=clock)
+    paged_params = {**_PARAMS, "code": "C002"}
+    later_page_params = {**_PARAMS, "code": "C003", "startPosition": "255"}
+    _store(cache, "getDataCode", _PARAMS, {**_data_payload(), "NEXTPOSITION": ""})
+    _store(cache, "getDataCode", paged_params, {**_data_payload(), "NEXTPOSITION": 255})
+    _store(cache, "getDataCode", later_page_params, _data_payload())
+    _store(cache, "getMetadata", {"db": "CO"}, _metadata_payload("20260101"))
+    clock.now = 12.0
+
+    assert cache.lookup("getDataCode", _PARAMS).stale is True
+    assert cache.lookup("getMetadata", {"db": "CO"}).stale is True
+    paged = cache.lookup("getDataCode", paged_params)
+    assert paged.stale is False and paged.payload is None
+    assert cache.lookup("getDataCode", later_page_params).payload is None
+
+
+def test_response_cache_negative_entries_use_short_ttl():
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=300.0, negative_ttl_seconds=30.0, clock=clock)
+    no_data = {**_data_payload(), "MESSAGEID": "M181030I"}
+    empty_params = {**_PARAMS, "startDate": "195001"}
+    _store(cache, "getDataCode", empty_params, no_data)
+    _store(cache, "getDataCode", _PARAMS, _data_payload())
+
+    assert cache.lookup("getDataCode", empty_params).payload is no_data
+    clock.now = 31.0
+    expired = cache.lookup("getDataCode", empty_params)
+    assert expired.entry is None and expired.request_headers == {}
+    assert cache.lookup("getDataCode", _PARAMS).payload is not None
+
+
+def test_response_cache_with_zero_ttl_keeps_only_negative_entries():
+    cache = ResponseCache(ttl_seconds=0.0, negative_ttl_seconds=30.0, clock=_Clock())
+    _store(cache, "getDataCode", _PARAMS, _data_payload())
+    no_data = {**_data_payload(), "MESSAGEID": "M181030I"}
+    _store(cache, "getDataCode", {**_PARAMS, "code": "C002"}, no_data)
+
+    assert len(cache) == 1
+    assert cache.lookup("getDataCode", _PARAMS).entry is None
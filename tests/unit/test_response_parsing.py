@@ -8,7 +8,11 @@ from boj_api_client.core.errors import (
     BojUnavailableError,
     BojValidationError,
 )
-from boj_api_client.core.response_parsing import parse_json_payload
+from boj_api_client.core.response_parsing import (
+    decode_json_payload,
+    parse_json_payload,
+    response_body_size,
+)
 
 
 class _Response:
@@ -44,3 +48,19 @@ def test_parse_json_payload_raises_protocol_error_for_non_dict_payload():
 def test_parse_json_payload_returns_dict_payload():
     payload = parse_json_payload(_Response({"STATUS": 200}), http_status=200)
     assert payload == {"STATUS": 200}
+
+
+def test_decode_json_payload_parses_bytes_like_parse_json_payload():
+    payload = decode_json_payload(b'{"STATUS": 200, "RESULTSET": []}', http_status=200)
+    assert payload == {"STATUS": 200, "RESULTSET": []}
+
+
+def test_decode_json_payload_maps_invalid_bytes_by_http_status():
+    with pytest.raises(BojUnavailableError):
+        decode_json_payload(b"<html>busy</html>", http_status=503)
+    with pytest.raises(BojProtocolError, match="response JSON root must be an object"):
+        decode_json_payload(b"[1, 2]", http_status=200)
+
+
+def test_response_body_size_returns_none_without_bytes_content():
+    assert response_body_size(_Response({})) is None
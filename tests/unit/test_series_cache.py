@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
+from boj_api_client.core.errors import BojPartialResultError, BojServerError
+from boj_api_client.timeseries.checkpoint_policy import CheckpointPolicy
+from boj_api_client.timeseries.models import TimeSeries, TimeSeriesPoint
+from boj_api_client.timeseries.orchestrator import TimeSeriesService
+from boj_api_client.timeseries.queries import DataCodeQuery
+from boj_api_client.timeseries.series_cache import (
+    DiskSeriesCache,
+    MemorySeriesCache,
+    TieredSeriesCache,
+    estimate_series_bytes,
+)
+from boj_api_client.timeseries.series_codec import decode_series, encode_series
+from tests.shared.payloads import make_series_payload, make_success_payload
+
+_KEY = ("CO", "JP", "C001", "202401", "202404")
+
+
+def _series(code: str = "C001", values=(1, 2.5, None)) -> TimeSeries:
+    return TimeSeries(
+        series_code=code,
+        name="名前",
+        unit="%",
+        frequency="QUARTERLY",
+        category=None,
+        last_update="20260101",
+        points=tuple(
+            TimeSeriesPoint(survey_date=f"20240{idx + 1}", value=value)
+            for idx, value in enumerate(values)
+        ),
+    )
+
+
+class _Clock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        (1, 2.5, None),
+        (True, 2**60, None),
+        (),
+        (1, 2, 3),
+        tuple(None if idx % 3 == 0 else idx if idx % 2 else idx / 4 for idx in range(19)),
+    ],
+)
+def test_series_codec_round_trips_values_and_attributes(values):
+    series = _series(values=values)
+
+    decoded = decode_series(encode_series(series))
+
+    assert decoded == series
+    assert [type(point.value) for point in decoded.points] == [type(v) for v in values]
+
+
+def test_series_codec_rejects_corrupt_input():
+    with pytest.raises(ValueError):
+        decode_series(b"nope")
+    with pytest.raises(ValueError):
+        decode_series(encode_series(_series())[:-1])
+
+
+def test_series_codec_reports_malformed_headers_and_bitmaps_as_value_error():
+    blob = encode_series(_series(values=(1, 2.5, None)))
+    header_len = int.from_bytes(blob[4:8], "little")
+    header = json.loads(blob[8 : 8 + header_len])
+    del header["c"]
+    header_bytes = json.dumps(header).encode("utf-8")
+    missing_code = (
+        blob[:4] + len(header_bytes).to_bytes(4, "little") + header_bytes + blob[8 + header_len :]
+    )
+    with pytest.raises(ValueError):
+        decode_series(missing_code)
+    # A null bit set past the point count.
+    padded = bytearray(blob)
+    padded[-2] |= 0x80
+    with pytest.raises(ValueError):
+        decode_series(bytes(padded))
+
+
+def test_memory_series_cache_evicts_least_recently_used_by_bytes():
+    size = estimate_series_bytes(_series("A"))
+    cache = MemorySeriesCache(max_bytes=2 * size, clock=_Clock())
+    cache.put(("CO", "JP", "A", None, None), _series("A"))
+    cache.put(("CO", "JP", "B", None, None), _series("B"))
+    assert cache.get(("CO", "JP", "A", None, None)) is not None
+
+    cache.put(("CO", "JP", "C", None, None), _series("C"))
+
+    assert len(cache) == 2
+    assert cache.size_bytes == 2 * size
+    assert cache.get(("CO", "JP", "B", None, None)) is None
+
+
+def test_disk_series_cache_round_trips_and_expires(tmp_path):
+    clock = _Clock(1000.0)
+    cache = DiskSeriesCache(directory=tmp_path, ttl_seconds=60.0, clock=clock)
+    cache.put(_KEY, _series())
+
+    assert cache.get(_KEY) == _series()
+    clock.now += 60.0
+    assert cache.get(_KEY) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_series_cache_drops_corrupt_files(tmp_path):
+    cache = DiskSeriesCache(directory=tmp_path)
+    cache.put(_KEY, _series())
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"garbage")
+
+    assert cache.get(_KEY) is None
+    assert not path.exists()
+
+
+def test_tiered_series_cache_promotes_disk_hits_to_memory(tmp_path):
+    memory = MemorySeriesCache(max_bytes=1_000_000)
+    cache = TieredSeriesCache(memory=memory, disk=DiskSeriesCache(directory=tmp_path))
+    TieredSeriesCache(disk=DiskSeriesCache(directory=tmp_path)).put_many([(_KEY, _series())])
+
+    assert cache.get_many([_KEY]) == {_KEY: _series()}
+    assert memory.get(_KEY) == _series()
+
+
+def test_tiered_series_cache_keeps_disk_age_when_promoting(tmp_path):
+    clock = _Clock(1000.0)
+    disk = DiskSeriesCache(directory=tmp_path, ttl_seconds=60.0, clock=clock)
+    memory = MemorySeriesCache(max_bytes=1_000_000, ttl_seconds=60.0, clock=clock)
+    disk.put(_KEY, _series())
+    clock.now += 50.0
+
+    assert TieredSeriesCache(memory=memory, disk=disk).get_many([_KEY]) == {_KEY: _series()}
+    assert memory.get(_KEY) == _series()
+    clock.now += 10.0
+    assert memory.get(_KEY) is None
+
+
+def test_disk_series_cache_trims_oldest_files_over_max_bytes(tmp_path):
+    probe = DiskSeriesCache(directory=tmp_path / "probe")
+    probe.put(_KEY, _series())
+    (probe_file,) = (tmp_path / "probe").iterdir()
+    entry_bytes = probe_file.stat().st_size
+
+    cache = DiskSeriesCache(directory=tmp_path / "capped", max_bytes=3 * entry_bytes)
+    keys = [("CO", "JP", code, None, None) for code in ("A", "B", "C", "D")]
+    for index, key in enumerate(keys):
+        cache.put(key, _series(key[2]))
+        path = cache._path_for(key)
+        os.utime(path, (1000.0 + index, 1000.0 + index))
+
+    remaining = {key[2] for key in keys if cache.get(key) is not None}
+    assert "D" in remaining and "A" not in remaining
+    assert sum(p.stat().st_size for p in (tmp_path / "capped").iterdir()) <= 3 * entry_bytes
+
+
+def test_disk_series_cache_purges_expired_and_corrupt_files(tmp_path):
+    clock = _Clock(1000.0)
+    cache = DiskSeriesCache(directory=tmp_path, ttl_seconds=60.0, clock=clock)
+    cache.put(("CO", "JP", "OLD", None, None), _series("OLD"))
+    clock.now += 61.0
+    cache.put(_KEY, _series())
+    (tmp_path / "broken.bjs").write_bytes(b"xx")
+
+    assert cache.purge_expired() == 2
+    assert [path.suffix for path in tmp_path.iterdir()] == [".bjs"]
+    assert cache.get(_KEY) == _series()
+
+
+class _CountingStrict:
+    def __init__(self):
+        self.calls = 0
+        self.subsets: list[tuple[str, ...]] = []
+        self.fail = False
+
+    def execute_data_code(self, query, *, code_subset, start_position):
+        self.calls += 1
+        self.subsets.append(tuple(code_subset))
+        if self.fail:
+            raise BojServerError("boom", cause="server_transient")
+        return make_success_payload(resultset=[make_series_payload(code) for code in code_subset])
+
+
+def test_service_serves_warm_get_data_code_from_series_cache(tmp_path):
+    strict = _CountingStrict()
+    cache = TieredSeriesCache(
+        memory=MemorySeriesCache(max_bytes=1_000_000),
+        disk=DiskSeriesCache(directory=tmp_path),
+    )
+    service = TimeSeriesService(strict, series_cache=cache)
+    query = DataCodeQuery(db="CO", code=["C002", "C001"], start_date="202401", end_date="202404")
+
+    cold = service.get_data_code(query)
+    warm = service.get_data_code(query)
+    other_window = service.get_data_code(DataCodeQuery(db="CO", code=["C001"], start_date="202301"))
+
+    assert [series.series_code for series in warm.series] == ["C002", "C001"]
+    assert warm.series == cold.series
+    assert other_window.series
+    assert strict.calls == 2
+
+
+def test_service_fetches_only_codes_missing_from_series_cache():
+    strict = _CountingStrict()
+    service = TimeSeriesService(
+        strict,
+        series_cache=TieredSeriesCache(memory=MemorySeriesCache(max_bytes=1_000_000)),
+    )
+    service.get_data_code(DataCodeQuery(db="CO", code=["C001", "C003"]))
+
+    response = service.get_data_code(DataCodeQuery(db="CO", code=["C003", "C002", "C001"]))
+
+    assert [series.series_code for series in response.series] == ["C003", "C002", "C001"]
+    assert strict.subsets == [("C001", "C003"), ("C002",)]
+
+
+def test_service_reports_cached_series_when_missing_fetch_fails():
+    strict = _CountingStrict()
+    service = TimeSeriesService(
+        strict,
+        series_cache=TieredSeriesCache(memory=MemorySeriesCache(max_bytes=1_000_000)),
+    )
+    service.get_data_code(DataCodeQuery(db="CO", code=["C001"]))
+    strict.fail = True
+
+    with pytest.raises(BojPartialResultError) as exc_info:
+        service.get_data_code(DataCodeQuery(db="CO", code=["C002", "C001"]))
+
+    assert [series.series_code for series in exc_info.value.partial_result.series] == ["C001"]
+    assert exc_info.value.cause == "server_transient"
+    assert exc_info.value.checkpoint_id is None
+
+
+def test_service_progress_checkpoints_on_partial_hit_resume_with_callers_query():
+    class _FailingSecondChunkStrict(_CountingStrict):
+        def __init__(self):
+            super().__init__()
+            self.fail_after: int | None = None
+
+        def execute_data_code(self, query, *, code_subset, start_position):
+            if self.fail_after is not None and len(self.subsets) > self.fail_after:
+                self.fail = True
+            return super().execute_data_code(
+                query,
+                code_subset=code_subset,
+                start_position=start_position,
+            )
+
+    strict = _FailingSecondChunkStrict()
+    store = MemoryCheckpointStore()
+    service = TimeSeriesService(
+        strict,
+        series_cache=TieredSeriesCache(memory=MemorySeriesCache(max_bytes=10_000_000)),
+        checkpoint_store=store,
+        checkpoint_policy=CheckpointPolicy(every_chunks=1),
+    )
+    codes = [f"C{i:03d}" for i in range(300)]
+    query = DataCodeQuery(db="CO", code=codes)
+    service.get_data_code(DataCodeQuery(db="CO", code=["C000"]))
+    strict.fail_after = 1
+    saved: list[str] = []
+
+    with pytest.raises(BojPartialResultError) as exc_info:
+        service.get_data_code(query, on_checkpoint=saved.append)
+
+    assert strict.subsets[1][0] == "C000"
+    assert saved
+    strict.fail_after = None
+    strict.fail = False
+    resumed = service.get_data_code(query, checkpoint_id=exc_info.value.checkpoint_id)
+    assert [series.series_code for series in resumed.series] == codes
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from boj_api_client.core.errors import BojValidationError
+from boj_api_client.timeseries import strict_shared
 from boj_api_client.timeseries.strict import StrictTimeSeriesService
 from boj_api_client.timeseries.queries import DataCodeQuery, DataLayerQuery, MetadataQuery
 
@@ -69,3 +70,46 @@ def test_strict_metadata_calls_endpoint():
     endpoint, params = transport.calls[0]
     assert endpoint == "/getMetadata"
     assert params["db"] == "FM08"
+
+
+def test_strict_data_code_validates_chunk_once_across_pages(monkeypatch):
+    calls: list[int] = []
+    original = strict_shared.strict_validate_data_code_query
+
+    def _counting_validate(query):
+        calls.append(len(query.code))
+        original(query)
+
+    monkeypatch.setattr(strict_shared, "strict_validate_data_code_query", _counting_validate)
+    transport = _SpyTransport()
+    strict = StrictTimeSeriesService(transport)
+    query = DataCodeQuery(db="CO", code=["PREP_A", "PREP_B"], start_date="2020")
+    for start_position in (1, 2, 3):
+        strict.execute_data_code(query, code_subset=query.code, start_position=start_position)
+
+    assert calls == [2]
+    assert [params.get("startPosition") for _, params in transport.calls] == [None, "2", "3"]
+    assert list(transport.calls[1][1]) == ["format", "lang", "db", "code", "startPosition", "startDate"]
+
+
+def test_strict_prepared_request_still_rejects_invalid_start_position():
+    strict = StrictTimeSeriesService(_SpyTransport())
+    query = DataCodeQuery(db="CO", code=["A"])
+    strict.execute_data_code(query, code_subset=query.code)
+    with pytest.raises(BojValidationError, match="start_position must be >= 1"):
+        strict.execute_data_code(query, code_subset=query.code, start_position=0)
+
+
+def test_strict_prepare_does_not_swallow_type_errors_from_validation(monkeypatch):
+    calls: list[str] = []
+
+    def _broken_validate(query):
+        calls.append(query.db)
+        raise TypeError("validator bug")
+
+    monkeypatch.setattr(strict_shared, "strict_validate_data_layer_query", _broken_validate)
+    strict = StrictTimeSeriesService(_SpyTransport())
+    with pytest.raises(TypeError, match="validator bug"):
+        strict.execute_data_layer(DataLayerQuery(db="TYPEERR", frequency="Q", layer1="*"), start_position=1)
+
+    assert calls == ["TYPEERR"]
@@ -1,6 +1,25 @@
 from __future__ import annotations
 
-from boj_api_client.core.retry import can_retry, next_backoff_seconds
+import random
+
+import pytest
+
+from boj_api_client.config import RetryConfig, RetryRule
+from boj_api_client.core.async_throttling import AsyncMinIntervalThrottler
+from boj_api_client.core.job_context import (
+    current_deadline,
+    current_retry_budget,
+    deadline_scope,
+    retry_budget_scope,
+)
+from boj_api_client.core.latency import LatencyTracker
+from boj_api_client.core.retry import (
+    RetryPolicy,
+    can_retry,
+    decorrelated_backoff_seconds,
+    next_backoff_seconds,
+    parse_retry_after,
+)
 from boj_api_client.core.throttling import MinIntervalThrottler
 
 
@@ -61,3 +80,135 @@ def test_throttler_reset_clears_last_request_timestamp():
     throttler.reset()
     throttler.wait()
     assert sleeps == []
+
+
+def test_throttler_spaces_out_concurrent_reservations():
+    sleeps: list[float] = []
+    throttler = MinIntervalThrottler(1.0, clock=lambda: 0.0, sleeper=sleeps.append)
+
+    throttler.wait()
+    throttler.wait()
+    throttler.wait()
+
+    assert sleeps == [1.0, 2.0]
+
+
+def test_decorrelated_backoff_stays_within_base_and_cap():
+    rng = random.Random(7)
+    delay = 0.0
+    delays = []
+    for _ in range(50):
+        delay = decorrelated_backoff_seconds(
+            previous_delay=delay,
+            base_seconds=0.5,
+            max_backoff_seconds=10.0,
+            rng=rng,
+        )
+        delays.append(delay)
+    assert all(0.5 <= value <= 10.0 for value in delays)
+    assert len(set(delays)) > 1
+
+
+def test_parse_retry_after_accepts_seconds_and_http_date():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Thu, 01 Jan 2026 00:00:30 GMT", now=1767225600.0) == 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_policy_applies_rules_before_defaults():
+    policy = RetryPolicy(
+        RetryConfig(
+            max_attempts=5,
+            rules=(
+                RetryRule(statuses=(503,), max_attempts=2),
+                RetryRule(statuses=(500,), retry=False),
+                RetryRule(exceptions=(TimeoutError,), max_attempts=3),
+                RetryRule(exceptions=(PermissionError,), retry=False),
+            ),
+        )
+    )
+    kwargs = {"started_at": 0.0, "now": 0.0}
+    assert policy.should_retry_status(503, attempt=1, **kwargs)
+    assert not policy.should_retry_status(503, attempt=2, **kwargs)
+    assert not policy.should_retry_status(500, attempt=1, **kwargs)
+    assert not policy.should_retry_status(400, attempt=1, **kwargs)
+    assert policy.should_retry_exception(TimeoutError(), attempt=2, **kwargs)
+    assert not policy.should_retry_exception(TimeoutError(), attempt=3, **kwargs)
+    assert not policy.should_retry_exception(PermissionError(), attempt=1, **kwargs)
+    assert policy.should_retry_exception(ConnectionError(), attempt=4, **kwargs)
+
+
+def test_retry_policy_honours_retry_after_in_full():
+    policy = RetryPolicy(RetryConfig(max_backoff_seconds=30.0, jitter="decorrelated"))
+    rng = random.Random(0)
+    assert policy.backoff_seconds(attempt=1, previous_delay=0.0, rng=rng, retry_after=12.0) == 12.0
+    assert policy.backoff_seconds(attempt=1, previous_delay=0.0, rng=rng, retry_after=90.0) == 90.0
+    ignoring = RetryPolicy(RetryConfig(max_backoff_seconds=30.0, respect_retry_after=False))
+    assert ignoring.backoff_seconds(attempt=1, previous_delay=0.0, rng=rng, retry_after=12.0) < 2.0
+
+
+def test_retry_policy_retry_after_fits_retry_and_deadline_budget():
+    policy = RetryPolicy(RetryConfig(total_retry_budget_seconds=120.0))
+    assert policy.retry_after_fits(None, started_at=0.0, now=100.0)
+    assert policy.retry_after_fits(90.0, started_at=0.0, now=30.0)
+    assert not policy.retry_after_fits(90.0, started_at=0.0, now=31.0)
+    assert not policy.retry_after_fits(90.0, started_at=0.0, now=0.0, deadline_remaining=60.0)
+    ignoring = RetryPolicy(RetryConfig(respect_retry_after=False))
+    assert ignoring.retry_after_fits(600.0, started_at=0.0, now=0.0)
+
+
+def test_retry_policy_consumes_job_budget_tokens():
+    policy = RetryPolicy(RetryConfig(max_attempts=10))
+    kwargs = {"attempt": 1, "started_at": 0.0, "now": 0.0}
+    with retry_budget_scope(2) as budget:
+        with retry_budget_scope(100):
+            assert current_retry_budget() is budget
+        assert policy.should_retry_status(503, **kwargs)
+        assert policy.should_retry_exception(ConnectionError(), **kwargs)
+        assert not policy.should_retry_status(503, **kwargs)
+        assert budget is not None and budget.remaining == 0
+    assert current_retry_budget() is None
+    assert policy.should_retry_status(503, **kwargs)
+
+
+def test_retry_budget_rejects_negative_tokens():
+    with pytest.raises(ValueError):
+        with retry_budget_scope(-1):
+            pass
+
+
+def test_async_throttler_try_acquire_only_reserves_free_slots():
+    now = {"value": 0.0}
+    throttler = AsyncMinIntervalThrottler(1.0, clock=lambda: now["value"])
+
+    assert throttler.try_acquire() is True
+    assert throttler.try_acquire() is False
+    now["value"] = 1.0
+    assert throttler.try_acquire() is True
+
+
+def test_latency_tracker_percentile_uses_recent_window():
+    tracker = LatencyTracker(window=4)
+    assert tracker.percentile("getDataCode", 0.5) is None
+    for seconds in (9.0, 1.0, 2.0, 3.0, 4.0):
+        tracker.record("getDataCode", seconds)
+
+    assert tracker.sample_count("getDataCode") == 4
+    assert tracker.percentile("getDataCode", 0.5) == 2.0
+    assert tracker.percentile("getDataCode", 0.95) == 4.0
+
+
+def test_deadline_scope_keeps_the_earlier_enclosing_deadline():
+    now = {"value": 0.0}
+    clock = lambda: now["value"]  # noqa: E731
+
+    with deadline_scope(5.0, clock=clock) as outer:
+        with deadline_scope(10.0, clock=clock) as inner:
+            assert inner is outer
+        with deadline_scope(1.0, clock=clock) as tighter:
+            assert current_deadline() is tighter
+        now["value"] = 4.0
+        assert outer.remaining() == 1.0
+        assert not outer.expired()
+    assert current_deadline() is None
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import replace
+
 import pytest
 
-from boj_api_client.core.errors import BojServerError, BojTransportError
+from boj_api_client.config import CacheConfig, RetryConfig, TransportConfig
+from boj_api_client.core.errors import BojUnavailableError
+from boj_api_client.core.job_context import deadline_scope, retry_budget_scope
+from boj_api_client.core import transport_shared
+from boj_api_client.core.errors import BojServerError, BojTransportError, BojValidationError
 from boj_api_client.core.transport import SyncTransport
 from tests.shared.transport import Response, Step, SyncSequencedClient, build_config
 
@@ -81,3 +89,347 @@ def test_transport_can_initialize_and_close_with_real_httpx_client():
     transport = SyncTransport(build_config(max_attempts=1))
     transport.close()
 
+
+def test_transport_shared_builds_limits_from_config():
+    cfg = replace(
+        build_config(max_attempts=1),
+        transport=TransportConfig(max_connections=8, max_keepalive_connections=4),
+    )
+    limits = transport_shared.build_default_limits(cfg)
+    assert limits.max_connections == 8
+    assert limits.max_keepalive_connections == 4
+    assert limits.keepalive_expiry == 5.0
+
+
+def test_transport_shared_http2_requires_optional_dependency(monkeypatch):
+    cfg = replace(build_config(max_attempts=1), transport=TransportConfig(http2=True))
+    monkeypatch.setattr(transport_shared.importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(ImportError, match=r"boj-api-client\[http2\]"):
+        transport_shared.resolve_http2(cfg)
+    assert transport_shared.resolve_http2(build_config(max_attempts=1)) is False
+
+
+_UNAVAILABLE = {"STATUS": 503, "MESSAGEID": "E", "MESSAGE": "maintenance"}
+_OK = {"STATUS": 200, "MESSAGEID": "M181000I", "RESULTSET": []}
+
+
+def test_transport_honours_retry_after_on_503():
+    sleeps: list[float] = []
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(max_attempts=3, max_backoff_seconds=30.0, jitter="decorrelated"),
+    )
+    client = SyncSequencedClient(
+        [Response(503, _UNAVAILABLE, headers={"Retry-After": "7"}), Response(200, _OK)]
+    )
+    transport = SyncTransport(cfg, client=client, sleeper=sleeps.append, clock=lambda: 0.0)
+
+    assert transport.request("/getMetadata", params={"db": "FM08"})["STATUS"] == 200
+    assert sleeps == [7.0]
+
+
+@pytest.mark.parametrize(
+    "throttled",
+    [
+        Response(429, ValueError("not json"), headers={"Retry-After": "4"}),
+        Response(503, ValueError("empty body"), headers={"Retry-After": "4"}),
+        Response(429, {"MESSAGE": "slow down"}, headers={"Retry-After": "4"}),
+    ],
+)
+def test_transport_honours_retry_after_on_http_429_and_503_bodies(throttled):
+    sleeps: list[float] = []
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(
+            max_attempts=3,
+            max_backoff_seconds=30.0,
+            jitter="decorrelated",
+            retryable_statuses=(429, 500, 503),
+        ),
+    )
+    client = SyncSequencedClient([throttled, Response(200, _OK)])
+    transport = SyncTransport(cfg, client=client, sleeper=sleeps.append, clock=lambda: 0.0)
+
+    assert transport.request("/getMetadata", params={"db": "FM08"})["STATUS"] == 200
+    assert sleeps == [4.0]
+
+
+def test_transport_raises_parse_error_once_http_429_retries_run_out():
+    client = SyncSequencedClient([Response(429, ValueError("not json"))] * 2)
+    transport = SyncTransport(
+        replace(
+            build_config(),
+            retry=RetryConfig(max_attempts=2, retryable_statuses=(429, 500, 503)),
+        ),
+        client=client,
+        sleeper=lambda _: None,
+        clock=lambda: 0.0,
+    )
+
+    with pytest.raises(BojValidationError, match="not valid JSON"):
+        transport.request("/getMetadata", params={"db": "FM08"})
+    assert client.calls == 2
+
+
+def test_transport_does_not_retry_http_429_by_default():
+    sleeps: list[float] = []
+    client = SyncSequencedClient(
+        [Response(429, ValueError("not json"), headers={"Retry-After": "4"}), Response(200, _OK)]
+    )
+    transport = SyncTransport(
+        build_config(max_attempts=3),
+        client=client,
+        sleeper=sleeps.append,
+        clock=lambda: 0.0,
+    )
+
+    with pytest.raises(BojValidationError, match="not valid JSON"):
+        transport.request("/getMetadata", params={"db": "FM08"})
+    assert client.calls == 1
+    assert sleeps == []
+
+
+def test_transport_sleeps_full_retry_after_beyond_max_backoff():
+    sleeps: list[float] = []
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(max_attempts=3, max_backoff_seconds=30.0, total_retry_budget_seconds=600.0),
+    )
+    client = SyncSequencedClient(
+        [Response(503, _UNAVAILABLE, headers={"Retry-After": "300"}), Response(200, _OK)]
+    )
+    transport = SyncTransport(cfg, client=client, sleeper=sleeps.append, clock=lambda: 0.0)
+
+    assert transport.request("/getMetadata", params={"db": "FM08"})["STATUS"] == 200
+    assert sleeps == [300.0]
+
+
+@pytest.mark.parametrize("deadline", [None, 60.0])
+def test_transport_fails_fast_when_retry_after_exceeds_budget(deadline):
+    sleeps: list[float] = []
+    total_budget = 120.0 if deadline is None else 600.0
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(max_attempts=3, total_retry_budget_seconds=total_budget),
+    )
+    client = SyncSequencedClient(
+        [Response(503, _UNAVAILABLE, headers={"Retry-After": "300"}), Response(200, _OK)]
+    )
+    transport = SyncTransport(cfg, client=client, sleeper=sleeps.append, clock=lambda: 0.0)
+
+    with deadline_scope(deadline, clock=lambda: 0.0):
+        with pytest.raises(BojUnavailableError) as exc:
+            transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "retry_after"
+    assert exc.value.status == 503
+    assert sleeps == []
+    assert client.calls == 1
+
+
+def test_transport_stops_retrying_when_job_budget_is_spent():
+    client = SyncSequencedClient(
+        [Response(503, _UNAVAILABLE), Response(200, _OK), Response(503, _UNAVAILABLE)]
+    )
+    transport = SyncTransport(build_config(), client=client, sleeper=lambda _: None, clock=lambda: 0.0)
+
+    with retry_budget_scope(1):
+        transport.request("/getMetadata", params={"db": "FM08"})
+        with pytest.raises(BojUnavailableError):
+            transport.request("/getMetadata", params={"db": "FM08"})
+    assert client.calls == 3
+
+
+def test_transport_circuit_breaker_stops_retries_and_fails_fast():
+    cfg = replace(
+        build_config(max_attempts=5),
+        transport=TransportConfig(
+            circuit_breaker_failure_threshold=2,
+            circuit_breaker_recovery_seconds=60.0,
+        ),
+    )
+    client = SyncSequencedClient([Response(200, _UNAVAILABLE), Response(200, _UNAVAILABLE)])
+    transport = SyncTransport(cfg, client=client, sleeper=lambda _: None, clock=lambda: 0.0)
+
+    with pytest.raises(BojUnavailableError) as first:
+        transport.request("/getDataCode", params={"db": "CO"})
+    with pytest.raises(BojUnavailableError) as second:
+        transport.request("/getDataCode", params={"db": "CO"})
+
+    assert first.value.cause != "circuit_open"
+    assert second.value.cause == "circuit_open"
+    assert client.calls == 2
+
+
+def test_transport_caps_request_timeout_to_job_deadline():
+    now = {"value": 0.0}
+    client = SyncSequencedClient([Response(200, _OK)])
+    transport = SyncTransport(build_config(), client=client, clock=lambda: now["value"])
+
+    with deadline_scope(2.0, clock=lambda: now["value"]):
+        transport.request("/getMetadata", params={"db": "FM08"})
+
+    timeout = client.options[0]["timeout"]
+    assert timeout.connect == 2.0
+    assert timeout.read == 2.0
+
+
+def test_transport_skips_retry_that_would_overrun_job_deadline():
+    now = {"value": 0.0}
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(max_attempts=5, base_backoff_seconds=5.0, max_backoff_seconds=5.0),
+    )
+    client = SyncSequencedClient([RuntimeError("network down"), Response(200, _OK)])
+    transport = SyncTransport(cfg, client=client, sleeper=lambda _: None, clock=lambda: now["value"])
+
+    with deadline_scope(3.0, clock=lambda: now["value"]):
+        with pytest.raises(BojTransportError) as exc:
+            transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "deadline"
+    assert client.calls == 1
+
+
+def test_transport_reports_deadline_when_status_retry_would_overrun_it():
+    now = {"value": 0.0}
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(max_attempts=5, base_backoff_seconds=5.0, max_backoff_seconds=5.0),
+    )
+    client = SyncSequencedClient([Response(503, _UNAVAILABLE), Response(200, _OK)])
+    transport = SyncTransport(cfg, client=client, sleeper=lambda _: None, clock=lambda: now["value"])
+
+    with deadline_scope(3.0, clock=lambda: now["value"]):
+        with pytest.raises(BojTransportError) as exc:
+            transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "deadline"
+    assert isinstance(exc.value.__cause__, BojUnavailableError)
+    assert client.calls == 1
+
+
+def test_transport_rejects_response_that_arrives_after_job_deadline():
+    now = {"value": 0.0}
+
+    class _TricklingClient(SyncSequencedClient):
+        def get(self, endpoint, params, **options):
+            now["value"] += 5.0
+            return super().get(endpoint, params, **options)
+
+    client = _TricklingClient([Response(200, _OK)])
+    transport = SyncTransport(build_config(), client=client, clock=lambda: now["value"])
+
+    with deadline_scope(2.0, clock=lambda: now["value"]):
+        with pytest.raises(BojTransportError) as exc:
+            transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "deadline"
+
+
+def test_transport_deadline_cut_attempts_leave_circuit_closed():
+    now = {"value": 0.0}
+
+    class _TimingOutClient(SyncSequencedClient):
+        def get(self, endpoint, params, **options):
+            if self.calls < 3:
+                now["value"] += 5.0
+            return super().get(endpoint, params, **options)
+
+    cfg = replace(
+        build_config(),
+        transport=TransportConfig(
+            circuit_breaker_failure_threshold=1,
+            circuit_breaker_recovery_seconds=60.0,
+        ),
+    )
+    client = _TimingOutClient([RuntimeError("read timeout")] * 3 + [Response(200, _OK)])
+    transport = SyncTransport(cfg, client=client, sleeper=lambda _: None, clock=lambda: now["value"])
+
+    for _ in range(3):
+        with deadline_scope(2.0, clock=lambda: now["value"]):
+            with pytest.raises(BojTransportError) as exc:
+                transport.request("/getMetadata", params={"db": "FM08"})
+        assert exc.value.cause == "deadline"
+
+    assert transport.request("/getMetadata", params={"db": "FM08"})["STATUS"] == 200
+    assert client.calls == 4
+
+
+def test_transport_raises_without_sending_once_job_deadline_expired():
+    client = SyncSequencedClient([Response(200, _OK)])
+    transport = SyncTransport(build_config(), client=client)
+
+    with deadline_scope(0.0):
+        with pytest.raises(BojTransportError) as exc:
+            transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "deadline"
+    assert client.calls == 0
+
+
+def test_transport_revalidates_cached_payload_with_conditional_request():
+    now = {"value": 0.0}
+    cfg = replace(build_config(), cache=CacheConfig(enabled=True, ttl_seconds=60.0))
+    client = SyncSequencedClient(
+        [Response(200, _OK, headers={"ETag": '"v1"'}), Response(304, None)]
+    )
+    transport = SyncTransport(cfg, client=client, clock=lambda: now["value"])
+
+    first = transport.request("/getMetadata", params={"db": "FM08"})
+    assert transport.request("/getMetadata", params={"db": "FM08"}) is first
+    now["value"] = 120.0
+    assert transport.request("/getMetadata", params={"db": "FM08"}) is first
+
+    assert client.calls == 2
+    assert "headers" not in client.options[0]
+    assert client.options[1]["headers"] == {"If-None-Match": '"v1"'}
+
+
+class _GatedClient(SyncSequencedClient):
+    def __init__(self, steps):
+        super().__init__(steps)
+        self.gate = threading.Event()
+
+    def get(self, endpoint, params, **options):
+        if self.calls > 0:
+            assert self.gate.wait(timeout=5.0)
+        return super().get(endpoint, params, **options)
+
+
+def test_transport_serves_stale_payload_and_refreshes_once_in_background():
+    now = {"value": 0.0}
+    cfg = replace(
+        build_config(),
+        cache=CacheConfig(enabled=True, ttl_seconds=60.0, stale_while_revalidate_seconds=60.0),
+    )
+    refreshed = {**_OK, "MESSAGE": "refreshed"}
+    client = _GatedClient([Response(200, _OK), Response(200, refreshed)])
+    transport = SyncTransport(cfg, client=client, clock=lambda: now["value"])
+
+    first = transport.request("/getMetadata", params={"db": "FM08"})
+    now["value"] = 90.0
+    assert transport.request("/getMetadata", params={"db": "FM08"}) is first
+    assert transport.request("/getMetadata", params={"db": "FM08"}) is first
+    client.gate.set()
+
+    deadline = time.monotonic() + 5.0
+    while transport.request("/getMetadata", params={"db": "FM08"}) is first:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert client.calls == 2
+
+
+def test_transport_negative_cache_skips_repeated_no_data_lookups(fixture_loader):
+    cfg = replace(build_config(), cache=CacheConfig(negative_ttl_seconds=60.0))
+    no_data = fixture_loader("get_data_code_no_data_m181030i.json")
+    client = SyncSequencedClient([Response(200, no_data), Response(200, _OK), Response(200, _OK)])
+    transport = SyncTransport(cfg, client=client)
+    empty = {"db": "CO", "code": "TK99F1000601GCQ01000", "startDate": "195001"}
+
+    assert transport.request("/getDataCode", params=empty)["MESSAGEID"] == "M181030I"
+    assert transport.request("/getDataCode", params=empty)["MESSAGEID"] == "M181030I"
+    transport.request("/getMetadata", params={"db": "FM08"})
+    transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert client.calls == 3
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from contextlib import contextmanager
+
 import pytest
 
-from boj_api_client.core.async_checkpoint_store import AsyncCheckpointStoreAdapter
+from boj_api_client.core.async_checkpoint_store import (
+    AsyncCheckpointStoreAdapter,
+    AsyncFileCheckpointStore,
+    AsyncMemoryCheckpointStore,
+    AsyncSqliteCheckpointStore,
+    BatchingAsyncCheckpointStoreAdapter,
+)
+from boj_api_client.core.checkpoint_store import MemoryCheckpointStore, SqliteCheckpointStore
 from boj_api_client.core.errors import BojValidationError
+from boj_api_client.timeseries.async_checkpoint_manager import AsyncCheckpointManager
 
 
 class _SpySyncStore:
@@ -59,3 +71,163 @@ async def test_async_checkpoint_store_adapter_propagates_errors():
 
     with pytest.raises(BojValidationError, match="checkpoint_id not found"):
         await adapter.load("a" * 32)
+
+
+class _BatchingSpyStore(_SpySyncStore):
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+        self.writes: list[bool] = []
+        self.threads: set[int] = set()
+        self.release = threading.Event()
+
+    @contextmanager
+    def batch(self, *, write: bool = True):
+        self.release.wait(5)
+        self.batches += 1
+        self.writes.append(write)
+        self.threads.add(threading.get_ident())
+        yield
+
+    def save(self, state: dict) -> str:
+        self.save_calls += 1
+        checkpoint_id = f"{self.save_calls:032x}"
+        self.state_by_id[checkpoint_id] = dict(state)
+        return checkpoint_id
+
+
+@pytest.mark.asyncio
+async def test_batching_adapter_drains_queued_calls_on_one_thread():
+    store = _BatchingSpyStore()
+    adapter = BatchingAsyncCheckpointStoreAdapter(store)
+    try:
+        first = asyncio.ensure_future(adapter.save({"cursor": 0}))
+        await asyncio.sleep(0.05)
+        rest = [asyncio.ensure_future(adapter.save({"cursor": idx})) for idx in range(1, 6)]
+        missing = asyncio.ensure_future(adapter.load("f" * 32))
+        await asyncio.sleep(0.05)
+        store.release.set()
+
+        ids = await asyncio.gather(first, *rest)
+        with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+            await missing
+    finally:
+        await adapter.aclose()
+
+    assert len(set(ids)) == 6
+    assert store.batches == 2
+    assert store.writes == [True, True]
+    assert len(store.threads) == 1
+
+
+@pytest.mark.asyncio
+async def test_batching_adapter_opens_read_batches_for_load_only_calls():
+    store = _BatchingSpyStore()
+    store.release.set()
+    adapter = BatchingAsyncCheckpointStoreAdapter(store)
+    try:
+        checkpoint_id = await adapter.save({"cursor": 0})
+        loaded = await asyncio.gather(*(adapter.load(checkpoint_id) for _ in range(3)))
+    finally:
+        await adapter.aclose()
+
+    assert loaded == [{"cursor": 0}] * 3
+    assert store.writes[0] is True
+    assert store.writes[1:] and not any(store.writes[1:])
+
+
+@pytest.mark.asyncio
+async def test_batching_adapter_roundtrips_with_sqlite_store(tmp_path):
+    adapter = BatchingAsyncCheckpointStoreAdapter(SqliteCheckpointStore(path=tmp_path / "cp.db"))
+    try:
+        ids = await asyncio.gather(*(adapter.save({"cursor": idx}) for idx in range(10)))
+        loaded = await asyncio.gather(*(adapter.load(checkpoint_id) for checkpoint_id in ids))
+        await adapter.delete(ids[0])
+        with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+            await adapter.load(ids[0])
+    finally:
+        await adapter.aclose()
+
+    assert [state["cursor"] for state in loaded] == list(range(10))
+    with pytest.raises(RuntimeError, match="closed"):
+        await adapter.load(ids[1])
+
+
+async def _no_threads(*args, **kwargs):
+    raise AssertionError("checkpoint operation left the event loop")
+
+
+@pytest.mark.asyncio
+async def test_async_memory_checkpoint_store_runs_inline(monkeypatch):
+    monkeypatch.setattr(asyncio, "to_thread", _no_threads)
+    store = AsyncMemoryCheckpointStore(MemoryCheckpointStore(ttl_seconds=60.0))
+
+    checkpoint_id = await store.save({"cursor": 1})
+    assert await store.load(checkpoint_id) == {"cursor": 1}
+    await store.delete(checkpoint_id)
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        await store.load(checkpoint_id)
+    assert await store.purge_expired() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_checkpoint_manager_keeps_memory_store_on_event_loop(monkeypatch):
+    monkeypatch.setattr(asyncio, "to_thread", _no_threads)
+    memory = MemoryCheckpointStore()
+    manager = AsyncCheckpointManager(store=memory)
+
+    checkpoint_id = memory.save({"cursor": 1})
+
+    await manager.cleanup(checkpoint_id)
+    with pytest.raises(BojValidationError, match="checkpoint_id not found"):
+        memory.load(checkpoint_id)
+
+
+@pytest.mark.asyncio
+async def test_async_file_checkpoint_store_roundtrip_on_dedicated_thread(tmp_path, monkeypatch):
+    monkeypatch.setattr(asyncio, "to_thread", _no_threads)
+    store = AsyncFileCheckpointStore(base_dir=tmp_path)
+    try:
+        ids = await asyncio.gather(*(store.save({"cursor": idx}) for idx in range(5)))
+        loaded = await asyncio.gather(*(store.load(checkpoint_id) for checkpoint_id in ids))
+    finally:
+        await store.aclose()
+
+    assert [state["cursor"] for state in loaded] == list(range(5))
+    assert len(list(tmp_path.glob("*.pkl"))) == 5
+
+
+@pytest.mark.asyncio
+async def test_async_sqlite_checkpoint_store_roundtrip_and_close(tmp_path, monkeypatch):
+    monkeypatch.setattr(asyncio, "to_thread", _no_threads)
+    store = AsyncSqliteCheckpointStore(path=tmp_path / "cp.db")
+    try:
+        ids = await asyncio.gather(*(store.save({"cursor": idx}) for idx in range(5)))
+        await store.delete(ids[0])
+        assert (await store.load(ids[1]))["cursor"] == 1
+        assert await store.purge_expired() == 0
+    finally:
+        await store.aclose()
+
+    reopened = SqliteCheckpointStore(path=tmp_path / "cp.db")
+    assert reopened.load(ids[4]) == {"cursor": 4}
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_batching_adapter_aclose_keeps_event_loop_running():
+    store = _BatchingSpyStore()
+    adapter = BatchingAsyncCheckpointStoreAdapter(store)
+    pending = asyncio.ensure_future(adapter.save({"cursor": 0}))
+    await asyncio.sleep(0.05)
+    closing = asyncio.ensure_future(adapter.aclose())
+    await asyncio.sleep(0.05)
+
+    # The worker is still blocked in batch(), yet the loop keeps running.
+    assert not closing.done()
+    store.release.set()
+    await closing
+
+    assert await pending == f"{1:032x}"
+    with pytest.raises(RuntimeError, match="closed"):
+        await adapter.save({"cursor": 1})
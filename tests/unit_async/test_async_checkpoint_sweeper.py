@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+
+from boj_api_client.core.async_checkpoint_store import (
+    AsyncCheckpointStoreAdapter,
+    BatchingAsyncCheckpointStoreAdapter,
+)
+from boj_api_client.core.async_checkpoint_sweeper import AsyncCheckpointSweeper
+from boj_api_client.core.checkpoint_store import MemoryCheckpointStore
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _SignallingAdapter:
+    def __init__(self, adapter: AsyncCheckpointStoreAdapter) -> None:
+        self._adapter = adapter
+        self.removed: list[int] = []
+        self.swept = asyncio.Event()
+
+    async def purge_expired(self) -> int:
+        removed = await self._adapter.purge_expired()
+        self.removed.append(removed)
+        self.swept.set()
+        return removed
+
+
+async def test_async_checkpoint_sweeper_purges_through_adapter():
+    clock = _FakeClock()
+    store = MemoryCheckpointStore(ttl_seconds=1.0, clock=clock, lazy_purge=False)
+    store.save({"cursor": 1})
+    clock.advance(2.0)
+    alive_id = store.save({"cursor": 2})
+    adapter = AsyncCheckpointStoreAdapter(store)
+    signalling = _SignallingAdapter(adapter)
+
+    async with AsyncCheckpointSweeper(signalling, interval_seconds=0.01) as sweeper:
+        assert sweeper.running
+        await asyncio.wait_for(signalling.swept.wait(), timeout=5.0)
+    assert not sweeper.running
+    assert signalling.removed[0] == 1
+    assert await adapter.load(alive_id) == {"cursor": 2}
+
+
+async def test_async_checkpoint_sweeper_sweep_uses_batching_adapter():
+    clock = _FakeClock()
+    store = MemoryCheckpointStore(ttl_seconds=1.0, clock=clock, lazy_purge=False)
+    store.save({"cursor": 1})
+    clock.advance(2.0)
+    adapter = BatchingAsyncCheckpointStoreAdapter(store)
+    try:
+        sweeper = AsyncCheckpointSweeper(adapter, interval_seconds=60.0)
+        assert await sweeper.sweep() == 1
+        await sweeper.stop()
+    finally:
+        await adapter.aclose()
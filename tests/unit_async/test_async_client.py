@@ -176,3 +176,22 @@ async def test_async_client_passes_checkpoint_id_to_delegate_service():
     assert delegate.code_checkpoint_id == "cp-code"
     assert delegate.layer_checkpoint_id == "cp-layer"
 
+
+@pytest.mark.asyncio
+async def test_async_client_passes_resume_cursor_to_delegate_iterators():
+    delegate = CheckpointAwareAsyncTimeSeriesService()
+    async with AsyncBojClient(transport=DummyAsyncTransport(), timeseries_service=delegate) as client:
+        async for _ in client.timeseries.iter_data_code(
+            DataCodeQuery(db="CO", code=["A"]),
+            resume_from="cur-code",
+        ):
+            pass
+        async for _ in client.timeseries.iter_data_layer(
+            DataLayerQuery(db="MD10", frequency="Q", layer1="*"),
+            resume_from="cur-layer",
+        ):
+            pass
+
+    assert delegate.code_resume_from == "cur-code"
+    assert delegate.layer_resume_from == "cur-layer"
+
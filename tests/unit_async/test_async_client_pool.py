@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from boj_api_client.core.async_client_pool import AsyncSharedClientPool
+from boj_api_client.core.async_transport import AsyncTransport
+from tests.shared.transport import Response, build_config
+
+
+class _FakeAsyncHttpClient:
+    def __init__(self, config):
+        self.closed = 0
+        self.calls = 0
+
+    async def get(self, endpoint: str, params: dict[str, str]):
+        self.calls += 1
+        return Response(200, {"STATUS": 200, "MESSAGEID": "M181000I", "RESULTSET": []})
+
+    async def aclose(self):
+        self.closed += 1
+
+
+@pytest.mark.asyncio
+async def test_async_transports_lease_shared_client_lazily():
+    pool = AsyncSharedClientPool(
+        factory=_FakeAsyncHttpClient,  # type: ignore[arg-type]
+        idle_timeout_seconds=0.0,
+    )
+    cfg = build_config(max_attempts=1)
+    first = AsyncTransport(cfg, client_pool=pool)
+    second = AsyncTransport(cfg, client_pool=pool)
+    unused = AsyncTransport(cfg, client_pool=pool)
+
+    assert len(pool) == 0
+    await first.request("/getMetadata", params={"db": "FM08"})
+    await second.request("/getMetadata", params={"db": "FM08"})
+    shared = first._client
+    await unused.close()
+    await first.close()
+
+    assert shared is second._client
+    assert shared.calls == 2
+    assert shared.closed == 0
+    await second.close()
+    assert shared.closed == 1
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_pool_aclose_closes_clients_of_running_loop():
+    pool = AsyncSharedClientPool(factory=_FakeAsyncHttpClient)  # type: ignore[arg-type]
+    client = pool.acquire(build_config(max_attempts=1))
+    await pool.aclose()
+    assert client.closed == 1
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_sequential_transports_reuse_idle_client():
+    clock = [0.0]
+    pool = AsyncSharedClientPool(
+        factory=_FakeAsyncHttpClient,  # type: ignore[arg-type]
+        idle_timeout_seconds=30.0,
+        clock=lambda: clock[0],
+    )
+    cfg = build_config(max_attempts=1)
+
+    first = AsyncTransport(cfg, client_pool=pool)
+    await first.request("/getMetadata", params={"db": "FM08"})
+    await first.close()
+    second = AsyncTransport(cfg, client_pool=pool)
+    await second.request("/getMetadata", params={"db": "FM08"})
+    await second.close()
+
+    shared = first._client
+    assert second._client is shared
+    assert shared.calls == 2
+    assert shared.closed == 0
+
+    clock[0] = 30.0
+    third = AsyncTransport(cfg, client_pool=pool)
+    await third.request("/getMetadata", params={"db": "FM08"})
+    await pool.aclose()
+
+    assert third._client is not shared
+    assert shared.closed == 1
+    assert third._client.closed == 1
+    assert len(pool) == 0
+
+
+def test_async_client_pool_drops_entries_of_closed_loops():
+    pool = AsyncSharedClientPool(factory=_FakeAsyncHttpClient)  # type: ignore[arg-type]
+    cfg = build_config(max_attempts=1)
+
+    async def _lease_and_release():
+        client = pool.acquire(cfg)
+        await pool.release(client)
+        return client
+
+    first = asyncio.run(_lease_and_release())
+    assert len(pool) == 1
+    second = asyncio.run(_lease_and_release())
+
+    assert second is not first
+    assert len(pool) == 1
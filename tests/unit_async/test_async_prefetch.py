@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from boj_api_client.core.async_prefetch import aprefetch_map
+
+
+async def _source(values, *, pulled=None, closed=None, fail_after=None):
+    try:
+        for index, value in enumerate(values):
+            if fail_after is not None and index >= fail_after:
+                raise RuntimeError("boom")
+            if pulled is not None:
+                pulled.append(value)
+            yield value
+    finally:
+        if closed is not None:
+            closed.set()
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_map_without_depth_is_lazy():
+    pulled: list[int] = []
+    iterator = aprefetch_map(_source([1, 2, 3], pulled=pulled), lambda value: value * 10, depth=0)
+
+    assert await anext(iterator) == 10
+    assert pulled == [1]
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_map_parses_off_loop_and_prefetches():
+    pulled: list[int] = []
+    threads: list[int] = []
+
+    def transform(value: int) -> int:
+        threads.append(threading.get_ident())
+        return value * 10
+
+    iterator = aprefetch_map(_source([1, 2, 3], pulled=pulled), transform, depth=1)
+    assert await anext(iterator) == 10
+    await asyncio.sleep(0)
+    assert pulled[:2] == [1, 2]
+    assert [value async for value in iterator] == [20, 30]
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_map_propagates_source_errors():
+    iterator = aprefetch_map(_source([1, 2], fail_after=1), lambda value: value, depth=2)
+
+    assert await anext(iterator) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        await anext(iterator)
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_map_close_cancels_producer_and_closes_source():
+    closed = asyncio.Event()
+    iterator = aprefetch_map(_source(range(100), closed=closed), lambda value: value, depth=1)
+
+    assert await anext(iterator) == 0
+    await iterator.aclose()
+    assert closed.is_set()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import Future
 
 import pytest
 
@@ -85,6 +86,22 @@ async def test_async_resilient_iter_methods():
     assert metadata.entries and metadata.entries[0].series_code == "X"
 
 
+@pytest.mark.asyncio
+async def test_async_resilient_iter_data_code_resumes_with_prefetch():
+    strict = _FakeAsyncStrict()
+    service = AsyncTimeSeriesService(strict, prefetch_depth=2)
+    query = DataCodeQuery(db="CO", code=[f"C{i:03d}" for i in range(251)])
+
+    pages = [page async for page in service.iter_data_code(query)]
+    assert len(pages) == 2
+    assert pages[1].resume_cursor is None
+
+    strict.calls.clear()
+    resumed = [page async for page in service.iter_data_code(query, resume_from=pages[0].resume_cursor)]
+    assert strict.calls == [("code", 1, 1)]
+    assert [series.series_code for series in resumed[0].series] == ["C250"]
+
+
 @pytest.mark.asyncio
 async def test_async_resilient_iter_data_code_can_be_cancelled():
     class _SlowStrict(_FakeAsyncStrict):
@@ -461,3 +478,57 @@ async def test_async_resilient_iter_data_layer_closes_inner_page_iterator(monkey
     assert page_iter.closed is True
 
 
+@pytest.mark.asyncio
+async def test_async_resilient_data_code_fetches_date_windows_concurrently():
+    class _WindowedAsyncStrict(_FakeAsyncStrict):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def execute_data_code(self, query, *, code_subset, start_position):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return make_success_payload(
+                resultset=[make_series_payload(code, points=[(int(query.start_date), 1)]) for code in code_subset]
+            )
+
+    strict = _WindowedAsyncStrict()
+    service = AsyncTimeSeriesService(strict, data_code_date_windows=4, max_concurrent_requests=2)
+
+    response = await service.get_data_code(
+        DataCodeQuery(db="FM01", code=["A"], start_date="2020", end_date="2023")
+    )
+
+    assert strict.max_in_flight == 2
+    assert [p.survey_date for p in response.series[0].points] == ["2020", "2021", "2022", "2023"]
+
+
+@pytest.mark.asyncio
+async def test_async_resilient_offloads_heavy_payload_parsing():
+    class _RecordingExecutor:
+        def __init__(self):
+            self.calls = 0
+
+        def submit(self, fn, /, *args, **kwargs):
+            self.calls += 1
+            future: Future = Future()
+            future.set_result(fn(*args, **kwargs))
+            return future
+
+    executor = _RecordingExecutor()
+    strict = _FakeAsyncStrict()
+    service = AsyncTimeSeriesService(
+        strict,
+        offload_parse_min_values=1,
+        offload_executor=executor,  # type: ignore[arg-type]
+    )
+
+    response = await service.get_data_code(DataCodeQuery(db="CO", code=["A", "B"]))
+    metadata = await service.get_metadata(MetadataQuery(db="FM08"))
+
+    assert [s.series_code for s in response.series] == ["A", "B"]
+    assert len(metadata.entries) == 1
+    assert executor.calls == 2
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from boj_api_client.core.async_transport import AsyncTransport
-from boj_api_client.core.errors import BojServerError, BojTransportError
+from boj_api_client.core.errors import BojServerError, BojTransportError, BojUnavailableError
+from boj_api_client.config import CacheConfig, RetryConfig, ThrottlingConfig, TransportConfig
+from boj_api_client.core.job_context import deadline_scope
 from tests.shared.transport import AsyncSequencedClient, Response, Step, build_config
 
 
@@ -78,3 +85,329 @@ async def test_async_transport_can_initialize_and_close_with_real_httpx_client()
     transport = AsyncTransport(build_config(max_attempts=1))
     await transport.close()
 
+
+@pytest.mark.asyncio
+async def test_async_transport_can_enable_http2_client():
+    pytest.importorskip("h2")
+    cfg = replace(build_config(max_attempts=1), transport=TransportConfig(http2=True))
+    transport = AsyncTransport(cfg)
+    await transport.close()
+
+
+class _BytesResponse:
+    def __init__(self, payload: dict[str, object]):
+        self.status_code = 200
+        self.content = json.dumps(payload).encode("utf-8")
+        self.json_calls = 0
+
+    def json(self) -> object:
+        self.json_calls += 1
+        return json.loads(self.content)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("threshold", "expected_offloaded"), [(None, 0), (10_000, 0), (1, 1)])
+async def test_async_transport_offloads_large_json_decode(threshold, expected_offloaded):
+    response = _BytesResponse({"STATUS": 200, "MESSAGEID": "M181000I", "RESULTSET": []})
+    cfg = replace(
+        build_config(max_attempts=1),
+        transport=TransportConfig(offload_json_min_bytes=threshold),
+    )
+    with _CountingExecutor() as executor:
+        transport = AsyncTransport(
+            cfg,
+            client=AsyncSequencedClient([response]),
+            offload_executor=executor,
+        )
+        payload = await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert payload["STATUS"] == 200
+    assert executor.submitted == expected_offloaded
+    assert response.json_calls == 1 - expected_offloaded
+
+
+@pytest.mark.asyncio
+async def test_async_transport_circuit_breaker_fails_fast_while_open():
+    cfg = replace(
+        build_config(max_attempts=1),
+        transport=TransportConfig(circuit_breaker_failure_threshold=1),
+    )
+    client = AsyncSequencedClient([RuntimeError("network down")])
+    transport = AsyncTransport(cfg, client=client)
+
+    with pytest.raises(BojTransportError):
+        await transport.request("/getMetadata", params={"db": "FM08"})
+    with pytest.raises(BojUnavailableError, match="circuit open"):
+        await transport.request("/getMetadata", params={"db": "FM08"})
+    assert client.calls == 1
+
+
+class _DelayedClient:
+    def __init__(self, steps: list[tuple[float, Step]]):
+        self.steps = list(steps)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get(self, endpoint: str, params: dict[str, str]):
+        self.calls += 1
+        delay, step = self.steps.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    async def aclose(self):
+        return None
+
+
+def _ok(marker: str) -> Response:
+    return Response(200, {"STATUS": 200, "MESSAGEID": "M181000I", "MESSAGE": marker, "RESULTSET": []})
+
+
+def _hedge_config(*, min_wait_interval_seconds: float = 0.0):
+    return replace(
+        build_config(max_attempts=1),
+        throttling=ThrottlingConfig(min_wait_interval_seconds=min_wait_interval_seconds),
+        transport=TransportConfig(hedge_percentile=0.5, hedge_min_samples=1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_transport_hedge_returns_first_finisher_and_cancels_other():
+    client = _DelayedClient([(0.0, _ok("warmup")), (5.0, _ok("slow")), (0.0, _ok("hedge"))])
+    transport = AsyncTransport(_hedge_config(), client=client)
+
+    await transport.request("/getDataCode", params={"db": "CO"})
+    payload = await asyncio.wait_for(
+        transport.request("/getDataCode", params={"db": "CO"}),
+        timeout=2.0,
+    )
+
+    assert payload["MESSAGE"] == "hedge"
+    assert client.calls == 3
+    await asyncio.sleep(0)
+    assert client.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transport_hedge_falls_back_to_primary_error_when_both_fail():
+    client = _DelayedClient(
+        [
+            (0.0, _ok("warmup")),
+            (0.05, RuntimeError("primary down")),
+            (0.0, RuntimeError("hedge down")),
+        ]
+    )
+    transport = AsyncTransport(_hedge_config(), client=client)
+
+    await transport.request("/getDataCode", params={"db": "CO"})
+    with pytest.raises(BojTransportError) as exc_info:
+        await transport.request("/getDataCode", params={"db": "CO"})
+
+    assert str(exc_info.value.__cause__) == "primary down"
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_async_transport_hedge_respects_throttler_budget():
+    async def no_sleep(_: float) -> None:
+        return None
+
+    client = _DelayedClient([(0.0, _ok("warmup")), (0.05, _ok("primary"))])
+    transport = AsyncTransport(
+        _hedge_config(min_wait_interval_seconds=10.0),
+        client=client,
+        sleeper=no_sleep,
+        clock=lambda: 0.0,
+    )
+
+    await transport.request("/getDataCode", params={"db": "CO"})
+    payload = await transport.request("/getDataCode", params={"db": "CO"})
+
+    assert payload["MESSAGE"] == "primary"
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_transport_hedging_skips_endpoints_not_listed():
+    client = _DelayedClient([(0.0, _ok("warmup")), (0.05, _ok("primary"))])
+    transport = AsyncTransport(_hedge_config(), client=client)
+
+    await transport.request("/getMetadata", params={"db": "FM08"})
+    payload = await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert payload["MESSAGE"] == "primary"
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_transport_stops_at_job_deadline_without_retrying():
+    now = {"value": 0.0}
+
+    async def advance(seconds: float) -> None:
+        now["value"] += seconds
+
+    cfg = replace(build_config(), retry=RetryConfig(max_attempts=5, max_backoff_seconds=1.0))
+    client = AsyncSequencedClient([RuntimeError("network down")] * 5)
+    transport = AsyncTransport(cfg, client=client, sleeper=advance, clock=lambda: now["value"])
+
+    with deadline_scope(1.5, clock=lambda: now["value"]):
+        with pytest.raises(BojTransportError) as exc:
+            await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "deadline"
+    assert client.calls < 5
+    assert client.options[0]["timeout"].read == 1.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_status", [429, 503])
+async def test_async_transport_honours_retry_after_on_non_json_throttling(http_status):
+    sleeps: list[float] = []
+
+    async def record(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    cfg = replace(
+        build_config(),
+        retry=RetryConfig(
+            max_attempts=3,
+            max_backoff_seconds=30.0,
+            jitter="decorrelated",
+            retryable_statuses=(429, 500, 503),
+        ),
+    )
+    client = AsyncSequencedClient(
+        [
+            Response(http_status, ValueError("empty body"), headers={"Retry-After": "4"}),
+            Response(200, {"STATUS": 200, "MESSAGEID": "M181000I", "RESULTSET": []}),
+        ]
+    )
+    transport = AsyncTransport(cfg, client=client, sleeper=record, clock=lambda: 0.0)
+
+    payload = await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert payload["STATUS"] == 200
+    assert sleeps == [4.0]
+
+
+@pytest.mark.asyncio
+async def test_async_transport_fails_fast_when_retry_after_exceeds_budget():
+    sleeps: list[float] = []
+
+    async def record(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    cfg = replace(build_config(), retry=RetryConfig(max_attempts=3, total_retry_budget_seconds=120.0))
+    client = AsyncSequencedClient(
+        [
+            Response(503, ValueError("maintenance page"), headers={"Retry-After": "300"}),
+            _ok("after maintenance"),
+        ]
+    )
+    transport = AsyncTransport(cfg, client=client, sleeper=record, clock=lambda: 0.0)
+
+    with pytest.raises(BojUnavailableError) as exc:
+        await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert exc.value.cause == "retry_after"
+    assert exc.value.http_status == 503
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_async_transport_cancels_attempt_at_job_deadline():
+    class _HangingClient:
+        calls = 0
+
+        async def get(self, endpoint, params, **options):
+            self.calls += 1
+            await asyncio.sleep(10.0)
+
+    client = _HangingClient()
+    transport = AsyncTransport(build_config(), client=client)  # type: ignore[arg-type]
+
+    with deadline_scope(0.05):
+        with pytest.raises(BojTransportError) as exc:
+            await asyncio.wait_for(transport.request("/getMetadata", params={"db": "FM08"}), 2.0)
+
+    assert exc.value.cause == "deadline"
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transport_deadline_cancellations_leave_circuit_closed():
+    class _SlowThenHealthyClient:
+        calls = 0
+
+        async def get(self, endpoint, params, **options):
+            self.calls += 1
+            if self.calls <= 3:
+                await asyncio.sleep(10.0)
+            return _ok("healthy")
+
+    cfg = replace(build_config(), transport=TransportConfig(circuit_breaker_failure_threshold=1))
+    client = _SlowThenHealthyClient()
+    transport = AsyncTransport(cfg, client=client)  # type: ignore[arg-type]
+
+    for _ in range(3):
+        with deadline_scope(0.02):
+            with pytest.raises(BojTransportError) as exc:
+                await asyncio.wait_for(transport.request("/getMetadata", params={"db": "FM08"}), 2.0)
+        assert exc.value.cause == "deadline"
+
+    payload = await transport.request("/getMetadata", params={"db": "FM08"})
+    assert payload["MESSAGE"] == "healthy"
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_async_transport_serves_fresh_cached_payload_without_request():
+    cfg = replace(build_config(), cache=CacheConfig(enabled=True))
+    client = AsyncSequencedClient([_ok("first")])
+    transport = AsyncTransport(cfg, client=client)
+
+    first = await transport.request("/getDataCode", params={"db": "CO", "code": "C001"})
+    second = await transport.request("/getDataCode", params={"code": "C001", "db": "CO"})
+
+    assert second is first
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transport_refreshes_stale_payload_in_background_task():
+    now = {"value": 0.0}
+    cfg = replace(
+        build_config(),
+        cache=CacheConfig(enabled=True, ttl_seconds=60.0, stale_while_revalidate_seconds=60.0),
+    )
+    client = _DelayedClient([(0.0, _ok("first")), (0.01, _ok("refreshed"))])
+    transport = AsyncTransport(cfg, client=client, clock=lambda: now["value"])
+
+    await transport.request("/getMetadata", params={"db": "FM08"})
+    now["value"] = 90.0
+    stale = await asyncio.gather(
+        transport.request("/getMetadata", params={"db": "FM08"}),
+        transport.request("/getMetadata", params={"db": "FM08"}),
+    )
+    await asyncio.sleep(0.05)
+    refreshed = await transport.request("/getMetadata", params={"db": "FM08"})
+
+    assert [payload["MESSAGE"] for payload in stale] == ["first", "first"]
+    assert refreshed["MESSAGE"] == "refreshed"
+    assert client.calls == 2
+    await transport.close()